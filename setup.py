@@ -0,0 +1,18 @@
+"""Setuptools shim with an optional mypyc build of the status parser.
+
+Package metadata lives in ``setup.cfg``. Set ``AQUA_BLE_MYPYC=1`` when
+building to compile :mod:`aquarium_device_manager.light_status` with mypyc;
+the pure-Python module is used otherwise.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("AQUA_BLE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/aquarium_device_manager/light_status.py"])
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,15 @@
+"""Shared FastAPI dependencies for the API routers."""
+
+from __future__ import annotations
+
+from fastapi.requests import HTTPConnection
+
+from ..ble_service import BLEService
+
+
+def get_service(connection: HTTPConnection) -> BLEService:
+    """Return the BLEService bound to the application by its lifespan.
+
+    Typed as an ``HTTPConnection`` so HTTP and WebSocket routes share it.
+    """
+    return connection.app.state.service
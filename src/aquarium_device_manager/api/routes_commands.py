@@ -4,24 +4,33 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
+from ..ble_service import BLEService
 from ..command_executor import CommandExecutor
 from ..commands_model import CommandRecord, CommandRequest
+from .deps import get_service
+from .routing import ORJSONRoute
 
-router = APIRouter(prefix="/api", tags=["commands"])
+router = APIRouter(
+    prefix="/api",
+    tags=["commands"],
+    default_response_class=ORJSONResponse,
+    route_class=ORJSONRoute,
+)
 
 
 @router.post("/devices/{address}/commands")
 async def execute_command(
-    request: Request, address: str, command_request: CommandRequest
+    request: Request,
+    address: str,
+    command_request: CommandRequest,
+    service: BLEService = Depends(get_service),
 ) -> Dict[str, Any]:
     """Execute a command on a device and return the result."""
-    service = request.app.state.service
-
     # Check if device exists in cache (basic validation)
-    snapshot = service.get_status_snapshot()
-    if address not in snapshot:
+    if not service.has_device(address):
         raise HTTPException(status_code=404, detail="Device not found")
 
     # Check for device busy (concurrent command prevention)
@@ -41,11 +50,9 @@ async def execute_command(
     try:
         record = await executor.execute_command(address, command_request)
 
-        # Persist command record
+        # Persist command record; the state file write is coalesced
         service.save_command(record)
-
-        # Save state to disk
-        await service._save_state()
+        service.request_save()
 
         return record.to_dict()
 
@@ -64,20 +71,19 @@ async def execute_command(
         )
         record.mark_failed(f"Unexpected API error: {exc}")
         service.save_command(record)
-        await service._save_state()
+        service.request_save()
         return record.to_dict()
 
 
 @router.get("/devices/{address}/commands")
 async def list_commands(
-    request: Request, address: str, limit: int = 20
+    address: str,
+    limit: int = 20,
+    service: BLEService = Depends(get_service),
 ) -> List[Dict[str, Any]]:
     """List recent commands for a device."""
-    service = request.app.state.service
-
     # Check if device exists
-    snapshot = service.get_status_snapshot()
-    if address not in snapshot:
+    if not service.has_device(address):
         raise HTTPException(status_code=404, detail="Device not found")
 
     commands = service.get_commands(address, limit)
@@ -86,14 +92,13 @@ async def list_commands(
 
 @router.get("/devices/{address}/commands/{command_id}")
 async def get_command(
-    request: Request, address: str, command_id: str
+    address: str,
+    command_id: str,
+    service: BLEService = Depends(get_service),
 ) -> Dict[str, Any]:
     """Get a specific command by ID."""
-    service = request.app.state.service
-
     # Check if device exists
-    snapshot = service.get_status_snapshot()
-    if address not in snapshot:
+    if not service.has_device(address):
         raise HTTPException(status_code=404, detail="Device not found")
 
     command = service.get_command(address, command_id)
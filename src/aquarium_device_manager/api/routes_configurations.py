@@ -10,13 +10,21 @@ import logging
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
-from ..ble_service import DEVICE_CONFIG_PATH, DOSER_CONFIG_PATH
+from ..ble_service import DEVICE_CONFIG_PATH, DOSER_CONFIG_PATH, BLEService
 from ..doser_storage import DeviceMetadata, DoserDevice, DoserStorage
 from ..light_storage import LightDevice, LightMetadata, LightStorage
+from .deps import get_service
+from .routing import ORJSONRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/configurations", tags=["configurations"])
+router = APIRouter(
+    prefix="/api/configurations",
+    tags=["configurations"],
+    default_response_class=ORJSONResponse,
+    route_class=ORJSONRoute,
+)
 
 
 # Dependency injection for storage instances
@@ -481,7 +489,9 @@ async def get_system_timezone() -> dict:
 
 
 @router.get("/display/timezone")
-async def get_display_timezone(request) -> dict:
+async def get_display_timezone(
+    service: BLEService = Depends(get_service),
+) -> dict:
     """Get the current display timezone setting.
 
     Returns the configured display timezone used for formatting times
@@ -491,7 +501,6 @@ async def get_display_timezone(request) -> dict:
         dict: Contains display timezone information
     """
     try:
-        service = request.app.state.service
         timezone = service.get_display_timezone()
 
         return {
@@ -506,7 +515,9 @@ async def get_display_timezone(request) -> dict:
 
 
 @router.put("/display/timezone")
-async def set_display_timezone(timezone_data: dict, request) -> dict:
+async def set_display_timezone(
+    timezone_data: dict, service: BLEService = Depends(get_service)
+) -> dict:
     """Set the display timezone for UI time formatting.
 
     Args:
@@ -523,11 +534,10 @@ async def set_display_timezone(timezone_data: dict, request) -> dict:
                 status_code=400, detail="Missing required 'timezone' field"
             )
 
-        service = request.app.state.service
         service.set_display_timezone(timezone)
 
         # Save the updated state
-        await service._save_state()
+        service.request_save()
 
         return {
             "display_timezone": timezone,
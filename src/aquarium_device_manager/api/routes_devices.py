@@ -2,81 +2,158 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket
+from fastapi.responses import ORJSONResponse, Response
 
+from ..ble_service import BLEService
 from ..device import get_device_from_address
 from ..serializers import cached_status_to_dict
+from ..spa import etag_matches
+from .deps import get_service
+from .routing import ORJSONRoute
 
-router = APIRouter(prefix="/api", tags=["devices"])
+router = APIRouter(
+    prefix="/api",
+    tags=["devices"],
+    default_response_class=ORJSONResponse,
+    route_class=ORJSONRoute,
+)
 
 
 @router.get("/status")
-async def get_status(request: Request) -> Dict[str, Any]:
-    """Return cached status for all devices."""
-    service = request.app.state.service
-    snapshot = service.get_status_snapshot()
-    results = {}
-    for address, cached in snapshot.items():
-        results[address] = cached_status_to_dict(service, cached)
-    return results
+async def get_status(
+    request: Request, service: BLEService = Depends(get_service)
+) -> Response:
+    """Return cached status for all devices.
+
+    The body is served pre-serialised with an ETag; a matching
+    ``If-None-Match`` gets a bodiless 304.
+    """
+    body, etag = service.get_status_payload()
+    headers = {"etag": etag}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=body, media_type="application/json", headers=headers
+    )
+
+
+async def _push_status(
+    websocket: WebSocket,
+    service: BLEService,
+    queue: asyncio.Queue[Dict[str, Any]],
+) -> None:
+    body, _ = service.get_status_payload()
+    await websocket.send_bytes(b'{"type":"snapshot","statuses":' + body + b"}")
+    while True:
+        event = await queue.get()
+        await websocket.send_bytes(
+            orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS)
+        )
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    # Incoming frames are ignored; reading them is how a client
+    # disconnect is noticed while the sender waits for the next delta.
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        continue
+
+
+@router.websocket("/ws/status")
+async def status_updates(
+    websocket: WebSocket, service: BLEService = Depends(get_service)
+) -> None:
+    """Push a status snapshot, then deltas as devices change.
+
+    Every frame is ``{"type": ..., "statuses": ...}``. A ``snapshot``
+    replaces the client's state; a ``delta`` updates the listed addresses
+    and drops those mapped to null.
+    """
+    await websocket.accept()
+    queue = service.subscribe_status()
+    sender = asyncio.create_task(_push_status(websocket, service, queue))
+    receiver = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        await asyncio.wait(
+            {sender, receiver}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if sender.done() and sender.exception() is not None:
+            # Without a sender the client would wait forever for updates
+            with contextlib.suppress(Exception):
+                await websocket.close(code=1011)
+    finally:
+        service.unsubscribe_status(queue)
+        for task in (sender, receiver):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
 
 
 @router.post("/debug/live-status")
-async def debug_live_status(request: Request) -> Dict[str, Any]:
+async def debug_live_status(
+    service: BLEService = Depends(get_service),
+) -> Response:
     """Return live status snapshots without persisting."""
-    service = request.app.state.service
     statuses, errors = await service.get_live_statuses()
-    return {
-        "statuses": [
-            cached_status_to_dict(service, status) for status in statuses
-        ],
-        "errors": errors,
-    }
+    body = (
+        b'{"statuses":'
+        + service.encode_statuses(statuses)
+        + b',"errors":'
+        + orjson.dumps(errors)
+        + b"}"
+    )
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/scan")
+@router.get("/scan", response_model=None)
 async def scan_devices(
-    request: Request, timeout: float = 5.0
+    timeout: float = 5.0, service: BLEService = Depends(get_service)
 ) -> list[Dict[str, Any]]:
     """Scan for nearby supported devices."""
-    service = request.app.state.service
     return await service.scan_devices(timeout=timeout)
 
 
-@router.post("/devices/{address}/status")
-async def refresh_status(request: Request, address: str) -> Dict[str, Any]:
+@router.post("/devices/{address}/status", response_model=None)
+async def refresh_status(
+    address: str, service: BLEService = Depends(get_service)
+) -> Dict[str, Any]:
     """Refresh status for a specific device by address."""
-    service = request.app.state.service
     status = await service.request_status(address)
     return cached_status_to_dict(service, status)
 
 
-@router.post("/devices/{address}/connect")
-async def reconnect_device(request: Request, address: str) -> Dict[str, Any]:
+@router.post("/devices/{address}/connect", response_model=None)
+async def reconnect_device(
+    address: str, service: BLEService = Depends(get_service)
+) -> Dict[str, Any]:
     """(Re)connect to a device and return its current status."""
-    service = request.app.state.service
-    cached = service.get_status_snapshot().get(address)
-    if cached:
-        status = await service.connect_device(address, cached.device_type)
-        return cached_status_to_dict(service, status)
-
-    try:
-        device = await get_device_from_address(address)
-    except Exception as exc:  # pragma: no cover - passthrough
-        raise HTTPException(status_code=404, detail="Device not found") from exc
-
-    kind = getattr(device, "device_kind", None)
-    if not kind:
-        raise HTTPException(status_code=400, detail="Unsupported device type")
+    kind = service.known_kind(address)
+    if kind is None:
+        try:
+            device = await get_device_from_address(address)
+        except Exception as exc:  # pragma: no cover - passthrough
+            raise HTTPException(
+                status_code=404, detail="Device not found"
+            ) from exc
+
+        kind = getattr(device, "device_kind", None)
+        if not kind:
+            raise HTTPException(
+                status_code=400, detail="Unsupported device type"
+            )
     status = await service.connect_device(address, kind)
     return cached_status_to_dict(service, status)
 
 
-@router.post("/devices/{address}/disconnect")
-async def disconnect_device(request: Request, address: str) -> Dict[str, str]:
+@router.post("/devices/{address}/disconnect", response_model=Dict[str, str])
+async def disconnect_device(
+    address: str, service: BLEService = Depends(get_service)
+) -> Dict[str, str]:
     """Disconnect a device currently registered at address."""
-    service = request.app.state.service
     await service.disconnect_device(address)
     return {"detail": "disconnected"}
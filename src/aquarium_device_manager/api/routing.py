@@ -0,0 +1,38 @@
+"""Route and request classes shared by the API routers."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """Request that decodes JSON bodies with orjson."""
+
+    async def json(self) -> Any:
+        """Return the decoded body, parsing it at most once."""
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """API route whose handlers parse request bodies with orjson.
+
+    ``orjson.JSONDecodeError`` subclasses :class:`json.JSONDecodeError`, so
+    malformed bodies still surface as FastAPI validation errors.
+    """
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the default handler so it receives an ORJSONRequest."""
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 from copy import deepcopy
 
+from .commands.encoder import DAY_ABBREVIATIONS
 from .doser_storage import (
     ConfigurationRevision,
     DeviceMetadata,
@@ -95,22 +96,17 @@ def atomic_update_doser_schedule(
             for weekday in weekdays:
                 if hasattr(weekday, "name"):
                     # Map PumpWeekday enum names to 3-letter day names
-                    day_mapping = {
-                        "monday": "Mon",
-                        "tuesday": "Tue",
-                        "wednesday": "Wed",
-                        "thursday": "Thu",
-                        "friday": "Fri",
-                        "saturday": "Sat",
-                        "sunday": "Sun",
-                    }
                     weekday_names.append(
-                        day_mapping.get(weekday.name.lower(), weekday.name[:3])
+                        DAY_ABBREVIATIONS.get(
+                            weekday.name.lower(), weekday.name[:3]
+                        )
                     )
                 else:
                     # Already a string
                     weekday_names.append(str(weekday))
-            target_head.recurrence.days = weekday_names
+            target_head.recurrence = target_head.recurrence.model_copy(
+                update={"days": weekday_names}
+            )
 
         # Update timestamps atomically
         timestamp = _now_iso()
@@ -8,15 +8,22 @@ from aquarium_device_manager.service while the implementation lives here.
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import logging
+import os
+import tempfile
 import time
-from contextlib import asynccontextmanager
+from collections import defaultdict
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, is_dataclass
 from datetime import time as _time
+from functools import lru_cache
+from pathlib import Path
 from typing import (
     Any,
     AsyncIterator,
+    Callable,
+    Coroutine,
     Dict,
     Iterable,
     Optional,
@@ -26,6 +33,7 @@ from typing import (
     cast,
 )
 
+import orjson
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
 from bleak_retry_connector import BleakConnectionError, BleakNotFoundError
@@ -44,11 +52,16 @@ from .config_migration import (
 from .device import (
     Doser,
     LightDevice,
+    find_model_class,
     get_device_from_address,
     get_model_class_from_name,
 )
 from .device.base_device import BaseDevice
-from .exception import DeviceNotFound
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None  # type: ignore[assignment]
 
 # Re-implement lightweight internal API functions (previously in core_api)
 SupportedDeviceInfo = Tuple[BLEDevice, Type[BaseDevice]]
@@ -60,34 +73,115 @@ def filter_supported_devices(
     """Return BLE devices that map to a known Chihiros model.
 
     This intentionally ignores devices that do not map to a known model
-    (for example, TVs or other unrelated BLE peripherals). Calling
-    `get_model_class_from_name` may raise DeviceNotFound for unknown
-    device names; swallow that and continue so discovery is robust.
+    (for example, TVs or other unrelated BLE peripherals). Names are
+    matched with a plain dict lookup, so the many unrelated advertisements
+    in a scan cost no exception handling.
     """
     supported: list[SupportedDeviceInfo] = []
     for device in devices:
         name = device.name
         if not name:
             continue
-        try:
-            model_class = get_model_class_from_name(name)
-        except DeviceNotFound:
-            # Unknown device name — skip it
-            continue
-        # type: ignore[attr-defined]
-        codes = getattr(model_class, "model_codes", [])
-        if not codes:
-            continue
-        supported.append((device, model_class))
+        model_class = find_model_class(name)
+        if model_class is not None:
+            supported.append((device, model_class))
+    return supported
+
+
+# Scans finished within this window are shared instead of re-scanning
+SCAN_CACHE_TTL_SECONDS = 3.0
+# Devices seen by the last scan are connected without a fresh address lookup
+SCAN_HANDLE_TTL_SECONDS = 60.0
+# Upper bound for the reconnect scan; matches bleak's find-by-address default
+RECONNECT_SCAN_SECONDS = 10.0
+_scan_cache: tuple[float, float, list[SupportedDeviceInfo]] | None = None
+_scan_inflight: tuple[float, asyncio.Task[list[SupportedDeviceInfo]]] | None = (
+    None
+)
+
+
+async def _run_scan(timeout: float) -> list[SupportedDeviceInfo]:
+    global _scan_cache
+
+    discovered = await BleakScanner.discover(timeout=timeout)
+    supported = filter_supported_devices(discovered)
+    _scan_cache = (time.monotonic(), timeout, supported)
     return supported
 
 
+def _recently_scanned(address: str) -> BLEDevice | None:
+    """Return the BLEDevice for ``address`` from a recent scan, if any."""
+    if _scan_cache is None:
+        return None
+    finished_at, _, supported = _scan_cache
+    if time.monotonic() - finished_at >= SCAN_HANDLE_TTL_SECONDS:
+        return None
+    for device, _model_class in supported:
+        if device.address == address:
+            return device
+    return None
+
+
 async def discover_supported_devices(
     timeout: float = 5.0,
 ) -> list[SupportedDeviceInfo]:
-    """Discover BLE devices and return the supported Chihiros models."""
-    discovered = await BleakScanner.discover(timeout=timeout)
-    return filter_supported_devices(discovered)
+    """Discover BLE devices and return the supported Chihiros models.
+
+    Concurrent callers share one in-flight scan, and a scan at least
+    ``timeout`` long that finished within :data:`SCAN_CACHE_TTL_SECONDS` is
+    reused.
+    """
+    global _scan_inflight
+
+    while True:
+        if _scan_cache is not None:
+            finished_at, scanned_for, supported = _scan_cache
+            if (
+                scanned_for >= timeout
+                and time.monotonic() - finished_at < SCAN_CACHE_TTL_SECONDS
+            ):
+                return list(supported)
+        if _scan_inflight is None or _scan_inflight[1].done():
+            break
+        scanning_for, task = _scan_inflight
+        if scanning_for >= timeout:
+            # Shield so one cancelled caller does not abort the shared scan
+            return list(await asyncio.shield(task))
+        # A shorter scan is running; wait for the radio, then rescan
+        with suppress(Exception):
+            await asyncio.shield(task)
+
+    task = asyncio.create_task(_run_scan(timeout))
+    _scan_inflight = (timeout, task)
+    return list(await asyncio.shield(task))
+
+
+async def scan_until_found(
+    addresses: Iterable[str], timeout: float = RECONNECT_SCAN_SECONDS
+) -> Dict[str, BLEDevice]:
+    """Scan until every address in ``addresses`` is seen or ``timeout`` ends.
+
+    Unlike :func:`discover_supported_devices` the scan stops as soon as the
+    last wanted device advertises. Returns the named devices seen, keyed by
+    the requested address.
+    """
+    wanted = {address.upper(): address for address in addresses}
+    found: Dict[str, BLEDevice] = {}
+    if not wanted:
+        return found
+    all_seen = asyncio.Event()
+
+    def _detected(device: BLEDevice, _advertisement: Any) -> None:
+        address = wanted.get(device.address.upper())
+        if address is not None and device.name:
+            found[address] = device
+            if len(found) == len(wanted):
+                all_seen.set()
+
+    async with BleakScanner(detection_callback=_detected):
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(all_seen.wait(), timeout)
+    return found
 
 
 @asynccontextmanager
@@ -114,16 +208,38 @@ AUTO_RECONNECT_ENV = "AQUA_BLE_AUTO_RECONNECT"
 STATUS_CAPTURE_WAIT_ENV = "AQUA_BLE_STATUS_WAIT"
 AUTO_DISCOVER_ENV = "AQUA_BLE_AUTO_DISCOVER"
 AUTO_SAVE_CONFIG_ENV = "AQUA_BLE_AUTO_SAVE"
+ADAPTER_LOCK_ENV = "AQUA_BLE_ADAPTER_LOCK"
+STATE_FSYNC_ENV = "AQUA_BLE_STATE_FSYNC"
 
 # Get status capture wait with fallback
 STATUS_CAPTURE_WAIT_SECONDS = get_env_float(STATUS_CAPTURE_WAIT_ENV, 1.5)
 
+# Bursts of command records are folded into one state write
+SAVE_COALESCE_SECONDS = 0.1
+
+# Pending status deltas per push subscriber before it is resynced
+STATUS_QUEUE_SIZE = 32
+
+# Host-wide lock file shared by every service process using the adapter
+ADAPTER_LOCK_PATH = Path(tempfile.gettempdir()) / "aqua-ble-adapter.lock"
+ADAPTER_LOCK_TIMEOUT_SECONDS = 10.0
+ADAPTER_LOCK_POLL_SECONDS = 0.25
+
 
 def _get_env_bool(name: str, default: bool) -> bool:
     """Wrap for backward compatibility - delegate to config_migration."""
     return get_env_bool(name, default)
 
 
+# Service toggles are read once at import, like the timing constants above
+AUTO_RECONNECT = _get_env_bool(AUTO_RECONNECT_ENV, True)
+AUTO_DISCOVER_ON_START = _get_env_bool(AUTO_DISCOVER_ENV, False)
+AUTO_SAVE_CONFIG = _get_env_bool(AUTO_SAVE_CONFIG_ENV, True)
+USE_ADAPTER_LOCK = _get_env_bool(ADAPTER_LOCK_ENV, False)
+# state.json is a rebuildable cache, so flushing it to disk is opt-in
+STATE_FSYNC = _get_env_bool(STATE_FSYNC_ENV, False)
+
+
 # Module logger
 logger = logging.getLogger("aquarium_device_manager.service")
 _default_level = (
@@ -153,12 +269,106 @@ class CachedStatus:
     channels: list[Dict[str, Any]] | None = None
 
 
+@lru_cache(maxsize=32)
+def _class_serializer(
+    cls: type,
+) -> tuple[str | None, Callable[[Any], Dict[str, Any]] | None]:
+    """Return the status serializer name and function declared by ``cls``.
+
+    Resolved once per device class; instances that only set the name
+    themselves are looked up by the caller.
+    """
+    name = getattr(cls, "status_serializer", None)
+    if name is None:
+        return None, None
+    return name, getattr(_serializers, name, None)
+
+
+@lru_cache(maxsize=32)
+def _class_scan_fields(cls: type) -> tuple[str | None, str]:
+    """Return a model class's product name and device kind for scan results."""
+    kind = getattr(cls, "device_kind", None)
+    device_type = kind.lower() if isinstance(kind, str) and kind else "unknown"
+    return getattr(cls, "model_name", None), device_type
+
+
+@lru_cache(maxsize=32)
+def _class_channels(cls: type) -> tuple[Dict[str, Any], ...]:
+    """Return the channel list for a light class, sorted by colour index.
+
+    Colour maps are fixed per model class, so this is built once per class.
+    """
+    color_map = getattr(cls, "_colors", None)
+    if not isinstance(color_map, dict):
+        return ()
+    return tuple(
+        {"name": name, "index": idx}
+        for name, idx in sorted(
+            ((str(key), int(value)) for key, value in color_map.items()),
+            key=lambda item: item[1],
+        )
+    )
+
+
+def _start_worker(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+    """Create a background worker task, starting it eagerly if supported.
+
+    On Python 3.12+ the worker runs up to its first real suspension before
+    this returns instead of waiting for the next loop iteration.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return asyncio.create_task(coro)
+    return factory(asyncio.get_running_loop(), coro)
+
+
+_STATE_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _write_state_file(body: bytes) -> int:
+    """Write the encoded state file and return its mtime (runs off the loop).
+
+    The body goes to a uniquely named sibling temp file that is renamed over
+    the state file, so readers and crashes only ever see a complete document.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=STATE_PATH.parent, prefix=".state-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(body)
+            if STATE_FSYNC:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp_name, STATE_PATH)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+    return STATE_PATH.stat().st_mtime_ns
+
+
+def _read_state_file(known_mtime_ns: int | None) -> tuple[int, bytes | None]:
+    """Return the state file's mtime and bytes, or None bytes if unchanged."""
+    mtime_ns = STATE_PATH.stat().st_mtime_ns
+    if mtime_ns == known_mtime_ns:
+        return mtime_ns, None
+    return mtime_ns, STATE_PATH.read_bytes()
+
+
+def _index_commands(commands: Sequence[dict]) -> Dict[str, int]:
+    """Map each command id in ``commands`` to its list position."""
+    return {cmd.get("id"): i for i, cmd in enumerate(commands)}
+
+
 class BLEService:
     """Manages BLE devices, status cache, and persistence."""
 
     def __init__(self) -> None:
         """Initialize the BLEService, device maps and runtime flags."""
-        self._lock = asyncio.Lock()
+        # One lock per device kind, so a slow doser operation does not hold
+        # up lights; registry dict updates never await and need no lock.
+        self._kind_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._devices: Dict[str, Dict[str, BaseDevice]] = (
             {}
         )  # kind -> address -> device
@@ -167,11 +377,28 @@ class BLEService:
         )  # kind -> primary address (for backward compatibility)
         self._cache: Dict[str, CachedStatus] = {}
         self._commands: Dict[str, list] = {}  # Per-device command history
-        self._auto_reconnect = _get_env_bool(AUTO_RECONNECT_ENV, True)
-        self._auto_discover_on_start = _get_env_bool(AUTO_DISCOVER_ENV, False)
-        self._auto_save_config = _get_env_bool(AUTO_SAVE_CONFIG_ENV, True)
+        # address -> command id -> position in that device's history list
+        self._command_index: Dict[str, Dict[str, int]] = {}
+        self._auto_reconnect = AUTO_RECONNECT
+        self._auto_discover_on_start = AUTO_DISCOVER_ON_START
+        self._auto_save_config = AUTO_SAVE_CONFIG
+        self._use_adapter_lock = USE_ADAPTER_LOCK
         self._reconnect_task: asyncio.Task | None = None
         self._discover_task: asyncio.Task | None = None
+        self._save_task: asyncio.Task | None = None
+        # Every live background task, so stop() can cancel them together
+        self._tasks: set[asyncio.Task] = set()
+        self._status_inflight: Dict[str, asyncio.Task[CachedStatus]] = {}
+        self._status_payload: tuple[tuple, bytes, str] | None = None
+        self._status_parts: Dict[str, tuple[CachedStatus, bool, bytes]] = {}
+        self._state_fragments: Dict[str, tuple[CachedStatus, bytes]] = {}
+        # mtime of the state file as last read or written by this service
+        self._state_mtime_ns: int | None = None
+        self._status_subscribers: set[asyncio.Queue] = set()
+        self._published_status: Dict[str, tuple[CachedStatus, bool]] = {}
+        self._save_dirty = False
+        # Serialises state writes; held until the writer thread finishes
+        self._save_lock = asyncio.Lock()
 
         # Ensure config directory exists
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -344,13 +571,18 @@ class BLEService:
         logger.info("Display timezone updated to: %s", timezone)
 
     async def connect_device(
-        self, address: str, device_type: Optional[str] = None
+        self,
+        address: str,
+        device_type: Optional[str] = None,
+        *,
+        ble_device: BLEDevice | None = None,
     ) -> CachedStatus:
         """Connect to a device by address and return its cached status.
 
-        Also loads any saved configuration for the device.
+        Also loads any saved configuration for the device. Pass the
+        ``ble_device`` from a recent scan to skip the lookup by address.
         """
-        device = await self._ensure_device(address, device_type)
+        device = await self._ensure_device(address, device_type, ble_device)
         device_kind = self._get_device_kind(device)
         if device_kind is None:
             raise HTTPException(
@@ -362,40 +594,85 @@ class BLEService:
 
         return await self._refresh_device_status(device_kind, persist=True)
 
+    @asynccontextmanager
+    async def _adapter_lock(self) -> AsyncIterator[None]:
+        """Serialise BLE lookups with other processes on this host.
+
+        Opt-in through ``AQUA_BLE_ADAPTER_LOCK``: concurrent scans on one
+        adapter fail with ``org.bluez.Error.InProgress``. If the lock stays
+        busy past :data:`ADAPTER_LOCK_TIMEOUT_SECONDS` the body runs anyway
+        so a stuck peer cannot stall this service.
+        """
+        if not self._use_adapter_lock or fcntl is None:
+            yield
+            return
+        fd = os.open(ADAPTER_LOCK_PATH, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            deadline = time.monotonic() + ADAPTER_LOCK_TIMEOUT_SECONDS
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        logger.warning(
+                            "Adapter lock %s still busy; continuing without it",
+                            ADAPTER_LOCK_PATH,
+                        )
+                        break
+                    await asyncio.sleep(ADAPTER_LOCK_POLL_SECONDS)
+            yield
+        finally:
+            # Closing the descriptor releases the flock
+            os.close(fd)
+
     async def _ensure_device(
-        self, address: str, device_type: Optional[str] = None
+        self,
+        address: str,
+        device_type: Optional[str] = None,
+        ble_device: BLEDevice | None = None,
     ) -> BaseDevice:
         expected_kind = device_type.lower() if device_type else None
-        async with self._lock:
-            if expected_kind:
-                device_dict = self._devices.get(expected_kind, {})
-                current_device = device_dict.get(address)
-                if current_device:
-                    return current_device
-                # If we have a device of this kind but different address, keep it
-                # Only disconnect if we're replacing the same address
-            try:
-                device = await get_device_from_address(address)
-            except Exception as exc:
-                raise HTTPException(
-                    status_code=404,
-                    detail=self._format_message(expected_kind, "not_found"),
-                ) from exc
-            kind = self._get_device_kind(device)
-            if kind is None:
-                raise HTTPException(
-                    status_code=400, detail="Unsupported device type"
-                )
-            if expected_kind and kind != expected_kind:
-                raise HTTPException(
-                    status_code=400,
-                    detail=self._format_message(expected_kind, "wrong_type"),
-                )
+        if expected_kind:
+            current_device = self._devices.get(expected_kind, {}).get(address)
+            if current_device:
+                return current_device
+            # If we have a device of this kind but different address, keep it
+            # Only disconnect if we're replacing the same address
+        # The BLE lookup can take seconds; run it without holding the
+        # service lock so other devices are not blocked behind it, and skip
+        # it entirely when a recent scan already saw the device.
+        if ble_device is None:
+            ble_device = _recently_scanned(address)
+        try:
+            if ble_device is not None and ble_device.name:
+                model_class = get_model_class_from_name(ble_device.name)
+                device = model_class(ble_device)
+            else:
+                async with self._adapter_lock():
+                    device = await get_device_from_address(address)
+        except Exception as exc:
+            raise HTTPException(
+                status_code=404,
+                detail=self._format_message(expected_kind, "not_found"),
+            ) from exc
+        kind = self._get_device_kind(device)
+        if kind is None:
+            raise HTTPException(
+                status_code=400, detail="Unsupported device type"
+            )
+        if expected_kind and kind != expected_kind:
+            raise HTTPException(
+                status_code=400,
+                detail=self._format_message(expected_kind, "wrong_type"),
+            )
 
-            # Store the device
-            if kind not in self._devices:
-                self._devices[kind] = {}
-            self._devices[kind][address] = device
+        async with self._kind_locks[kind]:
+            # A concurrent caller may have registered this address during the
+            # lookup; keep its instance so there is only one per device.
+            device = self._devices.setdefault(kind, {}).setdefault(
+                address, device
+            )
 
             # Update primary address for backward compatibility
             self._addresses[kind] = address
@@ -408,7 +685,7 @@ class BLEService:
         normalized = device_type.lower()
         device: BaseDevice | None = None
         address: Optional[str] = None
-        async with self._lock:
+        async with self._kind_locks[normalized]:
             address = self._addresses.get(normalized)
             if address:
                 device_dict = self._devices.get(normalized, {})
@@ -418,11 +695,12 @@ class BLEService:
                     status_code=400,
                     detail=self._format_message(normalized, "not_connected"),
                 )
-            serializer_name = getattr(
-                device.__class__, "status_serializer", None
-            )
-            if serializer_name is None:
-                serializer_name = getattr(device, "status_serializer", None)
+
+        serializer_name, serializer = _class_serializer(type(device))
+        if serializer_name is None:
+            serializer_name = getattr(device, "status_serializer", None)
+            if serializer_name is not None:
+                serializer = getattr(_serializers, serializer_name, None)
 
         if serializer_name is None:
             raise HTTPException(
@@ -430,7 +708,6 @@ class BLEService:
                 detail=f"No serializer defined for {normalized}",
             )
 
-        serializer = getattr(_serializers, serializer_name, None)
         if serializer is None:  # pragma: no cover - defensive guard
             raise HTTPException(
                 status_code=500,
@@ -438,7 +715,7 @@ class BLEService:
             )
         try:
             logger.debug("Requesting %s status from %s", normalized, address)
-            await device.request_status()
+            await device.capture_status(STATUS_CAPTURE_WAIT_SECONDS)
         except (BleakNotFoundError, BleakConnectionError) as exc:
             logger.warning(
                 "%s not reachable %s: %s",
@@ -450,7 +727,6 @@ class BLEService:
                 status_code=404,
                 detail=self._format_message(normalized, "not_reachable"),
             ) from exc
-        await asyncio.sleep(STATUS_CAPTURE_WAIT_SECONDS)
         status_obj = getattr(device, "last_status", None)
         if not status_obj:
             raise HTTPException(
@@ -461,7 +737,9 @@ class BLEService:
             parsed = serializer(status_obj)
         except TypeError:
             if not is_dataclass(status_obj):
-                parsed = dict(vars(status_obj))
+                # Status objects are replaced per frame, never mutated, so
+                # the instance dict can be shared instead of copied.
+                parsed = vars(status_obj)
             else:
                 raise
         raw_payload = getattr(status_obj, "raw_payload", None)
@@ -482,8 +760,8 @@ class BLEService:
         )
         if persist:
             self._cache[address] = cached
-        if persist:
-            await self._save_state()
+            self._publish_status_changes()
+            self.request_save()
         return cached
 
     def _build_channels(
@@ -491,16 +769,8 @@ class BLEService:
     ) -> list[Dict[str, Any]] | None:
         if device_type != "light":
             return None
-        color_map = getattr(device, "colors", {})
-        if not isinstance(color_map, dict) or not color_map:
-            return None
-        return [
-            {"name": name, "index": idx}
-            for name, idx in sorted(
-                ((str(key), int(value)) for key, value in color_map.items()),
-                key=lambda item: item[1],
-            )
-        ]
+        channels = _class_channels(type(device))
+        return list(channels) if channels else None
 
     async def _load_device_configuration(
         self, address: str, device_kind: str
@@ -524,8 +794,9 @@ class BLEService:
                 )
             else:
                 logger.debug(
-                    f"No saved configuration found for doser {address} "
-                    "(will be created when user configures device)"
+                    "No saved configuration found for doser %s "
+                    "(will be created when user configures device)",
+                    address,
                 )
 
         elif device_kind == "light":
@@ -537,8 +808,9 @@ class BLEService:
                 )
             else:
                 logger.debug(
-                    f"No saved profile found for light {address} "
-                    "(will be created when user configures device)"
+                    "No saved profile found for light %s "
+                    "(will be created when user configures device)",
+                    address,
                 )
 
     def _infer_device_type(self, device: BaseDevice) -> Optional[str]:
@@ -559,9 +831,7 @@ class BLEService:
         if not self._cache and self._auto_discover_on_start:
             try:
                 logger.info("Auto-discover enabled; scheduling background scan")
-                self._discover_task = asyncio.create_task(
-                    self._auto_discover_worker()
-                )
+                self._ensure_task("_discover_task", self._auto_discover_worker)
                 discover_scheduled = True
                 logger.info("Auto-discover worker scheduled in background")
             except Exception as exc:  # pragma: no cover - runtime diagnostics
@@ -575,11 +845,28 @@ class BLEService:
                 logger.info(
                     "Auto-reconnect enabled; attempting reconnect to cached devices"
                 )
-                self._reconnect_task = asyncio.create_task(
-                    self._reconnect_and_refresh()
+                self._ensure_task(
+                    "_reconnect_task", self._reconnect_and_refresh
                 )
                 logger.info("Reconnect worker scheduled in background")
 
+    def _ensure_task(
+        self, attr: str, coro_factory: Callable[[], Coroutine[Any, Any, None]]
+    ) -> asyncio.Task:
+        """Return the task stored in ``attr``, starting it if none is running.
+
+        The check and the assignment happen without an await in between, so
+        two callers can never start the same worker twice.
+        """
+        task = getattr(self, attr)
+        if task is not None and not task.done():
+            return task
+        task = _start_worker(coro_factory())
+        setattr(self, attr, task)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
     async def _auto_discover_worker(self) -> None:
         """Background worker that auto-discovers and connects devices."""
         try:
@@ -600,16 +887,9 @@ class BLEService:
                     logger.info(
                         "Auto-discover found no devices; scheduling reconnect worker"
                     )
-                    if (
-                        self._reconnect_task is None
-                        or self._reconnect_task.done()
-                    ):
-                        self._reconnect_task = asyncio.create_task(
-                            self._reconnect_and_refresh()
-                        )
-                        logger.info(
-                            "Reconnect worker scheduled by auto-discover worker"
-                        )
+                    self._ensure_task(
+                        "_reconnect_task", self._reconnect_and_refresh
+                    )
         except asyncio.CancelledError:
             logger.info("Auto-discover worker cancelled")
             raise
@@ -617,26 +897,9 @@ class BLEService:
             logger.exception("Auto-discover worker failed unexpectedly")
 
     async def _reconnect_and_refresh(self) -> None:
-        """Reconnect to cached devices and refresh their live status."""
+        """Reconnect to cached devices; each connect refreshes its status."""
         try:
             await self._attempt_reconnect()
-            for address, status in list(self._cache.items()):
-                try:
-                    logger.debug(
-                        "Refreshing live status for %s (type=%s)",
-                        address,
-                        status.device_type,
-                    )
-                    await self._ensure_device(address, status.device_type)
-                    live = await self._refresh_device_status(status.device_type)
-                    self._cache[address] = live
-                    logger.info("Refreshed %s %s", status.device_type, address)
-                except (
-                    Exception
-                ) as exc:  # pragma: no cover - runtime diagnostics
-                    logger.warning("Failed to refresh %s: %s", address, exc)
-                    continue
-            await self._save_state()
         except asyncio.CancelledError:
             logger.info("Reconnect worker cancelled")
             raise
@@ -645,44 +908,68 @@ class BLEService:
 
     async def stop(self) -> None:
         """Stop background workers and persist current service state."""
-        if self._reconnect_task is not None:
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                logger.debug("Reconnect task cancelled during stop()")
-        if self._discover_task is not None:
-            self._discover_task.cancel()
-            try:
-                await self._discover_task
-            except asyncio.CancelledError:
-                logger.debug("Auto-discover task cancelled during stop()")
-        await self._save_state()
-        async with self._lock:
-            for kind_devices in self._devices.values():
-                for device in kind_devices.values():
-                    await device.disconnect()
-            self._devices.clear()
-            self._addresses.clear()
+        # The final save below flushes anything a deferred save still holds
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._reconnect_task = self._discover_task = self._save_task = None
+        self._save_dirty = False
+        try:
+            await self._save_state()
+        except Exception:  # pragma: no cover - runtime diagnostics
+            logger.exception("Final state save failed")
+
+        async def _disconnect_kind(kind: str) -> None:
+            async with self._kind_locks[kind]:
+                devices = list(self._devices.pop(kind, {}).values())
+                # GATT teardowns are independent, so run them side by side
+                results = await asyncio.gather(
+                    *(device.disconnect() for device in devices),
+                    return_exceptions=True,
+                )
+            for device, result in zip(devices, results):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        "Disconnect failed for %s: %s", device.address, result
+                    )
+
+        await asyncio.gather(
+            *(_disconnect_kind(kind) for kind in list(self._devices))
+        )
+        self._addresses.clear()
 
     async def scan_devices(self, timeout: float = 5.0) -> list[Dict[str, Any]]:
         """Scan for BLE devices and return those matching known models."""
         supported = await discover_supported_devices(timeout=timeout)
-        result: list[Dict[str, Any]] = []
-        for device, model_class in supported:
-            device_type = self._get_device_kind(model_class) or "unknown"
-            result.append(
-                {
-                    "address": device.address,
-                    "name": device.name,
-                    "product": getattr(model_class, "model_name", device.name),
-                    "device_type": device_type,
-                }
-            )
-        return result
+        return [
+            {
+                "address": device.address,
+                "name": device.name,
+                "product": product or device.name,
+                "device_type": device_type,
+            }
+            for device, model_class in supported
+            for product, device_type in (_class_scan_fields(model_class),)
+        ]
 
     async def request_status(self, address: str) -> CachedStatus:
-        """Request and return the status for a device by address."""
+        """Request and return the status for a device by address.
+
+        Concurrent requests for the same address share one BLE round-trip
+        instead of each connecting and waiting for a status frame.
+        """
+        task = self._status_inflight.get(address)
+        if task is None:
+            task = asyncio.create_task(self._request_status(address))
+            self._status_inflight[address] = task
+            task.add_done_callback(
+                lambda _task: self._status_inflight.pop(address, None)
+            )
+        # Shield so one cancelled caller does not abort the shared request
+        return await asyncio.shield(task)
+
+    async def _request_status(self, address: str) -> CachedStatus:
         logger.info("Manual request_status for %s", address)
         status = self._cache.get(address)
         if status:
@@ -716,10 +1003,16 @@ class BLEService:
 
     async def disconnect_device(self, address: str) -> None:
         """Disconnect a connected device by address if present."""
-        async with self._lock:
-            for kind, device_dict in list(self._devices.items()):
-                if address in device_dict:
-                    device = device_dict[address]
+        kind = next(
+            (k for k, devices in self._devices.items() if address in devices),
+            None,
+        )
+        if kind is not None:
+            async with self._kind_locks[kind]:
+                # Re-read under the lock: another caller may have removed it
+                device_dict = self._devices.get(kind, {})
+                device = device_dict.get(address)
+                if device is not None:
                     await device.disconnect()
                     del device_dict[address]
                     if not device_dict:
@@ -733,12 +1026,170 @@ class BLEService:
                             )
                         else:
                             self._addresses.pop(kind, None)
-                    break
+        self._publish_status_changes()
 
     def get_status_snapshot(self) -> Dict[str, CachedStatus]:
         """Return an in-memory copy of the cached device statuses."""
         return self._cache.copy()
 
+    def get_status_payload(self) -> tuple[bytes, str]:
+        """Return the serialised ``/api/status`` body and its ETag.
+
+        The body is rebuilt only when a cached status or a primary
+        connection changes; unchanged polls reuse the previous bytes. On a
+        rebuild, devices whose snapshot and connection flag are unchanged
+        reuse their already-encoded entry, so only changed devices are
+        converted and serialised again.
+        """
+        key = (tuple(self._cache.items()), tuple(self._addresses.items()))
+        cached = self._status_payload
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        previous = self._status_parts
+        parts = {
+            address: self._encoded_status(status, previous.get(address))
+            for address, status in self._cache.items()
+        }
+        self._status_parts = parts
+        body = (
+            b"{"
+            + b",".join(
+                orjson.dumps(address) + b":" + part[2]
+                for address, part in parts.items()
+            )
+            + b"}"
+        )
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self._status_payload = (key, body, etag)
+        return body, etag
+
+    def _encoded_status(
+        self,
+        status: CachedStatus,
+        part: tuple[CachedStatus, bool, bytes] | None,
+    ) -> tuple[CachedStatus, bool, bytes]:
+        connected = (
+            self.current_device_address(status.device_type) == status.address
+        )
+        # Snapshots are replaced, never mutated, so identity is a safe
+        # staleness check for a previously encoded entry.
+        if part is not None and part[0] is status and part[1] == connected:
+            return part
+        body = orjson.dumps(_serializers.cached_status_to_dict(self, status))
+        return status, connected, body
+
+    def encode_statuses(self, statuses: Iterable[CachedStatus]) -> bytes:
+        """Return ``statuses`` as an encoded JSON array.
+
+        Entries already encoded for the ``/api/status`` body are reused.
+        """
+        parts = self._status_parts
+        return (
+            b"["
+            + b",".join(
+                self._encoded_status(status, parts.get(status.address))[2]
+                for status in statuses
+            )
+            + b"]"
+        )
+
+    def _status_entries(self) -> Dict[str, tuple[CachedStatus, bool]]:
+        return {
+            address: (
+                status,
+                self.current_device_address(status.device_type) == address,
+            )
+            for address, status in self._cache.items()
+        }
+
+    def subscribe_status(self) -> asyncio.Queue[Dict[str, Any]]:
+        """Register for status deltas; pair with :meth:`unsubscribe_status`.
+
+        Queued events are ``{"type": "delta", "statuses": ...}`` mapping
+        changed addresses to their API dict, or to None for devices that
+        left the cache. A subscriber that falls behind instead gets one
+        ``{"type": "snapshot", "statuses": ...}`` that replaces its state.
+        """
+        if not self._status_subscribers:
+            self._published_status = self._status_entries()
+        queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(
+            maxsize=STATUS_QUEUE_SIZE
+        )
+        self._status_subscribers.add(queue)
+        return queue
+
+    def unsubscribe_status(self, queue: asyncio.Queue) -> None:
+        """Stop delivering status deltas to ``queue``."""
+        self._status_subscribers.discard(queue)
+
+    def _publish_status_changes(self) -> None:
+        """Push statuses that changed since the last publish to subscribers."""
+        if not self._status_subscribers:
+            return
+        current = self._status_entries()
+        previous = self._published_status
+        self._published_status = current
+        delta: Dict[str, Any] = {
+            address: _serializers.cached_status_to_dict(self, entry[0])
+            for address, entry in current.items()
+            if previous.get(address) != entry
+        }
+        for address in previous.keys() - current.keys():
+            delta[address] = None
+        if not delta:
+            return
+        event = {"type": "delta", "statuses": delta}
+        snapshot: Dict[str, Any] | None = None
+        for queue in self._status_subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # A stalled client skipped deltas, possibly removals too, so
+                # replace its whole state rather than patching it
+                while not queue.empty():
+                    queue.get_nowait()
+                if snapshot is None:
+                    snapshot = {
+                        "type": "snapshot",
+                        "statuses": {
+                            address: _serializers.cached_status_to_dict(
+                                self, entry[0]
+                            )
+                            for address, entry in current.items()
+                        },
+                    }
+                queue.put_nowait(snapshot)
+
+    def has_device(self, address: str) -> bool:
+        """Return True if a status is cached for ``address``."""
+        return address in self._cache
+
+    def get_cached_status(self, address: str) -> Optional[CachedStatus]:
+        """Return the cached status for ``address`` without copying the cache."""
+        return self._cache.get(address)
+
+    def known_kind(self, address: str) -> Optional[str]:
+        """Return the device kind already known for ``address``, if any.
+
+        Checks the persisted status cache, connected devices and the last
+        discovery scan, so reconnects can skip a BLE lookup by address.
+        """
+        cached = self._cache.get(address)
+        if cached is not None:
+            return cached.device_type
+        for kind, devices in self._devices.items():
+            if address in devices:
+                return kind
+        if _scan_cache is not None:
+            for device, model_class in _scan_cache[2]:
+                if device.address == address:
+                    return self._get_device_kind(model_class)
+        return None
+
+    def cached_device_count(self) -> int:
+        """Return how many devices have a cached status."""
+        return len(self._cache)
+
     async def set_doser_schedule(
         self,
         address: str,
@@ -838,27 +1289,41 @@ class BLEService:
 
         # Use the generic capture helper for both device kinds. This keeps a
         # single patch point for tests and avoids duplicating collection logic.
-        for device_kind in ("doser", "light"):
-            try:
-                status = await self._refresh_device_status(
-                    device_kind, persist=False
-                )
-            except HTTPException as exc:
-                if exc.status_code == 400:
-                    continue
-                errors.append(str(exc.detail))
+        # The kinds hold separate locks, so both BLE round-trips overlap.
+        outcomes = await asyncio.gather(
+            *(
+                self._refresh_device_status(device_kind, persist=False)
+                for device_kind in ("doser", "light")
+            ),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, HTTPException):
+                if outcome.status_code != 400:
+                    errors.append(str(outcome.detail))
+            elif isinstance(outcome, BaseException):
+                raise outcome
             else:
-                results.append(status)
+                results.append(outcome)
 
         return results, errors
 
     async def _load_state(self) -> None:
-        if not STATE_PATH.exists():
+        try:
+            mtime_ns, body = await asyncio.to_thread(
+                _read_state_file, self._state_mtime_ns
+            )
+        except FileNotFoundError:
+            return
+        if body is None:
+            # Unchanged since this service last read or wrote it, so the
+            # in-memory state is already current.
             return
         try:
-            data = json.loads(STATE_PATH.read_text())
-        except json.JSONDecodeError:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
             return
+        self._state_mtime_ns = mtime_ns
         devices = data.get("devices", {})
         cache: Dict[str, CachedStatus] = {}
         for address, payload in devices.items():
@@ -872,12 +1337,17 @@ class BLEService:
                 channels=payload.get("channels"),
             )
         self._cache = cache
+        self._publish_status_changes()
 
         # Load command history
         commands = data.get("commands", {})
         self._commands = {
             address: cmd_list for address, cmd_list in commands.items()
         }
+        self._command_index = {
+            address: _index_commands(cmd_list)
+            for address, cmd_list in self._commands.items()
+        }
 
         # Load timezone setting (required for pre-release)
         timezone = data.get("display_timezone")
@@ -892,10 +1362,18 @@ class BLEService:
             system_tz = get_system_timezone()
             self.set_display_timezone(system_tz)
 
-    async def _save_state(self) -> None:
-        data = {
-            "devices": {
-                address: {
+    def _state_bytes(self) -> bytes:
+        """Encode the state file, reusing fragments of unchanged devices.
+
+        Each device entry is encoded once per CachedStatus snapshot, so a
+        save only serialises the devices that changed since the last one.
+        """
+        previous = self._state_fragments
+        fragments: Dict[str, tuple[CachedStatus, bytes]] = {}
+        for address, status in self._cache.items():
+            fragment = previous.get(address)
+            if fragment is None or fragment[0] is not status:
+                entry = {
                     "device_type": status.device_type,
                     "raw_payload": status.raw_payload,
                     "parsed": status.parsed,
@@ -903,30 +1381,121 @@ class BLEService:
                     "model_name": status.model_name,
                     "channels": status.channels,
                 }
-                for address, status in self._cache.items()
-            },
-            "commands": self._commands,
-            "display_timezone": self._display_timezone,
-        }
-        STATE_PATH.write_text(json.dumps(data, indent=2, sort_keys=True))
+                fragment = (
+                    status,
+                    orjson.dumps(entry, option=_STATE_JSON_OPTIONS),
+                )
+            fragments[address] = fragment
+        self._state_fragments = fragments
+        devices = b",".join(
+            orjson.dumps(address) + b":" + fragments[address][1]
+            for address in sorted(fragments)
+        )
+        return (
+            b'{"commands":'
+            + orjson.dumps(self._commands, option=_STATE_JSON_OPTIONS)
+            + b',"devices":{'
+            + devices
+            + b'},"display_timezone":'
+            + orjson.dumps(self._display_timezone)
+            + b"}"
+        )
 
-    async def _attempt_reconnect(self) -> None:
-        if self._cache:
-            for address, status in list(self._cache.items()):
+    async def _save_state(self) -> None:
+        async with self._save_lock:
+            # Encoded on the loop so the writer thread never sees command
+            # lists that save_command is mutating in place.
+            write = asyncio.ensure_future(
+                asyncio.to_thread(_write_state_file, self._state_bytes())
+            )
+            try:
+                self._state_mtime_ns = await asyncio.shield(write)
+            except asyncio.CancelledError:
+                # Cancelling the caller does not stop the writer thread; keep
+                # the lock until it lands so the next save cannot overlap it.
+                with suppress(Exception):
+                    self._state_mtime_ns = await write
+                raise
+
+    def request_save(self) -> None:
+        """Schedule a state save, coalescing bursts into a single write."""
+        self._save_dirty = True
+        self._ensure_task("_save_task", self._deferred_save)
+
+    async def _deferred_save(self) -> None:
+        """Write state once requests stop arriving within the coalesce window."""
+        while self._save_dirty:
+            await asyncio.sleep(SAVE_COALESCE_SECONDS)
+            self._save_dirty = False
+            try:
+                await self._save_state()
+            except Exception:  # pragma: no cover - runtime diagnostics
+                logger.exception("Deferred state save failed")
+
+    async def _connect_by_kind(
+        self,
+        targets: Iterable[tuple[str, str]],
+        ble_devices: Dict[str, BLEDevice] | None = None,
+    ) -> Dict[str, CachedStatus | Exception]:
+        """Connect ``(address, kind)`` targets and return per-address results.
+
+        ``ble_devices`` holds scan results that let connects skip their own
+        lookup by address.
+
+        Each kind gets its own chain and the chains run concurrently, so a
+        doser and a light connect in parallel. Devices of one kind still
+        connect in turn: a status refresh reads the kind's primary address,
+        which every connect replaces.
+        """
+        by_kind: Dict[str, list[str]] = {}
+        for address, kind in targets:
+            by_kind.setdefault(kind, []).append(address)
+        results: Dict[str, CachedStatus | Exception] = {}
+        scanned = ble_devices or {}
+
+        async def _connect_chain(kind: str, addresses: list[str]) -> None:
+            for address in addresses:
+                logger.info("Connecting to %s (type=%s)", address, kind)
                 try:
-                    logger.info(
-                        "Attempting reconnect to %s (type=%s)",
-                        address,
-                        status.device_type,
-                    )
-                    await self.connect_device(address, status.device_type)
-                except HTTPException as exc:
-                    logger.warning(
-                        "Reconnect failed for %s: %s",
-                        address,
-                        getattr(exc, "detail", exc),
+                    results[address] = await self.connect_device(
+                        address, kind, ble_device=scanned.get(address)
                     )
-                    continue
+                except Exception as exc:
+                    results[address] = exc
+
+        await asyncio.gather(
+            *(
+                _connect_chain(kind, addresses)
+                for kind, addresses in by_kind.items()
+            )
+        )
+        return results
+
+    async def _attempt_reconnect(self) -> None:
+        if not self._cache:
+            return
+        # One scan that ends once every cached device has advertised,
+        # instead of a full lookup timeout per address.
+        found = await scan_until_found(list(self._cache))
+        for address in self._cache.keys() - found.keys():
+            logger.warning(
+                "Reconnect skipped for %s: not seen in scan", address
+            )
+        results = await self._connect_by_kind(
+            (
+                (address, status.device_type)
+                for address, status in list(self._cache.items())
+                if address in found
+            ),
+            found,
+        )
+        for address, result in results.items():
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Reconnect failed for %s: %s",
+                    address,
+                    getattr(result, "detail", result),
+                )
 
     async def _auto_discover_and_connect(self) -> bool:
         supported = await discover_supported_devices(timeout=5.0)
@@ -934,51 +1503,60 @@ class BLEService:
             logger.info("No supported devices discovered")
             return False
         logger.info("Discovered %d supported devices", len(supported))
-        connected_any = False
+        targets: list[tuple[str, str]] = []
+        scanned: Dict[str, BLEDevice] = {}
         for device, model_class in supported:
-            address = device.address
-            try:
-                inferred_type = self._get_device_kind(model_class)
-                if not inferred_type:
-                    logger.debug(
-                        "Skipping unsupported model for %s: %s",
-                        address,
-                        model_class,
-                    )
-                    continue
-                status = await self.connect_device(address, inferred_type)
-                self._cache[address] = status
-                logger.info("Connected to %s (%s)", address, status.device_type)
-                connected_any = True
-            except Exception as exc:  # pragma: no cover - runtime diagnostics
-                logger.warning("Connect failed for %s: %s", address, exc)
+            inferred_type = self._get_device_kind(model_class)
+            if not inferred_type:
+                logger.debug(
+                    "Skipping unsupported model for %s: %s",
+                    device.address,
+                    model_class,
+                )
+                continue
+            targets.append((device.address, inferred_type))
+            scanned[device.address] = device
+        connected_any = False
+        results = await self._connect_by_kind(targets, scanned)
+        for address, result in results.items():
+            if isinstance(result, Exception):
+                logger.warning("Connect failed for %s: %s", address, result)
                 continue
+            self._cache[address] = result
+            logger.info("Connected to %s (%s)", address, result.device_type)
+            connected_any = True
         return connected_any
 
     # Command persistence methods
 
+    def _command_positions(self, address: str) -> Dict[str, int]:
+        """Return the id -> position index for ``address``'s history."""
+        index = self._command_index.get(address)
+        if index is None:
+            index = _index_commands(self._commands.get(address, []))
+            self._command_index[address] = index
+        return index
+
     def save_command(self, command_record) -> None:
         """Save a command record to persistent storage."""
         address = command_record.address
-        if address not in self._commands:
-            self._commands[address] = []
+        existing_commands = self._commands.setdefault(address, [])
+        index = self._command_positions(address)
 
         # Update existing command or append new one
         command_dict = command_record.to_dict()
-        existing_commands = self._commands[address]
+        position = index.get(command_record.id)
+        if position is not None:
+            existing_commands[position] = command_dict
+            return
 
-        # Try to find existing command by ID
-        for i, existing in enumerate(existing_commands):
-            if existing.get("id") == command_record.id:
-                existing_commands[i] = command_dict
-                break
-        else:
-            # New command, append it
-            existing_commands.append(command_dict)
+        existing_commands.append(command_dict)
+        index[command_record.id] = len(existing_commands) - 1
 
-            # Keep only last 50 commands per device
-            if len(existing_commands) > 50:
-                existing_commands[:] = existing_commands[-50:]
+        # Keep only last 50 commands per device
+        if len(existing_commands) > 50:
+            existing_commands[:] = existing_commands[-50:]
+            self._command_index[address] = _index_commands(existing_commands)
 
     def get_commands(self, address: str, limit: int = 20):
         """Get recent commands for a device."""
@@ -987,8 +1565,7 @@ class BLEService:
 
     def get_command(self, address: str, command_id: str):
         """Get a specific command by ID."""
-        commands = self._commands.get(address, [])
-        for cmd in commands:
-            if cmd.get("id") == command_id:
-                return cmd
-        return None
+        position = self._command_positions(address).get(command_id)
+        if position is None:
+            return None
+        return self._commands[address][position]
@@ -2,6 +2,7 @@
 
 import datetime
 from enum import Enum, IntFlag
+from functools import lru_cache
 from typing import Iterable, List, Sequence
 
 
@@ -180,6 +181,37 @@ def create_add_auto_setting_command(
         if not (0 <= val <= 100):
             raise ValueError(f"Brightness value {i} must be 0-100, got {val}")
 
+    return _encode_auto_setting(
+        msg_id, sunrise, sunset, brightness, ramp_up_minutes, weekdays
+    )
+
+
+def create_delete_auto_setting_command(
+    msg_id: tuple[int, int],
+    sunrise: datetime.time,
+    sunset: datetime.time,
+    ramp_up_minutes: int,
+    weekdays: int,
+) -> bytearray:
+    """Create a delete-auto-setting command (encoded via add with 255s)."""
+    return _encode_auto_setting(
+        msg_id, sunrise, sunset, (255, 255, 255), ramp_up_minutes, weekdays
+    )
+
+
+def _encode_auto_setting(
+    msg_id: tuple[int, int],
+    sunrise: datetime.time,
+    sunset: datetime.time,
+    brightness: tuple[int, ...],
+    ramp_up_minutes: int,
+    weekdays: int,
+) -> bytearray:
+    """Encode an auto program frame without validating brightness.
+
+    Deletes reuse the add frame with 255 in every brightness slot, which the
+    public add encoder would reject.
+    """
     parameters = [
         sunrise.hour,
         sunrise.minute,
@@ -197,19 +229,6 @@ def create_add_auto_setting_command(
     return _encode_uart_command(165, 25, msg_id, parameters)
 
 
-def create_delete_auto_setting_command(
-    msg_id: tuple[int, int],
-    sunrise: datetime.time,
-    sunset: datetime.time,
-    ramp_up_minutes: int,
-    weekdays: int,
-) -> bytearray:
-    """Create a delete-auto-setting command (encoded via add with 255s)."""
-    return create_add_auto_setting_command(
-        msg_id, sunrise, sunset, (255, 255, 255), ramp_up_minutes, weekdays
-    )
-
-
 def create_reset_auto_settings_command(msg_id: tuple[int, int]) -> bytearray:
     """Return a command to reset auto settings on the device."""
     return _encode_uart_command(90, 5, msg_id, [5, 255, 255])
@@ -347,20 +366,37 @@ def _encode_uart_command(
     cmd_id: int, mode: int, msg_id: tuple[int, int], params: Iterable[int]
 ) -> bytearray:
     """Return a UART frame compatible with the pump protocol."""
-    msg_hi, msg_lo = msg_id
-    payload = list(params)
-    sanitized = [(value if value != 0x5A else 0x59) for value in payload]
+    return finalize(build_template(cmd_id, mode, tuple(params)), msg_id)
 
-    command = bytearray(
-        [cmd_id, 0x01, len(sanitized) + 5, msg_hi, msg_lo, mode]
-    )
-    command.extend(sanitized)
+
+@lru_cache(maxsize=256)
+def build_template(cmd_id: int, mode: int, params: tuple[int, ...]) -> bytes:
+    """Return the message-id independent part of a UART frame.
+
+    The template holds the header with zeroed message id bytes followed by
+    the sanitized parameters; the checksum is left off. Frames for the same
+    command and arguments are requested repeatedly (e.g. turning every
+    channel on or off), so the result is cached and only the message id and
+    checksum are filled in per send by :func:`finalize`.
+    """
+    sanitized = bytes(value if value != 0x5A else 0x59 for value in params)
+    return bytes([cmd_id, 0x01, len(sanitized) + 5, 0, 0, mode]) + sanitized
+
+
+def finalize(template: bytes, msg_id: tuple[int, int]) -> bytearray:
+    """Return a complete frame from a template and a message id.
+
+    Writes the message id at offsets 3-4 and appends the checksum. When the
+    checksum would collide with the reserved 0x5A value the message id is
+    bumped and the frame rebuilt.
+    """
+    command = bytearray(template)
+    command[3], command[4] = msg_id
 
     verification_byte = _calculate_checksum(command)
     if verification_byte == 0x5A:
         # bump the message id using the canonical helper and retry
-        new_msg_id = next_message_id(msg_id)
-        return _encode_uart_command(cmd_id, mode, new_msg_id, params)
+        return finalize(template, next_message_id(msg_id))
 
     command.append(verification_byte)
     return command
@@ -407,22 +443,31 @@ def decode_pump_weekdays(mask: int) -> list[PumpWeekday]:
     return weekdays
 
 
+# Lower-case weekday names mapped to the 3-letter names stored in configs
+DAY_ABBREVIATIONS = {
+    "monday": "Mon",
+    "tuesday": "Tue",
+    "wednesday": "Wed",
+    "thursday": "Thu",
+    "friday": "Fri",
+    "saturday": "Sat",
+    "sunday": "Sun",
+}
+ALL_DAYS = tuple(DAY_ABBREVIATIONS.values())
+
+_PUMP_WEEKDAY_NAMES = {
+    PumpWeekday[name]: abbreviation
+    for name, abbreviation in DAY_ABBREVIATIONS.items()
+}
+
+
 def pump_weekdays_to_names(weekdays: Sequence[PumpWeekday]) -> list[str]:
     """Convert PumpWeekday enums to weekday name strings.
 
     Returns weekday names in the order they appear in the enum.
     """
-    name_map = {
-        PumpWeekday.monday: "Mon",
-        PumpWeekday.tuesday: "Tue",
-        PumpWeekday.wednesday: "Wed",
-        PumpWeekday.thursday: "Thu",
-        PumpWeekday.friday: "Fri",
-        PumpWeekday.saturday: "Sat",
-        PumpWeekday.sunday: "Sun",
-    }
-
-    return [name_map[day] for day in weekdays if day in name_map]
+    lookup = _PUMP_WEEKDAY_NAMES.get
+    return [name for name in map(lookup, weekdays) if name is not None]
 
 
 def create_head_dose_command(
@@ -8,17 +8,19 @@ connection and status helpers.
 from __future__ import annotations
 
 from datetime import time as _time
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Sequence
 
 from bleak_retry_connector import BleakConnectionError, BleakNotFoundError
 from fastapi import HTTPException
 
 from ..commands import encoder as doser_commands
+from ..device import light_device
 from .encoder import LightWeekday
 
 if TYPE_CHECKING:
     # Avoid runtime import cycles; used for type annotations only
     from ..ble_service import CachedStatus
+    from ..device.light_device import LightDevice
 
 
 async def set_doser_schedule(
@@ -77,11 +79,15 @@ async def set_light_brightness(
     return await service._refresh_device_status("light", persist=True)
 
 
-async def turn_light_on(service: Any, address: str) -> "CachedStatus":
-    """Turn the specified light device on."""
+async def _run_light_action(
+    service: Any,
+    address: str,
+    action: Callable[[LightDevice], Awaitable[None]],
+) -> "CachedStatus":
+    """Run the argument-less light ``action`` and refresh the light status."""
     device = await service._ensure_device(address, "light")
     try:
-        await device.turn_on()
+        await action(device)
     except (BleakNotFoundError, BleakConnectionError) as exc:
         raise HTTPException(
             status_code=404, detail="Light not reachable"
@@ -89,52 +95,39 @@ async def turn_light_on(service: Any, address: str) -> "CachedStatus":
     return await service._refresh_device_status("light", persist=True)
 
 
+async def turn_light_on(service: Any, address: str) -> "CachedStatus":
+    """Turn the specified light device on."""
+    return await _run_light_action(
+        service, address, light_device.LightDevice.turn_on
+    )
+
+
 async def turn_light_off(service: Any, address: str) -> "CachedStatus":
     """Turn the specified light device off."""
-    device = await service._ensure_device(address, "light")
-    try:
-        await device.turn_off()
-    except (BleakNotFoundError, BleakConnectionError) as exc:
-        raise HTTPException(
-            status_code=404, detail="Light not reachable"
-        ) from exc
-    return await service._refresh_device_status("light", persist=True)
+    return await _run_light_action(
+        service, address, light_device.LightDevice.turn_off
+    )
 
 
 async def enable_auto_mode(service: Any, address: str) -> "CachedStatus":
     """Enable auto mode on the light device."""
-    device = await service._ensure_device(address, "light")
-    try:
-        await device.enable_auto_mode()
-    except (BleakNotFoundError, BleakConnectionError) as exc:
-        raise HTTPException(
-            status_code=404, detail="Light not reachable"
-        ) from exc
-    return await service._refresh_device_status("light", persist=True)
+    return await _run_light_action(
+        service, address, light_device.LightDevice.enable_auto_mode
+    )
 
 
 async def set_manual_mode(service: Any, address: str) -> "CachedStatus":
     """Switch the light device to manual control mode."""
-    device = await service._ensure_device(address, "light")
-    try:
-        await device.set_manual_mode()
-    except (BleakNotFoundError, BleakConnectionError) as exc:
-        raise HTTPException(
-            status_code=404, detail="Light not reachable"
-        ) from exc
-    return await service._refresh_device_status("light", persist=True)
+    return await _run_light_action(
+        service, address, light_device.LightDevice.set_manual_mode
+    )
 
 
 async def reset_auto_settings(service: Any, address: str) -> "CachedStatus":
     """Reset stored auto settings on the light device."""
-    device = await service._ensure_device(address, "light")
-    try:
-        await device.reset_settings()
-    except (BleakNotFoundError, BleakConnectionError) as exc:
-        raise HTTPException(
-            status_code=404, detail="Light not reachable"
-        ) from exc
-    return await service._refresh_device_status("light", persist=True)
+    return await _run_light_action(
+        service, address, light_device.LightDevice.reset_settings
+    )
 
 
 async def add_light_auto_setting(
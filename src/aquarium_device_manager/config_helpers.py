@@ -11,7 +11,12 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
-from .commands.encoder import decode_pump_weekdays, pump_weekdays_to_names
+from .commands.encoder import (
+    ALL_DAYS,
+    DAY_ABBREVIATIONS,
+    decode_pump_weekdays,
+    pump_weekdays_to_names,
+)
 from .doser_status import DoserStatus, HeadSnapshot
 from .doser_storage import (
     Calibration,
@@ -292,7 +297,9 @@ def update_doser_head_stats(
         if head.index == head_index:
             if head.stats is None:
                 head.stats = DoserHeadStats(dosesToday=0, mlDispensedToday=0.0)
-            head.stats.mlDispensedToday = status.dosed_ml()
+            head.stats = head.stats.model_copy(
+                update={"mlDispensedToday": status.dosed_ml()}
+            )
             logger.debug(
                 f"Updated head {head_index} stats: {status.dosed_ml()}ml dispensed"
             )
@@ -500,25 +507,12 @@ def add_light_auto_program(
     # Create default levels for all channels
     levels = {ch.key: brightness for ch in device.channels}
 
-    # Convert weekday names to abbreviated format
-    weekday_mapping = {
-        "monday": "Mon",
-        "tuesday": "Tue",
-        "wednesday": "Wed",
-        "thursday": "Thu",
-        "friday": "Fri",
-        "saturday": "Sat",
-        "sunday": "Sun",
-    }
-
-    # Create new auto program
-    default_weekdays = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    # Create new auto program with weekday names in abbreviated format
     if weekdays:
-        program_days = [
-            weekday_mapping.get(day.lower(), day) for day in weekdays
-        ]
+        lookup = DAY_ABBREVIATIONS.get
+        program_days = [lookup(day.lower(), day) for day in weekdays]
     else:
-        program_days = default_weekdays
+        program_days = list(ALL_DAYS)
 
     new_program = AutoProgram(
         id=str(uuid4()),
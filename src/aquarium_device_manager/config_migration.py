@@ -117,6 +117,10 @@ def get_config_dir() -> Path:
     return NEW_CONFIG_DIR
 
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
 def get_env_bool(name: str, default: bool) -> bool:
     """Get boolean environment variable with fallback support.
 
@@ -136,9 +140,9 @@ def get_env_bool(name: str, default: bool) -> bool:
         return default
 
     lowered = s.lower()
-    if lowered in ("1", "true", "yes", "on"):
+    if lowered in _TRUE_VALUES:
         return True
-    if lowered in ("0", "false", "no", "off"):
+    if lowered in _FALSE_VALUES:
         return False
 
     try:
@@ -15,7 +15,7 @@ from .c2rgb import CIIRGB
 from .commander1 import Commander1
 from .commander4 import Commander4
 from .doser import Doser
-from .light_device import LightDevice
+from .light_device import AutoSetting, LightDevice
 from .tiny_terrarium_egg import TinyTerrariumEgg
 from .universal_wrgb import UniversalWRGB
 from .wrgb2 import WRGBII
@@ -30,11 +30,19 @@ for name, obj in inspect.getmembers(sys.modules[__name__]):
             CODE2MODEL[model_code] = obj
 
 
+def find_model_class(device_name: str) -> Type[BaseDevice] | None:
+    """Return the model class for an advertised name, or None if unknown.
+
+    Advertised names are the model code followed by a 12-character suffix.
+    """
+    return CODE2MODEL.get(device_name[:-12])
+
+
 def get_model_class_from_name(
     device_name: str,
 ) -> Type[BaseDevice]:
     """Get device class name from device name."""
-    model_class = CODE2MODEL.get(device_name[:-12])
+    model_class = find_model_class(device_name)
     if model_class is None:
         raise DeviceNotFound(f"Device model code not found for: {device_name}")
     return model_class
@@ -66,8 +74,10 @@ __all__ = [
     "UniversalWRGB",
     "BaseDevice",
     "LightDevice",
+    "AutoSetting",
     "ParsedLightStatus",
     "CODE2MODEL",
     "get_device_from_address",
+    "find_model_class",
     "get_model_class_from_name",
 ]
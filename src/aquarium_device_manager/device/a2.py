@@ -11,3 +11,5 @@ class AII(LightDevice):
     _colors: dict[str, int] = {
         "white": 0,
     }
+
+    __slots__ = ()
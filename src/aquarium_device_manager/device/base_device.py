@@ -5,7 +5,7 @@ import asyncio
 import logging
 import time
 from abc import ABC
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Optional
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
@@ -31,6 +31,10 @@ DEFAULT_ATTEMPTS = 3
 DISCONNECT_DELAY = 120
 BLEAK_BACKOFF_TIME = 0.25
 
+# Largest frame that fits a single ATT write on the default 23-byte MTU.
+# Anything longer is sent with response so the stack can fragment it safely.
+MAX_WRITE_WITHOUT_RESPONSE = 20
+
 # Message ID session management constants (configurable via environment)
 MESSAGE_ID_RESET_INTERVAL_HOURS = get_env_float("AQUA_MSG_ID_RESET_HOURS", 24.0)
 MESSAGE_ID_MAX_SESSION_COMMANDS = get_env_int("AQUA_MSG_ID_MAX_COMMANDS", 1000)
@@ -57,8 +61,33 @@ class BaseDevice(ABC):
     _model_name: str | None = None
     _model_codes: list[str] = []
     _colors: dict[str, int] = {}
-    _msg_id = commands.next_message_id()
+
+    # Per-instance state lives in slots; model subclasses declare empty
+    # ``__slots__`` so devices never grow a ``__dict__``.
+    __slots__ = (
+        "__weakref__",
+        "_ble_device",
+        "_logger",
+        "_advertisement_data",
+        "_client",
+        "_disconnect_timer",
+        "_operation_lock",
+        "_read_char",
+        "_write_char",
+        "_connect_lock",
+        "_expected_disconnect",
+        "loop",
+        "_msg_id",
+        "_session_start_time",
+        "_session_command_count",
+        "_color_names",
+        "_color_ids",
+        "_last_status",
+        "_status_event",
+    )
+
     _logger: logging.Logger
+    _msg_id: tuple[int, int]
 
     def __init__(
         self,
@@ -79,8 +108,19 @@ class BaseDevice(ABC):
         self.loop = asyncio.get_running_loop()
         assert self._model_name is not None
 
+        # Model colour maps are fixed per class; freeze the lookups once
+        self._color_names: tuple[str, ...] = tuple(self._colors)
+        self._color_ids: frozenset[int] = frozenset(self._colors.values())
+
+        self._last_status: Any = None
+        # Set by subclasses whose notification handler recognises a
+        # complete status frame, so captures can finish early.
+        self._status_event = asyncio.Event()
+
         # Message ID session management
-        self._session_start_time = time.time()
+        self._msg_id = commands.next_message_id()
+        # Monotonic, so wall-clock jumps cannot shorten or stretch a session
+        self._session_start_time = time.monotonic()
         self._session_command_count = 0
 
     # Base methods
@@ -106,10 +146,38 @@ class BaseDevice(ABC):
 
     def get_next_msg_id(self) -> tuple[int, int]:
         """Get next message id with session management."""
+        self._check_msg_id_session()
+        self._session_command_count += 1
+        self._msg_id = commands.next_message_id(self._msg_id)
+        return self._msg_id
+
+    def reserve_msg_ids(self, count: int) -> list[tuple[int, int]]:
+        """Reserve ``count`` consecutive message ids in one step.
+
+        The session check runs once for the whole block, so bulk commands
+        do not pay for it per frame.
+
+        Args:
+            count: Number of message ids to hand out
+
+        Returns:
+            The reserved ids in send order
+        """
+        self._check_msg_id_session()
+        msg_id = self._msg_id
+        ids: list[tuple[int, int]] = []
+        for _ in range(count):
+            msg_id = commands.next_message_id(msg_id)
+            ids.append(msg_id)
+        self._msg_id = msg_id
+        self._session_command_count += count
+        return ids
+
+    def _check_msg_id_session(self) -> None:
+        """Reset the message id session once it is too old or too busy."""
         # Check if we should reset message ID based on session duration or command count
-        current_time = time.time()
         session_duration_hours = (
-            current_time - self._session_start_time
+            time.monotonic() - self._session_start_time
         ) / 3600
 
         if (
@@ -123,10 +191,6 @@ class BaseDevice(ABC):
                 self._session_command_count,
             )
 
-        self._session_command_count += 1
-        self._msg_id = commands.next_message_id(self._msg_id)
-        return self._msg_id
-
     def reset_msg_id(self) -> None:
         """Reset message ID to start of new session.
 
@@ -138,7 +202,7 @@ class BaseDevice(ABC):
     def _reset_message_id_session(self) -> None:
         """Reset message ID and session tracking to start of new session."""
         self._msg_id = commands.reset_message_id()
-        self._session_start_time = time.time()
+        self._session_start_time = time.monotonic()
         self._session_command_count = 0
 
     def is_msg_id_exhausted(self) -> bool:
@@ -157,11 +221,10 @@ class BaseDevice(ABC):
         Returns:
             Dictionary with session start time, command count, and duration
         """
-        current_time = time.time()
+        elapsed = time.monotonic() - self._session_start_time
         return {
-            "session_start_time": self._session_start_time,
-            "session_duration_hours": (current_time - self._session_start_time)
-            / 3600,
+            "session_start_time": time.time() - elapsed,
+            "session_duration_hours": elapsed / 3600,
             "session_command_count": self._session_command_count,
             "message_id": self._msg_id,
             "message_id_exhausted": self.is_msg_id_exhausted(),
@@ -208,6 +271,21 @@ class BaseDevice(ABC):
         """Send a request to the device to get its current status."""
         pass
 
+    async def capture_status(self, timeout: float) -> bool:
+        """Request a status report and wait up to ``timeout`` seconds for it.
+
+        Returns True as soon as a complete status frame is stored, or False
+        once the timeout passes; devices that never signal a complete frame
+        always wait the full timeout.
+        """
+        self._status_event.clear()
+        await self.request_status()
+        try:
+            await asyncio.wait_for(self._status_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     # Command methods
 
     # Bluetooth methods
@@ -216,23 +294,36 @@ class BaseDevice(ABC):
         self,
         commands: list[bytes] | bytes | bytearray,
         retry: int | None = None,
+        *,
+        response: bool = False,
     ) -> None:
-        """Send command to device and read response."""
+        """Send command to device and read response.
+
+        Commands are written without a GATT acknowledgement by default; pass
+        ``response=True`` when the write must be confirmed by the device.
+        """
         await self._ensure_connected()
         # await self._resolve_protocol()
         if not isinstance(commands, list):
             commands = [commands]
-        await self._send_command_while_connected(commands, retry)
+        await self._send_command_while_connected(
+            commands, retry, response=response
+        )
 
     async def _send_command_while_connected(
-        self, commands: list[bytes], retry: int | None = None
+        self,
+        commands: list[bytes],
+        retry: int | None = None,
+        *,
+        response: bool = False,
     ) -> None:
         """Send command to device and read response."""
-        self._logger.debug(
-            "%s: Sending commands %s",
-            self.name,
-            [command.hex() for command in commands],
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "%s: Sending commands %s",
+                self.name,
+                [command.hex() for command in commands],
+            )
         if self._operation_lock.locked():
             self._logger.debug(
                 "%s: Operation already in progress; waiting. RSSI: %s",
@@ -241,7 +332,7 @@ class BaseDevice(ABC):
             )
         async with self._operation_lock:
             try:
-                await self._send_command_locked(commands)
+                await self._send_command_locked(commands, response=response)
                 return
             except BleakNotFoundError:
                 self._logger.error(
@@ -269,10 +360,12 @@ class BaseDevice(ABC):
         raise RuntimeError("Unreachable")
 
     @retry_bluetooth_connection_error(DEFAULT_ATTEMPTS)
-    async def _send_command_locked(self, commands: list[bytes]) -> None:
+    async def _send_command_locked(
+        self, commands: list[bytes], *, response: bool = False
+    ) -> None:
         """Send command to device and read response."""
         try:
-            await self._execute_command_locked(commands)
+            await self._execute_command_locked(commands, response=response)
         except BleakDBusError as ex:
             # Disconnect so we can reset state and try again
             await asyncio.sleep(BLEAK_BACKOFF_TIME)
@@ -296,7 +389,9 @@ class BaseDevice(ABC):
             await self._execute_disconnect()
             raise
 
-    async def _execute_command_locked(self, commands: list[bytes]) -> None:
+    async def _execute_command_locked(
+        self, commands: list[bytes], *, response: bool = False
+    ) -> None:
         """Execute command and read response."""
         assert self._client is not None  # nosec
         if not self._read_char:
@@ -307,7 +402,7 @@ class BaseDevice(ABC):
             await self._client.write_gatt_char(
                 self._write_char,
                 command,
-                False,
+                response or len(command) > MAX_WRITE_WITHOUT_RESPONSE,
             )
 
     def _notification_handler(
@@ -13,3 +13,5 @@ class CIIRGB(LightDevice):
         "green": 1,
         "blue": 2,
     }
+
+    __slots__ = ()
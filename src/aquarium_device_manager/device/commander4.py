@@ -9,3 +9,5 @@ class Commander4(LightDevice):
     _model_name = "Commander 4"
     _model_codes = ["DYLED"]
     _colors: dict[str, int] = {"white": 0, "red": 0, "green": 1, "blue": 2}
+
+    __slots__ = ()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import ClassVar, Sequence
 
 from bleak.backends.characteristic import BleakGATTCharacteristic
@@ -21,7 +20,9 @@ class Doser(BaseDevice):
     _model_codes = ["DYDOSE"]
     _colors: dict[str, int] = {}
 
-    _last_status: DoserStatus | None = None
+    _last_status: DoserStatus | None
+
+    __slots__ = ()
 
     async def request_status(self) -> None:
         """Send a handshake to ask the pump for its latest status."""
@@ -133,6 +134,5 @@ class Doser(BaseDevice):
         if not confirm:
             return None
 
-        await self.request_status()
-        await asyncio.sleep(max(0.0, wait_seconds))
+        await self.capture_status(max(0.0, wait_seconds))
         return self._last_status
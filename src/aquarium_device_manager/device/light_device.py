@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, Optional
+import datetime
+import logging
+from typing import ClassVar, NamedTuple, Optional, Sequence
 
 from bleak.backends.characteristic import BleakGATTCharacteristic
 
@@ -10,13 +12,35 @@ from ..commands import encoder as commands
 from ..light_status import ParsedLightStatus, parse_light_payload
 from .base_device import BaseDevice
 
+# Schedules without explicit weekdays run every day
+_EVERYDAY_MASK = commands.encode_weekdays([commands.LightWeekday.everyday])
+
+
+def _weekday_mask(weekdays: list[commands.LightWeekday] | None) -> int:
+    """Return the weekday bitmask for ``weekdays``, defaulting to every day."""
+    if not weekdays:
+        return _EVERYDAY_MASK
+    return commands.encode_weekdays(weekdays)
+
+
+class AutoSetting(NamedTuple):
+    """One auto-mode program for :meth:`LightDevice.add_settings`."""
+
+    sunrise: datetime.time
+    sunset: datetime.time
+    brightness: tuple[int, ...] = (100,)
+    ramp_up_in_minutes: int = 0
+    weekdays: list[commands.LightWeekday] | None = None
+
 
 class LightDevice(BaseDevice):
     """Base class for Chihiros lights that can request status updates."""
 
     device_kind: ClassVar[str] = "light"
     status_serializer: ClassVar[str | None] = "serialize_light_status"
-    _last_status: Optional[ParsedLightStatus] = None
+    _last_status: Optional[ParsedLightStatus]
+
+    __slots__ = ()
 
     async def request_status(self) -> None:
         """Trigger a status report from the light via the UART handshake."""
@@ -37,6 +61,12 @@ class LightDevice(BaseDevice):
         if payload[0] == 0x5B and len(payload) >= 6:
             mode = payload[5]
             if mode == 0xFE:
+                last = self._last_status
+                if last is not None and last.raw_payload == payload:
+                    # Steady-state polls repeat the same frame; keep the
+                    # already-parsed status instead of decoding it again.
+                    self._status_event.set()
+                    return
                 try:
                     parsed = parse_light_payload(payload)
                 except Exception:
@@ -55,19 +85,23 @@ class LightDevice(BaseDevice):
                         raw_payload=payload,
                     )
                 self._last_status = parsed
-                self._logger.debug(
-                    "%s: Status payload: %s", self.name, payload.hex()
-                )
+                self._status_event.set()
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug(
+                        "%s: Status payload: %s", self.name, payload.hex()
+                    )
                 return
             if mode == 0x0A:
-                self._logger.debug(
-                    "%s: Handshake ack: %s", self.name, payload.hex()
-                )
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug(
+                        "%s: Handshake ack: %s", self.name, payload.hex()
+                    )
                 return
 
-        self._logger.debug(
-            "%s: Notification received: %s", self.name, payload.hex()
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "%s: Notification received: %s", self.name, payload.hex()
+            )
 
     @property
     def last_status(self) -> Optional[ParsedLightStatus]:
@@ -81,7 +115,7 @@ class LightDevice(BaseDevice):
     ) -> None:
         """Set brightness of a color."""
         color_id: int | None = None
-        if isinstance(color, int) and color in self._colors.values():
+        if isinstance(color, int) and color in self._color_ids:
             color_id = color
         elif isinstance(color, str) and color in self._colors:
             color_id = self._colors.get(color)
@@ -113,15 +147,25 @@ class LightDevice(BaseDevice):
         )
         await self._send_command(cmd, 3)
 
+    async def _set_all_colors(self, brightness: int) -> None:
+        """Set every colour channel to ``brightness`` in one batch."""
+        color_ids = [self._colors[name] for name in self._color_names]
+        cmds = [
+            commands.create_manual_setting_command(msg_id, color_id, brightness)
+            for msg_id, color_id in zip(
+                self.reserve_msg_ids(len(color_ids)), color_ids
+            )
+        ]
+        if cmds:
+            await self._send_command(cmds, 3)
+
     async def turn_on(self) -> None:
         """Turn on light."""
-        for color_name in self._colors:
-            await self.set_color_brightness(100, color_name)
+        await self._set_all_colors(100)
 
     async def turn_off(self) -> None:
         """Turn off light."""
-        for color_name in self._colors:
-            await self.set_color_brightness(0, color_name)
+        await self._set_all_colors(0)
 
     async def add_setting(
         self,
@@ -138,9 +182,7 @@ class LightDevice(BaseDevice):
             sunset,
             (max_brightness, 255, 255),
             ramp_up_in_minutes,
-            commands.encode_weekdays(
-                weekdays or [commands.LightWeekday.everyday]
-            ),
+            _weekday_mask(weekdays),
         )
         await self._send_command(cmd, 3)
 
@@ -159,9 +201,7 @@ class LightDevice(BaseDevice):
             sunset,
             max_brightness,
             ramp_up_in_minutes,
-            commands.encode_weekdays(
-                weekdays or [commands.LightWeekday.everyday]
-            ),
+            _weekday_mask(weekdays),
         )
         await self._send_command(cmd, 3)
 
@@ -204,9 +244,7 @@ class LightDevice(BaseDevice):
             sunset,
             brightness_tuple,
             ramp_up_in_minutes,
-            commands.encode_weekdays(
-                weekdays or [commands.LightWeekday.everyday]
-            ),
+            _weekday_mask(weekdays),
         )
         await self._send_command(cmd, 3)
 
@@ -223,12 +261,50 @@ class LightDevice(BaseDevice):
             sunrise.time(),
             sunset.time(),
             ramp_up_in_minutes,
-            commands.encode_weekdays(
-                weekdays or [commands.LightWeekday.everyday]
-            ),
+            _weekday_mask(weekdays),
         )
         await self._send_command(cmd, 3)
 
+    async def add_settings(self, settings: Sequence[AutoSetting]) -> None:
+        """Add several automation settings in a single device session.
+
+        All frames are encoded up front and written back-to-back under one
+        connection check and one operation lock, instead of a full
+        round-trip per setting.
+        """
+        cmds = [
+            commands.create_add_auto_setting_command(
+                self.get_next_msg_id(),
+                setting.sunrise,
+                setting.sunset,
+                setting.brightness,
+                setting.ramp_up_in_minutes,
+                _weekday_mask(setting.weekdays),
+            )
+            for setting in settings
+        ]
+        if cmds:
+            await self._send_command(cmds, 3)
+
+    async def remove_settings(self, settings: Sequence[AutoSetting]) -> None:
+        """Remove several automation settings in a single device session.
+
+        Only the schedule fields of each setting are used; brightness is
+        ignored because deletes are encoded with fixed values.
+        """
+        cmds = [
+            commands.create_delete_auto_setting_command(
+                self.get_next_msg_id(),
+                setting.sunrise,
+                setting.sunset,
+                setting.ramp_up_in_minutes,
+                _weekday_mask(setting.weekdays),
+            )
+            for setting in settings
+        ]
+        if cmds:
+            await self._send_command(cmds, 3)
+
     async def reset_settings(self) -> None:
         """Remove all automation settings from the light."""
         cmd = commands.create_reset_auto_settings_command(
@@ -247,5 +323,4 @@ class LightDevice(BaseDevice):
 
     async def set_manual_mode(self) -> None:
         """Switch to manual mode by sending a manual mode command."""
-        for color_name in self._colors:
-            await self.set_color_brightness(0, color_name)
+        await self._set_all_colors(0)
@@ -12,3 +12,5 @@ class TinyTerrariumEgg(LightDevice):
         "red": 0,
         "green": 1,
     }
+
+    __slots__ = ()
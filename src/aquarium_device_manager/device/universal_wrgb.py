@@ -23,3 +23,5 @@ class UniversalWRGB(LightDevice):
         "blue": 2,
         "white": 3,
     }
+
+    __slots__ = ()
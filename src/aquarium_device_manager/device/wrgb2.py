@@ -20,3 +20,5 @@ class WRGBII(LightDevice):
         "green": 1,
         "blue": 2,
     }
+
+    __slots__ = ()
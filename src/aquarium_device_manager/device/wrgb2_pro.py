@@ -21,3 +21,5 @@ class WRGBIIPro(LightDevice):
         "blue": 2,
         "white": 3,
     }
+
+    __slots__ = ()
@@ -13,3 +13,5 @@ class WRGBIISlim(LightDevice):
         "green": 1,
         "blue": 2,
     }
+
+    __slots__ = ()
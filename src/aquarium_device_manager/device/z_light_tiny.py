@@ -12,3 +12,5 @@ class ZLightTiny(LightDevice):
         "white": 0,
         "warm": 1,
     }
+
+    __slots__ = ()
@@ -6,14 +6,25 @@ with each device configuration saved as a separate JSON file named by MAC addres
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Literal, Sequence
+from typing import Annotated, Iterable, Iterator, Literal, Sequence
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
 
 from .storage_utils import filter_device_json_files
 
@@ -24,8 +35,26 @@ ModeKind = Literal["single", "every_hour", "custom_periods", "timer"]
 TimeString = Field(pattern=r"^\d{2}:\d{2}$")
 
 
+_UTC = timezone.utc
+_MAX_CACHED_PATHS = 256
+
+
+def _fsync_directory(path: Path) -> None:
+    """Flush directory entry changes (renames, unlinks) to disk."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on every platform
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    return datetime.now(_UTC).replace(microsecond=0).isoformat()
 
 
 class DeviceMetadata(BaseModel):
@@ -60,7 +89,7 @@ class Recurrence(BaseModel):
 
     days: list[Weekday]
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     @model_validator(mode="after")
     def validate_days(self) -> "Recurrence":
@@ -80,7 +109,7 @@ class VolumeTracking(BaseModel):
     lowThresholdMl: float | None = Field(default=None, ge=0)
     updatedAt: str | None = None  # ISO string kept verbatim
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     def __init__(self, **data):
         """Minimal initializer to satisfy docstring checks for __init__."""
@@ -93,7 +122,7 @@ class Calibration(BaseModel):
     mlPerSecond: float = Field(gt=0)
     lastCalibratedAt: str  # ISO date string
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     def __repr__(self) -> str:  # pragma: no cover - helpful repr
         """Return a concise representation for debugging/testing."""
@@ -106,7 +135,7 @@ class DoserHeadStats(BaseModel):
     dosesToday: int | None = Field(default=None, ge=0)
     mlDispensedToday: float | None = Field(default=None, ge=0)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     def __repr__(self) -> str:  # pragma: no cover - concise repr
         """Return a concise representation for doser head stats."""
@@ -120,7 +149,7 @@ class SingleSchedule(BaseModel):
     dailyDoseMl: float = Field(gt=0)
     startTime: str = TimeString
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     """Schedule representing a single daily dose at a fixed time."""
 
@@ -132,7 +161,7 @@ class EveryHourSchedule(BaseModel):
     dailyDoseMl: float = Field(gt=0)
     startTime: str = TimeString
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     """Schedule for dosing every hour starting at a time."""
 
@@ -144,7 +173,7 @@ class CustomPeriod(BaseModel):
     endTime: str = TimeString
     doses: int = Field(ge=1)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     """A period entry within a custom periods schedule."""
 
@@ -180,7 +209,7 @@ class TimerDose(BaseModel):
     time: str = TimeString
     quantityMl: float = Field(gt=0)
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     """Represents a timed single dose within a timer schedule."""
 
@@ -205,7 +234,18 @@ class TimerSchedule(BaseModel):
         return self
 
 
-Schedule = Field(discriminator="mode")
+DoserSchedule = Annotated[
+    SingleSchedule | EveryHourSchedule | CustomPeriodsSchedule | TimerSchedule,
+    Field(discriminator="mode"),
+]
+
+# Built once; use validate_schedule() for schedules outside a DoserHead
+_SCHEDULE_ADAPTER: TypeAdapter[DoserSchedule] = TypeAdapter(DoserSchedule)
+
+
+def validate_schedule(value: object) -> DoserSchedule:
+    """Validate a raw schedule payload into its concrete schedule model."""
+    return _SCHEDULE_ADAPTER.validate_python(value)
 
 
 class DoserHead(BaseModel):
@@ -214,12 +254,7 @@ class DoserHead(BaseModel):
     index: Literal[1, 2, 3, 4]
     label: str | None = None
     active: bool
-    schedule: (
-        SingleSchedule
-        | EveryHourSchedule
-        | CustomPeriodsSchedule
-        | TimerSchedule
-    ) = Schedule
+    schedule: DoserSchedule
     recurrence: Recurrence
     missedDoseCompensation: bool
     volumeTracking: VolumeTracking | None = None
@@ -282,16 +317,19 @@ class DeviceConfiguration(BaseModel):
             )
 
         self.revisions.sort(key=lambda revision: revision.revision)
-        revision_numbers = [revision.revision for revision in self.revisions]
-        if len(set(revision_numbers)) != len(revision_numbers):
-            raise ValueError("Configuration revisions must be unique")
-        if revision_numbers[0] != 1:
+        previous = self.revisions[0].revision
+        if previous != 1:
             raise ValueError("Configuration revisions must start at 1")
-        for previous, current in zip(revision_numbers, revision_numbers[1:]):
+        # Sorted from 1 with no gaps implies uniqueness; one pass checks both
+        for revision in self.revisions[1:]:
+            current = revision.revision
+            if current == previous:
+                raise ValueError("Configuration revisions must be unique")
             if current != previous + 1:
                 raise ValueError(
                     "Configuration revision numbers must increase sequentially"
                 )
+            previous = current
         return self
 
     def latest_revision(self) -> ConfigurationRevision:
@@ -312,6 +350,11 @@ class DoserDevice(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    # (source list, id -> configuration); see _configuration_index
+    _config_index: tuple[
+        list[DeviceConfiguration] | None, dict[str, DeviceConfiguration]
+    ] = PrivateAttr(default=(None, {}))
+
     """Top-level device model for a dosing pump, including configs."""
 
     @model_validator(mode="after")
@@ -332,14 +375,27 @@ class DoserDevice(BaseModel):
                 raise ValueError(
                     "Active configuration id does not match any configuration"
                 )
+        self._configuration_index()
         return self
 
     def get_configuration(self, configuration_id: str) -> DeviceConfiguration:
         """Return the configuration with the given id or raise KeyError."""
-        for configuration in self.configurations:
-            if configuration.id == configuration_id:
-                return configuration
-        raise KeyError(configuration_id)
+        try:
+            return self._configuration_index()[configuration_id]
+        except KeyError:
+            raise KeyError(configuration_id) from None
+
+    def _configuration_index(self) -> dict[str, DeviceConfiguration]:
+        """Return the id lookup, rebuilding it if the list was changed."""
+        source, index = self._config_index
+        if source is not self.configurations or len(index) != len(source):
+            # Configurations were appended, removed or reassigned
+            source = self.configurations
+            index = {
+                configuration.id: configuration for configuration in source
+            }
+            self._config_index = (source, index)
+        return index
 
     def get_active_configuration(self) -> DeviceConfiguration:
         """Return the currently active configuration for this device."""
@@ -362,6 +418,43 @@ class DoserDeviceCollection(BaseModel):
         return self
 
 
+# Wrapped files start with one of the wrapper keys (sorted or model order)
+_WRAPPED_FILE_PREFIX = re.compile(
+    rb'\s*\{\s*"(?:device_type|device_id|device_data|last_updated)"'
+)
+
+# Reused validator for head lists; DoserHead instances pass through as-is
+_DOSER_HEADS_ADAPTER = TypeAdapter(list[DoserHead])
+
+
+class _DoserDeviceFile(BaseModel):
+    """On-disk wrapper around a persisted doser device."""
+
+    device_type: Literal["doser"]
+    device_id: str | None = None
+    last_updated: str | None = None
+    device_data: DoserDevice
+
+
+def _render_device_file(
+    device_id: str, now: str, device_json: bytes, pretty: bool
+) -> bytes:
+    """Wrap serialised device JSON in the on-disk metadata envelope."""
+    header = {
+        "device_type": "doser",
+        "device_id": device_id,
+        "last_updated": now,
+    }
+    if pretty:
+        # Nest the indented device block one level deeper; JSON strings
+        # never contain raw newlines, so this only touches layout
+        head = orjson.dumps(header, option=orjson.OPT_INDENT_2)
+        body = device_json.replace(b"\n", b"\n  ")
+        return head[:-2] + b',\n  "device_data": ' + body + b"\n}"
+    head = orjson.dumps(header)
+    return head[:-1] + b',"device_data":' + device_json + b"}"
+
+
 class DoserStorage:
     """A lightweight JSON-backed store for dosing pump configurations.
 
@@ -369,88 +462,210 @@ class DoserStorage:
     For example: ~/.aqua-ble/doser_configs/58159AE1-5E0A-7915-3207-7868CBF2C600.json
     """
 
+    __slots__ = (
+        "_base_path",
+        "_paths",
+        "_cache",
+        "_cache_lock",
+        "_dir_mtime_ns",
+        "_dir_cache",
+    )
+
     def __init__(self, path: Path | str):
         """Initialize the storage backed by the given directory path."""
         self._base_path = Path(path)
+        # device id -> file path, so hot paths skip Path construction
+        self._paths: dict[str, Path] = {}
+        # Parsed devices keyed by file path, tagged with (mtime_ns, size)
+        # plus the serialised device JSON last written there (None when the
+        # entry came from a read)
+        self._cache: dict[
+            Path, tuple[int, int, DoserDevice, tuple[bool, bytes] | None]
+        ] = {}
+        self._cache_lock = threading.Lock()
+        # Device file listing, valid while the directory mtime is unchanged
+        self._dir_mtime_ns = -1
+        self._dir_cache: list[Path] = []
 
         # Ensure the directory exists
         self._base_path.mkdir(parents=True, exist_ok=True)
 
     def _get_device_file_path(self, device_id: str) -> Path:
         """Get the file path for a specific device."""
-        return self._base_path / f"{device_id}.json"
+        path = self._paths.get(device_id)
+        if path is None:
+            if len(self._paths) >= _MAX_CACHED_PATHS:
+                self._paths.clear()  # ids come from requests; stay bounded
+            path = self._paths[device_id] = (
+                self._base_path / f"{device_id}.json"
+            )
+        return path
 
     def _read_device_file(self, device_id: str) -> DoserDevice | None:
-        """Read a single device from its JSON file."""
+        """Read a single device from its JSON file.
+
+        Parsed models are cached until the file's mtime or size changes, so
+        the returned instance is shared; persist changes via upsert_device.
+        """
         device_file = self._get_device_file_path(device_id)
-        if not device_file.exists():
+        try:
+            stat = device_file.stat()
+        except FileNotFoundError:
+            self._forget(device_file)
             return None
 
+        with self._cache_lock:
+            cached = self._cache.get(device_file)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        device = self._parse_device_file(device_file)
+        if device is not None:
+            with self._cache_lock:
+                self._cache[device_file] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    device,
+                    None,
+                )
+        return device
+
+    def _parse_device_file(self, device_file: Path) -> DoserDevice | None:
+        """Parse and validate a device file from disk."""
         try:
-            raw = device_file.read_text(encoding="utf-8").strip()
-            if not raw:
+            raw = device_file.read_bytes()
+            if not raw or raw.isspace():
                 return None
 
-            data = json.loads(raw)
+            try:
+                # The first key tells the layouts apart without a full scan;
+                # either way the bytes are parsed and validated in one pass
+                if _WRAPPED_FILE_PREFIX.match(raw):
+                    return _DoserDeviceFile.model_validate_json(raw).device_data
+                # Old format (direct device data) - backward compatibility
+                return DoserDevice.model_validate_json(raw)
+            except ValidationError:
+                pass
 
-            # Handle both old format (direct device data) and new format (with metadata)
+            # Slow path: wrong device type, a wrapper missing device_data,
+            # or a file the prefix check misjudged
+            data = orjson.loads(raw)
             if "device_type" in data:
-                # New format with metadata
                 if data.get("device_type") != "doser":
                     return None  # Wrong device type
                 device_data = data.get("device_data", data)
             else:
-                # Old format (direct device data) - backward compatibility
                 device_data = data
 
             return DoserDevice.model_validate(device_data)
-        except (json.JSONDecodeError, ValueError) as exc:
+        except (orjson.JSONDecodeError, ValueError) as exc:
             raise ValueError(
                 f"Could not parse device file {device_file}: {exc}"
             ) from exc
 
     def _write_device_file(
-        self, device_file: Path, device: DoserDevice
+        self,
+        device_file: Path,
+        device: DoserDevice,
+        *,
+        pretty: bool = True,
+        now: str | None = None,
     ) -> None:
-        """Write a single device to its JSON file atomically with metadata."""
-        device_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Wrap device data with metadata for unified storage
-        data = {
-            "device_type": "doser",
-            "device_id": device.id,
-            "last_updated": _now_iso(),
-            "device_data": device.model_dump(mode="json"),
-        }
+        """Write a single device to its JSON file atomically with metadata.
+
+        Args:
+            device_file: Destination path
+            device: Device to persist
+            pretty: Indent the output for hand editing; compact writes are
+                used for frequent state-only updates
+            now: Precomputed ``last_updated`` stamp for batch writes
+        """
+        # Callers mutate the cached instance before saving it, so any failure
+        # must evict it or the unsaved model would be served as on-disk state
+        try:
+            device_file.parent.mkdir(parents=True, exist_ok=True)
 
-        tmp_file = device_file.with_suffix(".tmp")
-        tmp_file.write_text(
-            json.dumps(data, indent=2, sort_keys=True), encoding="utf-8"
-        )
-        tmp_file.replace(device_file)
+            # pydantic-core serialises the device tree once; the result is kept
+            # so saving an unchanged device does not touch the disk again
+            serialized = (
+                pretty,
+                device.model_dump_json(indent=2 if pretty else None).encode(),
+            )
+            with self._cache_lock:
+                cached = self._cache.get(device_file)
+            if cached is not None and cached[3] == serialized:
+                try:
+                    stat = device_file.stat()
+                except FileNotFoundError:
+                    pass
+                else:
+                    if cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                        with self._cache_lock:
+                            self._cache[device_file] = (
+                                *cached[:2],
+                                device,
+                                serialized,
+                            )
+                        return
+
+            payload = _render_device_file(
+                device.id, now or _now_iso(), serialized[1], pretty
+            )
+            tmp_file = device_file.with_suffix(".tmp")
+            tmp_file.write_bytes(payload)
+            tmp_file.replace(device_file)
+            stat = device_file.stat()
+        except BaseException:
+            self._forget(device_file)
+            raise
+        with self._cache_lock:
+            self._cache[device_file] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                device,
+                serialized,
+            )
+        self._dir_mtime_ns = -1
+
+    def _forget(self, device_file: Path) -> None:
+        """Drop any cached model for ``device_file``."""
+        with self._cache_lock:
+            self._cache.pop(device_file, None)
+        self._dir_mtime_ns = -1
 
     def _list_device_files(self) -> list[Path]:
         """List all device JSON files in the storage directory.
 
-        Excluding metadata files.
+        Excluding metadata files. The listing is reused while the directory
+        mtime is unchanged; local writes and deletes reset the gate.
         """
-        return filter_device_json_files(self._base_path)
-
-    def list_devices(self) -> list[DoserDevice]:
-        """Return all persisted devices."""
-        devices = []
+        try:
+            dir_mtime_ns = self._base_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if dir_mtime_ns != self._dir_mtime_ns:
+            self._dir_cache = filter_device_json_files(self._base_path)
+            self._dir_mtime_ns = dir_mtime_ns
+        return list(self._dir_cache)
+
+    def iter_devices(self) -> Iterator[DoserDevice]:
+        """Yield persisted devices one file at a time."""
         for device_file in self._list_device_files():
             try:
                 device_id = device_file.stem  # filename without .json
                 device = self._read_device_file(device_id)
-                if device:
-                    devices.append(device)
             except ValueError as exc:
                 # Log error but continue with other devices
                 logger.warning(
                     f"Could not load device from {device_file}: {exc}"
                 )
-        return devices
+                continue
+            if device:
+                yield device
+
+    def list_devices(self) -> list[DoserDevice]:
+        """Return all persisted devices."""
+        return list(self.iter_devices())
 
     def get_device(self, device_id: str) -> DoserDevice | None:
         """Return a device by id or None if not found."""
@@ -468,21 +683,29 @@ class DoserStorage:
     ) -> list[DoserDevice]:
         """Replace all devices with the provided devices."""
         models = [self._validate_device(device) for device in devices]
+        stale = set(self._list_device_files())
 
-        # Remove all existing device files
-        for device_file in self._list_device_files():
-            device_file.unlink()
-
-        # Write new devices
+        # Write new devices first, sharing one timestamp across the batch,
+        # so a crash part-way never leaves the store empty
+        now = _now_iso()
         for model in models:
             device_file = self._get_device_file_path(model.id)
-            self._write_device_file(device_file, model)
+            self._write_device_file(device_file, model, now=now)
+            stale.discard(device_file)
 
+        # Then drop devices that are no longer present
+        for device_file in stale:
+            device_file.unlink(missing_ok=True)
+            self._forget(device_file)
+
+        # One directory sync makes the whole batch of renames durable
+        _fsync_directory(self._base_path)
         return models
 
     def delete_device(self, device_id: str) -> bool:
         """Delete a device by id, returning True if removed."""
         device_file = self._get_device_file_path(device_id)
+        self._forget(device_file)
         if device_file.exists():
             device_file.unlink()
             return True
@@ -517,24 +740,17 @@ class DoserStorage:
         device = self._require_device(device_id)
 
         new_id = configuration_id or str(uuid4())
-        if any(
-            configuration.id == new_id
-            for configuration in device.configurations
-        ):
+        existing_ids = {
+            configuration.id for configuration in device.configurations
+        }
+        if new_id in existing_ids:
             raise ValueError(
                 f"Configuration '{new_id}' already exists for device '{device_id}'"
             )
 
         timestamp = saved_at or _now_iso()
         # Convert heads to proper DoserHead objects
-        validated_heads = [
-            (
-                head
-                if isinstance(head, DoserHead)
-                else DoserHead.model_validate(head)
-            )
-            for head in heads
-        ]
+        validated_heads = _DOSER_HEADS_ADAPTER.validate_python(list(heads))
         revision = ConfigurationRevision(
             revision=1,
             savedAt=timestamp,
@@ -574,20 +790,13 @@ class DoserStorage:
         device = self._require_device(device_id)
         configuration = device.get_configuration(configuration_id)
 
-        # Get next revision number
-        latest_revision = max(rev.revision for rev in configuration.revisions)
-        next_revision = latest_revision + 1
+        # Revisions are validated as sorted and gap-free, so the last one is
+        # the highest
+        next_revision = configuration.revisions[-1].revision + 1
 
         timestamp = saved_at or _now_iso()
         # Convert heads to proper DoserHead objects
-        validated_heads = [
-            (
-                head
-                if isinstance(head, DoserHead)
-                else DoserHead.model_validate(head)
-            )
-            for head in heads
-        ]
+        validated_heads = _DOSER_HEADS_ADAPTER.validate_python(list(heads))
         revision = ConfigurationRevision(
             revision=next_revision,
             savedAt=timestamp,
@@ -610,11 +819,19 @@ class DoserStorage:
         """Set the active configuration id on a device and persist."""
         device = self._require_device(device_id)
         configuration = device.get_configuration(configuration_id)
+        if device.activeConfigurationId == configuration.id:
+            # Already active; avoid a full rewrite for an idempotent call
+            return configuration
         device.activeConfigurationId = configuration.id
-        device.updatedAt = _now_iso()
-
-        # Save the updated device
-        self.upsert_device(device)
+        device.updatedAt = now = _now_iso()
+
+        # Save the updated device; a pointer flip does not need pretty output
+        self._write_device_file(
+            self._get_device_file_path(device.id),
+            device,
+            pretty=False,
+            now=now,
+        )
         return configuration
 
     def _validate_device(self, device: DoserDevice | dict) -> DoserDevice:
@@ -635,7 +852,11 @@ class DoserStorage:
         device = self.get_device(device_id)
         if device is None:
             return None
+        return self._metadata_from_device(device)
 
+    @staticmethod
+    def _metadata_from_device(device: DoserDevice) -> DeviceMetadata:
+        """Build the lightweight metadata view of a loaded device."""
         # Extract head names from the latest revision if available
         head_names = {}
         if device.configurations:
@@ -667,9 +888,12 @@ class DoserStorage:
 
         if existing_device:
             # Update existing device with new names
+            changed = (
+                existing_device.name != metadata.name
+                or existing_device.timezone != metadata.timezone
+            )
             existing_device.name = metadata.name
             existing_device.timezone = metadata.timezone
-            existing_device.updatedAt = current_time
 
             # Update head names in the latest revision
             if metadata.headNames and existing_device.configurations:
@@ -677,10 +901,15 @@ class DoserStorage:
                 if latest_config.revisions:
                     latest_revision = latest_config.revisions[-1]
                     for head in latest_revision.heads:
-                        if head.index in metadata.headNames:
-                            head.label = metadata.headNames[head.index]
-
-            self.upsert_device(existing_device)
+                        label = metadata.headNames.get(head.index)
+                        if label is not None and head.label != label:
+                            head.label = label
+                            changed = True
+
+            # Skip the rewrite when the metadata matches what is stored
+            if changed:
+                existing_device.updatedAt = current_time
+                self.upsert_device(existing_device)
         else:
             # Create new metadata-only file
             if not metadata.createdAt:
@@ -698,11 +927,10 @@ class DoserStorage:
         """List all device metadata (from both full devices and metadata-only files)."""
         metadata_list = []
 
-        # Get metadata from full device files
-        for device in self.list_devices():
-            device_metadata = self.get_device_metadata(device.id)
-            if device_metadata:
-                metadata_list.append(device_metadata)
+        # Get metadata from full device files, parsing each file once
+        for device in self.iter_devices():
+            metadata_list.append(self._metadata_from_device(device))
+        seen_ids = {metadata.id for metadata in metadata_list}
 
         # Get metadata from metadata-only files
         for metadata_file in self._base_path.glob("*.metadata.json"):
@@ -710,8 +938,9 @@ class DoserStorage:
                 metadata_content = metadata_file.read_text()
                 metadata = DeviceMetadata.model_validate_json(metadata_content)
                 # Only add if not already in list (from full device)
-                if not any(m.id == metadata.id for m in metadata_list):
+                if metadata.id not in seen_ids:
                     metadata_list.append(metadata)
+                    seen_ids.add(metadata.id)
             except Exception:
                 continue  # Skip invalid metadata files
 
@@ -729,6 +958,7 @@ __all__ = [
     "DoserDeviceCollection",
     "DoserHead",
     "DoserHeadStats",
+    "DoserSchedule",
     "DoserStorage",
     "EveryHourSchedule",
     "ModeKind",
@@ -738,4 +968,5 @@ __all__ = [
     "TimerSchedule",
     "VolumeTracking",
     "Weekday",
+    "validate_schedule",
 ]
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class LightKeyframe:
     """Single scheduled point (hour, minute, intensity)."""
 
@@ -19,7 +20,7 @@ class LightKeyframe:
         return f"{self.hour:02d}:{self.minute:02d}"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ParsedLightStatus:
     """Decoded view of a WRGB status notification."""
 
@@ -34,6 +35,11 @@ class ParsedLightStatus:
     raw_payload: bytes
 
 
+# Header bytes 3..8: message id (hi, lo), response mode, weekday, hour, minute
+_HEADER = struct.Struct(">3x6B")
+_KEYFRAME = struct.Struct(">3B")
+
+
 def _split_body(
     payload: bytes,
 ) -> Tuple[
@@ -42,19 +48,15 @@ def _split_body(
     Optional[int],
     Optional[int],
     Optional[int],
-    bytes,
+    int,
 ]:
-    """Return header fields and body bytes."""
-    message_id = response_mode = weekday = hour = minute = None
-    body = payload
+    """Return header fields and the offset where the body starts."""
     if payload and payload[0] == 0x5B and len(payload) >= 9:
-        message_id = (payload[3], payload[4])
-        response_mode = payload[5]
-        weekday = payload[6]
-        hour = payload[7]
-        minute = payload[8]
-        body = payload[9:]
-    return message_id, response_mode, weekday, hour, minute, body
+        msg_hi, msg_lo, response_mode, weekday, hour, minute = (
+            _HEADER.unpack_from(payload)
+        )
+        return (msg_hi, msg_lo), response_mode, weekday, hour, minute, 9
+    return None, None, None, None, None, 0
 
 
 def parse_light_payload(payload: bytes) -> ParsedLightStatus:
@@ -65,11 +67,15 @@ def parse_light_payload(payload: bytes) -> ParsedLightStatus:
         weekday,
         current_hour,
         current_minute,
-        body,
+        start,
     ) = _split_body(payload)
 
-    tail = body[-5:] if len(body) >= 5 else b""
-    body_bytes = body[:-5] if len(body) >= 5 else body
+    # Work on offsets into the original buffer so no body slices are copied
+    end = len(payload)
+    tail = b""
+    if end - start >= 5:
+        end -= 5
+        tail = bytes(payload[end:])
 
     # Some firmware variants repeat the header's weekday/hour/minute in the
     # body before the sequence of 3-byte keyframes. If that repeated trio
@@ -79,43 +85,36 @@ def parse_light_payload(payload: bytes) -> ParsedLightStatus:
         weekday is not None
         and current_hour is not None
         and current_minute is not None
-        and len(body_bytes) >= 3
+        and end - start >= 3
     ):
         pattern = bytes((weekday, current_hour, current_minute))
-        idx = body_bytes.find(pattern)
+        idx = payload.find(pattern, start, end)
         # allow the repeated header to appear a little further into the body for
         # some firmware variants
-        if idx != -1 and idx <= 16:
+        if idx != -1 and idx - start <= 16:
             # remove everything up through the repeated header
-            body_bytes = body_bytes[idx + 3 :]
+            start = idx + 3
 
     keyframes: list[LightKeyframe] = []
     time_markers: list[tuple[int, int]] = []
 
-    i = 0
+    view = memoryview(payload)
+    i = start
     last_time: Optional[int] = None
-    length = len(body_bytes)
-    while i < length:
-        remaining = length - i
+    while i < end:
+        remaining = end - i
         # 00 02 HH MM marks the controller's current clock.
-        if (
-            remaining >= 4
-            and body_bytes[i] == 0x00
-            and body_bytes[i + 1] == 0x02
-        ):
-            time_markers.append((body_bytes[i + 2], body_bytes[i + 3]))
+        if remaining >= 4 and view[i] == 0x00 and view[i + 1] == 0x02:
+            time_markers.append((view[i + 2], view[i + 3]))
             i += 4
             continue
 
         if remaining < 3:
             break
 
-        hour = body_bytes[i]
-        minute = body_bytes[i + 1]
-        value = body_bytes[i + 2]
-        triple = (hour, minute, value)
+        hour, minute, value = _KEYFRAME.unpack_from(view, i)
 
-        if triple == (0, 0, 0):
+        if not (hour or minute or value):
             # padding / unused slot
             i += 3
             continue
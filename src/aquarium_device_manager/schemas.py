@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import time as _time
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
@@ -10,6 +11,14 @@ from pydantic import BaseModel, Field, field_validator
 from .commands import LightWeekday
 
 
+@lru_cache(maxsize=None)
+def _weekday_lookup(enum_cls) -> dict[str, Any]:
+    """Return a lower-cased member-name table for a weekday enum."""
+    return {
+        name.lower(): member for name, member in enum_cls.__members__.items()
+    }
+
+
 def _normalize_weekdays_generic(
     value: Any, enum_cls, default_if_none: Any = None
 ) -> Any:
@@ -28,17 +37,19 @@ def _normalize_weekdays_generic(
     if isinstance(value, (set, tuple)):
         value = list(value)
     if isinstance(value, list):
+        if all(isinstance(item, enum_cls) for item in value):
+            return list(value)
+        by_name = _weekday_lookup(enum_cls)
         parsed: list[object] = []
         for item in value:
             if isinstance(item, enum_cls):
                 parsed.append(item)
                 continue
             if isinstance(item, str):
-                name = item.strip().lower()
                 try:
-                    parsed.append(getattr(enum_cls, name))
+                    parsed.append(by_name[item.strip().lower()])
                     continue
-                except AttributeError as exc:
+                except KeyError as exc:
                     raise ValueError(f"Unknown weekday '{item}'") from exc
             if isinstance(item, int):
                 try:
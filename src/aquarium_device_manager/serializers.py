@@ -5,7 +5,6 @@ These convert internal dataclasses into JSON-safe primitives.
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Any, Dict
 
 from .doser_status import DoserStatus
@@ -18,24 +17,32 @@ def serialize_doser_status(status: DoserStatus) -> Dict[str, Any]:
     Notes:
     - The top-level CachedStatus already carries the raw_payload as hex.
       To avoid duplication, we omit raw_payload from the nested parsed dict.
+    - Fields are listed explicitly rather than via ``asdict`` so each refresh
+      skips the recursive deep copy.
     """
-    data = asdict(status)
-    # Remove raw_payload from parsed to avoid duplication and non-JSON bytes
-    if "raw_payload" in data:
-        data.pop("raw_payload", None)
-    # Convert remaining byte fields to hex strings
-    data["tail_raw"] = status.tail_raw.hex()
-    # Enrich per-head data with hex-encoded extras and human-friendly mode name
-    for head_dict, head_obj in zip(data["heads"], status.heads):
-        head_dict["extra"] = bytes(head_dict["extra"]).hex()
-        # Include a friendly mode label alongside the numeric mode
-        try:
-            head_dict["mode_label"] = head_obj.mode_label()
-        except (
-            Exception
-        ):  # pragma: no cover - defensive; mode_label should exist
-            head_dict["mode_label"] = f"0x{head_dict.get('mode', 0):02X}"
-    return data
+    return {
+        "message_id": status.message_id,
+        "response_mode": status.response_mode,
+        "weekday": status.weekday,
+        "hour": status.hour,
+        "minute": status.minute,
+        # Per-head data with hex-encoded extras and a friendly mode name
+        "heads": [
+            {
+                "mode": head.mode,
+                "hour": head.hour,
+                "minute": head.minute,
+                "dosed_tenths_ml": head.dosed_tenths_ml,
+                "extra": bytes(head.extra).hex(),
+                "mode_label": head.mode_label(),
+            }
+            for head in status.heads
+        ],
+        "tail_targets": list(status.tail_targets),
+        "tail_flag": status.tail_flag,
+        "tail_raw": status.tail_raw.hex(),
+        "lifetime_totals_tenths_ml": list(status.lifetime_totals_tenths_ml),
+    }
 
 
 def serialize_light_status(status: ParsedLightStatus) -> Dict[str, Any]:
@@ -56,7 +63,9 @@ def serialize_light_status(status: ParsedLightStatus) -> Dict[str, Any]:
         # original fields for backward compatibility.
         "keyframes": [
             {
-                **asdict(frame),
+                "hour": frame.hour,
+                "minute": frame.minute,
+                "value": frame.value,
                 "percent": (
                     int(round(frame.value))
                     if frame.value is not None and frame.value <= 100
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, Response
 
 # Ensure the implementation module picks up any env override when this
@@ -46,9 +47,13 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         await service.stop()
+        await spa.aclose_dev_clients()
 
 
 app = FastAPI(title="Aquarium BLE Service", lifespan=lifespan)
+# Status snapshots and schedules are repetitive JSON that shrinks well;
+# small bodies are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
 
 
 # Health check endpoint for container monitoring
@@ -57,8 +62,7 @@ async def health_check():
     """Health check endpoint for Docker/HA monitoring."""
     try:
         # Basic service availability check
-        cached_statuses = service.get_status_snapshot()
-        device_count = len(cached_statuses)
+        device_count = service.cached_device_count()
         return {
             "status": "healthy",
             "service": "aquarium-device-manager",
@@ -94,16 +98,13 @@ spa.mount_assets(app)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def serve_spa() -> Response:
+async def serve_spa(request: Request) -> Response:
     """Serve SPA index or proxy to dev server; mirrors legacy behavior for tests."""
     # Use local constants to support monkeypatching in tests
     if SPA_DIST_AVAILABLE:
-        primary_path = FRONTEND_DIST / PRIMARY_ENTRY
-        if primary_path.exists():
-            return HTMLResponse(primary_path.read_text(encoding="utf-8"))
-        legacy_path = FRONTEND_DIST / LEGACY_ENTRY
-        if legacy_path.exists():
-            return HTMLResponse(legacy_path.read_text(encoding="utf-8"))
+        entry = await spa._read_entry(FRONTEND_DIST)
+        if entry is not None:
+            return spa.entry_response(entry, request)
     proxied = await _proxy_dev_server(f"/{PRIMARY_ENTRY}")
     if proxied is not None:
         return proxied
@@ -124,16 +125,11 @@ app.include_router(configurations_router)
 
 
 @app.get("/{spa_path:path}", include_in_schema=False)
-async def serve_spa_assets(spa_path: str) -> Response:
+async def serve_spa_assets(spa_path: str, request: Request) -> Response:
     """Serve SPA assets or proxy; mirrors legacy behavior for tests."""
     if not spa_path:
         raise HTTPException(status_code=404)
-    first_segment = spa_path.split("/", 1)[0]
-    if first_segment in {"api", "ui", "debug"} or spa_path in {
-        "docs",
-        "redoc",
-        "openapi.json",
-    }:
+    if spa.is_reserved_path(spa_path):
         raise HTTPException(status_code=404)
     if not SPA_DIST_AVAILABLE:
         proxied = await _proxy_dev_server(f"/{spa_path}")
@@ -141,11 +137,9 @@ async def serve_spa_assets(spa_path: str) -> Response:
             return proxied
         raise HTTPException(status_code=404, detail="SPA bundle unavailable")
     asset_path = FRONTEND_DIST / spa_path
-    if asset_path.is_file():
-        # FileResponse takes a path; FastAPI will set .path attribute for tests
-        from fastapi.responses import FileResponse as _FileResponse
-
-        return _FileResponse(asset_path)
+    asset_response = spa.file_asset_response(asset_path, spa_path, request)
+    if asset_response is not None:
+        return asset_response
     if asset_path.is_dir():
         index_path = asset_path / "index.html"
         if index_path.is_file():
@@ -154,30 +148,54 @@ async def serve_spa_assets(spa_path: str) -> Response:
             return _FileResponse(index_path)
     if "." in spa_path:
         raise HTTPException(status_code=404)
-    primary_path = FRONTEND_DIST / PRIMARY_ENTRY
-    if primary_path.exists():
-        return HTMLResponse(primary_path.read_text(encoding="utf-8"))
-    legacy_path = FRONTEND_DIST / LEGACY_ENTRY
-    if legacy_path.exists():
-        return HTMLResponse(legacy_path.read_text(encoding="utf-8"))
+    entry = await spa._read_entry(FRONTEND_DIST)
+    if entry is not None:
+        return spa.entry_response(entry, request)
     raise HTTPException(status_code=404)
 
 
 def main() -> None:  # pragma: no cover - thin CLI wrapper
     """Run the FastAPI service under Uvicorn."""
+    import importlib.util
+
     import uvicorn
 
-    from .config_migration import get_env_with_fallback
+    from .config_migration import (
+        get_env_bool,
+        get_env_int,
+        get_env_with_fallback,
+    )
 
     host = (
         get_env_with_fallback("AQUA_BLE_SERVICE_HOST", "0.0.0.0") or "0.0.0.0"
     )
     port = int(get_env_with_fallback("AQUA_BLE_SERVICE_PORT", "8000") or "8000")
+    workers = max(1, get_env_int("AQUA_BLE_WORKERS", 1))
+    backlog = get_env_int("AQUA_BLE_BACKLOG", 2048)
+    limit_concurrency = get_env_int("AQUA_BLE_LIMIT_CONCURRENCY", 0) or None
+    if workers > 1 and not get_env_bool("AQUA_BLE_ALLOW_MULTIWORKER", False):
+        # Each worker would own its own BLE connections and state file
+        _ble_impl.logger.warning(
+            "AQUA_BLE_WORKERS=%d ignored: BLE state requires a single "
+            "process (set AQUA_BLE_ALLOW_MULTIWORKER=1 to override)",
+            workers,
+        )
+        workers = 1
+
+    # uvicorn[standard] ships uvloop and httptools on supported platforms;
+    # request them explicitly so a missing wheel is a visible fallback.
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
 
     uvicorn.run(
         "aquarium_device_manager.service:app",
         host=host,
         port=port,
+        loop=loop,
+        http=http,
+        workers=workers,
+        backlog=backlog,
+        limit_concurrency=limit_concurrency,
     )
 
 
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import mimetypes
+import stat
+from collections import OrderedDict
+from email.utils import formatdate
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import httpx
-from fastapi import HTTPException
-from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi import HTTPException, Request
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
+from starlette.background import BackgroundTask
 
-from .config_migration import get_env_with_fallback
+from .config_migration import get_env_bool, get_env_with_fallback
 
 PACKAGE_ROOT = Path(__file__).resolve().parent
 DEFAULT_FRONTEND_DIST = PACKAGE_ROOT.parent.parent / "frontend" / "dist"
@@ -22,6 +34,12 @@ SPA_DIST_AVAILABLE = FRONTEND_DIST.exists()
 
 PRIMARY_ENTRY = "modern.html"
 LEGACY_ENTRY = "index.html"
+PRIMARY_ENTRY_PATH = FRONTEND_DIST / PRIMARY_ENTRY
+LEGACY_ENTRY_PATH = FRONTEND_DIST / LEGACY_ENTRY
+
+# Paths owned by the API/docs routes that must never fall back to the SPA
+RESERVED_FIRST_SEGMENTS = frozenset({"api", "ui", "debug"})
+RESERVED_EXACT_PATHS = frozenset({"docs", "redoc", "openapi.json"})
 
 SPA_UNAVAILABLE_MESSAGE = (
     "The TypeScript dashboard is unavailable. "
@@ -57,31 +75,236 @@ _HOP_HEADERS = {
 }
 
 
+# Entry HTML is an immutable build artifact; only re-check it on disk when
+# the frontend is being rebuilt underneath a running service.
+DEV_RELOAD = get_env_bool("AQUA_BLE_DEV_RELOAD", False) or get_env_bool(
+    "AQUA_BLE_SPA_STAT_REVALIDATE", False
+)
+
+
+class CachedEntry(NamedTuple):
+    """An SPA entry document with its weak validator."""
+
+    body: bytes
+    etag: str
+
+
+_ENTRY_CACHE: dict[Path, tuple[int, CachedEntry | None]] = {}
+
+
+def cached_entry(path: Path) -> CachedEntry | None:
+    """Return an SPA entry file and its ETag, reading it once per process.
+
+    Returns None when the file does not exist; that answer is cached too, so
+    a missing primary entry does not cost a ``stat()`` per request. With
+    ``AQUA_BLE_DEV_RELOAD`` or ``AQUA_BLE_SPA_STAT_REVALIDATE`` set, every
+    lookup re-stats and a changed modification time reloads the file.
+    """
+    cached = _ENTRY_CACHE.get(path)
+    if cached is not None and not DEV_RELOAD:
+        return cached[1]
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        body = path.read_bytes()
+    except OSError:
+        _ENTRY_CACHE[path] = (-1, None)
+        return None
+    entry = CachedEntry(body, f'W/"{hashlib.sha1(body).hexdigest()}"')
+    _ENTRY_CACHE[path] = (mtime_ns, entry)
+    return entry
+
+
+async def load_entry(path: Path) -> CachedEntry | None:
+    """Async :func:`cached_entry` that keeps disk access off the event loop.
+
+    Warm hits are answered inline; only a cold miss (or a dev-reload
+    revalidation) runs the ``stat``/read in a worker thread.
+    """
+    cached = _ENTRY_CACHE.get(path)
+    if cached is not None and not DEV_RELOAD:
+        return cached[1]
+    return await asyncio.to_thread(cached_entry, path)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == target
+        for tag in if_none_match.split(",")
+    )
+
+
+def _is_not_modified(request: Request | None, etag: str) -> bool:
+    return request is not None and etag_matches(
+        request.headers.get("if-none-match"), etag
+    )
+
+
+def entry_response(
+    entry: CachedEntry, request: Request | None = None
+) -> Response:
+    """Return the entry HTML, or a bodiless 304 if the client has it.
+
+    The entry is not content-hashed, so clients must revalidate it each time.
+    """
+    headers = {"etag": entry.etag, "cache-control": "no-cache"}
+    if _is_not_modified(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(entry.body, headers=headers)
+
+
+# Small built files are held in memory so hot JS/CSS hits skip open/read.
+ASSET_CACHE_MAX_BYTES = 16 * 1024 * 1024
+ASSET_CACHE_MAX_FILE_BYTES = 256 * 1024
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedAsset(NamedTuple):
+    """A built asset held in memory with its precomputed headers."""
+
+    body: bytes
+    media_type: str
+    etag: str
+    headers: dict[str, str]
+
+
+_ASSET_CACHE: OrderedDict[Path, CachedAsset] = OrderedDict()
+_asset_cache_bytes = 0
+
+
+def _asset_headers(st, immutable: bool) -> dict[str, str]:
+    headers = {
+        "etag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "last-modified": formatdate(st.st_mtime, usegmt=True),
+    }
+    if immutable:
+        headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+    return headers
+
+
+def _cached_asset(
+    path: Path, st, headers: dict[str, str]
+) -> CachedAsset | None:
+    """Return the in-memory copy of ``path``, reading it on a miss.
+
+    Files above :data:`ASSET_CACHE_MAX_FILE_BYTES` are not cached; the least
+    recently used entries are evicted once the cache exceeds
+    :data:`ASSET_CACHE_MAX_BYTES`.
+    """
+    global _asset_cache_bytes
+
+    etag = headers["etag"]
+    cached = _ASSET_CACHE.get(path)
+    if cached is not None:
+        if cached.etag == etag:
+            _ASSET_CACHE.move_to_end(path)
+            return cached
+        del _ASSET_CACHE[path]
+        _asset_cache_bytes -= len(cached.body)
+    if st.st_size > ASSET_CACHE_MAX_FILE_BYTES:
+        return None
+
+    body = path.read_bytes()
+    asset = CachedAsset(
+        body=body,
+        media_type=mimetypes.guess_type(path.name)[0] or "text/plain",
+        etag=etag,
+        headers=headers,
+    )
+    _ASSET_CACHE[path] = asset
+    _asset_cache_bytes += len(body)
+    while _asset_cache_bytes > ASSET_CACHE_MAX_BYTES:
+        _, evicted = _ASSET_CACHE.popitem(last=False)
+        _asset_cache_bytes -= len(evicted.body)
+    return asset
+
+
+def file_asset_response(
+    path: Path, spa_path: str, request: Request | None = None
+) -> Response | None:
+    """Return a response for a built asset file, or None if it is not one.
+
+    A matching ``If-None-Match`` yields a bodiless 304. Otherwise small files
+    are served from memory and larger ones stream through ``FileResponse``
+    reusing the single ``stat()`` done here. Vite's content-hashed
+    ``assets/`` bundles are marked immutable.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    headers = _asset_headers(st, spa_path.startswith("assets/"))
+    if _is_not_modified(request, headers["etag"]):
+        return Response(status_code=304, headers=headers)
+    asset = _cached_asset(path, st, headers)
+    if asset is None:
+        return FileResponse(path, headers=headers, stat_result=st)
+    return Response(
+        content=asset.body,
+        media_type=asset.media_type,
+        headers=asset.headers,
+    )
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed bundles that browsers may keep forever."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        """Serve the file and mark successful responses as immutable."""
+        response = super().file_response(*args, **kwargs)
+        if response.status_code in (200, 304):
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
 def mount_assets(app) -> None:
     """Mount the '/assets' static path if a built SPA is available."""
     if SPA_DIST_AVAILABLE:
+        cached_entry(PRIMARY_ENTRY_PATH)
+        cached_entry(LEGACY_ENTRY_PATH)
         assets_dir = FRONTEND_DIST / "assets"
         if assets_dir.exists():
             app.mount(
                 "/assets",
-                StaticFiles(directory=str(assets_dir)),
+                ImmutableStaticFiles(directory=str(assets_dir)),
                 name="spa-assets",
             )
 
 
-def _read_entry(name: str) -> HTMLResponse | None:
-    entry_path = FRONTEND_DIST / name
-    if entry_path.exists():
-        return HTMLResponse(entry_path.read_text(encoding="utf-8"))
-    return None
+async def _read_entry(dist: Path | None = None) -> CachedEntry | None:
+    dist = FRONTEND_DIST if dist is None else dist
+    entry = await load_entry(dist / PRIMARY_ENTRY)
+    if entry is None:
+        entry = await load_entry(dist / LEGACY_ENTRY)
+    return entry
 
 
-async def serve_index_or_proxy() -> Response:
+def is_reserved_path(spa_path: str) -> bool:
+    """Return True if ``spa_path`` belongs to the API or docs routes."""
+    first_segment, slash, _ = spa_path.partition("/")
+    return first_segment in RESERVED_FIRST_SEGMENTS or (
+        not slash and spa_path in RESERVED_EXACT_PATHS
+    )
+
+
+async def serve_index_or_proxy(request: Request | None = None) -> Response:
     """Serve built index.html or proxy to a running dev server."""
     if SPA_DIST_AVAILABLE:
-        entry_response = _read_entry(PRIMARY_ENTRY) or _read_entry(LEGACY_ENTRY)
-        if entry_response is not None:
-            return entry_response
+        entry = await _read_entry()
+        if entry is not None:
+            return entry_response(entry, request)
     proxied = await _proxy_dev_server(f"/{PRIMARY_ENTRY}")
     if proxied is not None:
         return proxied
@@ -93,17 +316,14 @@ async def serve_index_or_proxy() -> Response:
     )
 
 
-async def serve_spa_asset(spa_path: str) -> Response:
+async def serve_spa_asset(
+    spa_path: str, request: Request | None = None
+) -> Response:
     """Serve a built asset or proxy/fallback appropriately for client routes."""
     if not spa_path:
         raise HTTPException(status_code=404)
 
-    first_segment = spa_path.split("/", 1)[0]
-    if first_segment in {"api"} or spa_path in {
-        "docs",
-        "redoc",
-        "openapi.json",
-    }:
+    if is_reserved_path(spa_path):
         raise HTTPException(status_code=404)
 
     if not SPA_DIST_AVAILABLE:
@@ -113,8 +333,9 @@ async def serve_spa_asset(spa_path: str) -> Response:
         raise HTTPException(status_code=404, detail="SPA bundle unavailable")
 
     asset_path = FRONTEND_DIST / spa_path
-    if asset_path.is_file():
-        return FileResponse(asset_path)
+    asset_response = file_asset_response(asset_path, spa_path, request)
+    if asset_response is not None:
+        return asset_response
 
     if asset_path.is_dir():
         index_path = asset_path / "index.html"
@@ -124,24 +345,51 @@ async def serve_spa_asset(spa_path: str) -> Response:
     if "." in spa_path:
         raise HTTPException(status_code=404)
 
-    entry_response = _read_entry(PRIMARY_ENTRY) or _read_entry(LEGACY_ENTRY)
-    if entry_response is not None:
-        return entry_response
+    entry = await _read_entry()
+    if entry is not None:
+        return entry_response(entry, request)
 
     raise HTTPException(status_code=404)
 
 
+DEV_SERVER_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20
+)
+_dev_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_dev_client(base_url: httpx.URL) -> httpx.AsyncClient:
+    """Return the pooled client for a dev server, creating it on first use."""
+    key = str(base_url)
+    client = _dev_clients.get(key)
+    if client is None or client.is_closed:
+        client = _dev_clients[key] = httpx.AsyncClient(
+            base_url=key, timeout=DEV_SERVER_TIMEOUT, limits=DEV_SERVER_LIMITS
+        )
+    return client
+
+
+async def aclose_dev_clients() -> None:
+    """Close the pooled dev-server clients; called on service shutdown."""
+    clients = list(_dev_clients.values())
+    _dev_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
 async def _proxy_dev_server(path: str) -> Optional[Response]:
     """Try to fetch a path from the Vite dev server if configured."""
     if not DEV_SERVER_CANDIDATES:
         return None
     normalized = path if path.startswith("/") else f"/{path}"
     for base_url in DEV_SERVER_CANDIDATES:
+        client = _get_dev_client(base_url)
         try:
-            async with httpx.AsyncClient(
-                base_url=str(base_url), timeout=DEV_SERVER_TIMEOUT
-            ) as client:
-                response = await client.get(normalized, follow_redirects=True)
+            response = await client.send(
+                client.build_request("GET", normalized),
+                stream=True,
+                follow_redirects=True,
+            )
         except httpx.HTTPError:
             continue
         headers = {
@@ -149,9 +397,12 @@ async def _proxy_dev_server(path: str) -> Optional[Response]:
             for key, value in response.headers.items()
             if key.lower() not in _HOP_HEADERS
         }
-        return Response(
-            content=response.content,
+        # Relay the raw (still encoded) body as it arrives rather than
+        # buffering large chunks and source maps in memory first.
+        return StreamingResponse(
+            response.aiter_raw(),
             status_code=response.status_code,
             headers=headers,
+            background=BackgroundTask(response.aclose),
         )
     return None
@@ -6,6 +6,7 @@ to avoid code duplication.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -22,9 +23,15 @@ def filter_device_json_files(storage_dir: Path) -> List[Path]:
     Returns:
         List of Path objects for device configuration files (excluding metadata files)
     """
-    if not storage_dir.exists():
+    # Single scandir pass over raw names; Paths are only built for matches
+    try:
+        with os.scandir(storage_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.endswith(".metadata.json")
+                and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-
-    # Get all .json files except .metadata.json files
-    all_json_files = list(storage_dir.glob("*.json"))
-    return [f for f in all_json_files if not f.name.endswith(".metadata.json")]
@@ -1,12 +1,27 @@
 """Utilities for handling system timezone detection and conversion."""
 
+import datetime
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "convert_time_to_display_timezone",
+    "get_system_timezone",
+    "get_timezone_for_new_device",
+    "validate_timezone_for_display",
+]
 
+# One Area/Location segment of an IANA identifier
+_IANA_PART = re.compile(r"[A-Za-z0-9_\-]+")
+
+
+@lru_cache(maxsize=1)
 def get_system_timezone() -> str:
     """Get the system timezone as an IANA timezone identifier.
 
@@ -16,6 +31,9 @@ def get_system_timezone() -> str:
     3. /etc/localtime symlink (common on Linux)
     4. Python's time.tzname (fallback)
 
+    The result is cached for the life of the process; call
+    ``get_system_timezone.cache_clear()`` after changing ``TZ``.
+
     Returns:
         IANA timezone identifier (e.g., "America/New_York", "Europe/London")
         Falls back to "UTC" if detection fails.
@@ -66,6 +84,7 @@ def get_system_timezone() -> str:
     return "UTC"
 
 
+@lru_cache(maxsize=256)
 def _is_valid_iana_timezone(timezone_str: str) -> bool:
     """Check if a string looks like a valid IANA timezone identifier.
 
@@ -92,9 +111,8 @@ def _is_valid_iana_timezone(timezone_str: str) -> bool:
         return False
 
     # Check that each part contains only valid characters
-    for part in parts:
-        if not part or not part.replace("_", "a").replace("-", "a").isalnum():
-            return False
+    if not all(_IANA_PART.fullmatch(part) for part in parts):
+        return False
 
     # Try to validate with zoneinfo if available
     try:
@@ -122,11 +140,17 @@ def get_timezone_for_new_device() -> str:
     system_tz = get_system_timezone()
 
     # Log the detected timezone for debugging
-    logger.debug(f"Detected system timezone: {system_tz}")
+    logger.debug("Detected system timezone: %s", system_tz)
 
     return system_tz
 
 
+@lru_cache(maxsize=64)
+def _zone(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for ``name``, resolved once per process."""
+    return ZoneInfo(name)
+
+
 def convert_time_to_display_timezone(
     hour: int, minute: int, from_timezone: str, to_timezone: str
 ) -> tuple[int, int]:
@@ -141,12 +165,9 @@ def convert_time_to_display_timezone(
     Returns:
         Tuple of (hour, minute) in the target timezone
     """
-    import datetime
-    from zoneinfo import ZoneInfo
-
     # Create a datetime for today at the specified time in source timezone
-    source_tz = ZoneInfo(from_timezone)
-    target_tz = ZoneInfo(to_timezone)
+    source_tz = _zone(from_timezone)
+    target_tz = _zone(to_timezone)
 
     # Use today's date as reference
     today = datetime.date.today()
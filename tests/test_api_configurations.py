@@ -144,7 +144,8 @@ def test_update_doser_configuration(client, temp_config_dir, sample_doser):
     # Update a head's daily dose in the active configuration
     active_config = sample_doser.get_active_configuration()
     latest_revision = active_config.latest_revision()
-    latest_revision.heads[0].schedule.dailyDoseMl = 20.0
+    head = latest_revision.heads[0]
+    head.schedule = head.schedule.model_copy(update={"dailyDoseMl": 20.0})
     response = client.put(
         f"/api/configurations/dosers/{sample_doser.id}",
         json=sample_doser.model_dump(),
@@ -316,3 +317,21 @@ def test_configuration_summary_with_data(
     assert summary["lights"]["count"] == 1
     assert sample_doser.id in summary["dosers"]["addresses"]
     assert sample_light.id in summary["lights"]["addresses"]
+
+
+def test_display_timezone_uses_service_dependency(client):
+    """The display timezone endpoint resolves the service via get_service."""
+    from aquarium_device_manager.api.deps import get_service
+
+    class _Service:
+        def get_display_timezone(self) -> str:
+            return "Europe/London"
+
+    app.dependency_overrides[get_service] = _Service
+    try:
+        response = client.get("/api/configurations/display/timezone")
+    finally:
+        app.dependency_overrides.pop(get_service, None)
+
+    assert response.status_code == 200
+    assert response.json()["display_timezone"] == "Europe/London"
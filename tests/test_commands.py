@@ -199,6 +199,27 @@ class TestBLEServiceCommandPersistence:
         assert len(commands) == 1
         assert commands[0]["status"] == "success"
 
+    def test_updates_after_history_trim_hit_the_right_entry(self):
+        """Test id lookups stay correct once old commands are dropped."""
+        service = BLEService()
+        records = [
+            CommandRecord(address="test_device", action="turn_on")
+            for _ in range(55)
+        ]
+        for record in records:
+            service.save_command(record)
+
+        assert service.get_command("test_device", records[0].id) is None
+        latest = records[-1]
+        latest.mark_success({"status": "on"})
+        service.save_command(latest)
+
+        commands = service.get_commands("test_device", limit=None)
+        assert len(commands) == 50
+        assert commands[-1]["id"] == latest.id
+        assert commands[-1]["status"] == "success"
+        assert service.get_command("test_device", records[5].id) is commands[0]
+
 
 class TestMultiChannelSetting:
     """Test multi-channel auto setting functionality."""
@@ -9,7 +9,11 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from aquarium_device_manager.doser_storage import DoserStorage
+from aquarium_device_manager.doser_storage import (
+    DoserStorage,
+    TimerSchedule,
+    validate_schedule,
+)
 
 
 @pytest.fixture
@@ -165,3 +169,350 @@ def test_custom_periods_total_doses_capped(storage_path: Path) -> None:
     storage = DoserStorage(storage_path)
     with pytest.raises(ValidationError):
         storage.upsert_device(device)
+
+
+def test_empty_file_reads_as_missing_and_corrupt_file_raises(
+    storage_path: Path,
+) -> None:
+    """Blank files are treated as absent; malformed JSON is reported."""
+    storage = DoserStorage(storage_path)
+    (storage_path / "blank.json").write_bytes(b"  \n")
+    (storage_path / "broken.json").write_bytes(b"{not json")
+
+    assert storage.get_device("blank") is None
+    with pytest.raises(ValueError, match="Could not parse device file"):
+        storage.get_device("broken")
+
+
+def test_reads_legacy_and_foreign_device_files(storage_path: Path) -> None:
+    """Unwrapped legacy files load; files for other device types are skipped."""
+    storage = DoserStorage(storage_path)
+    legacy = _example_device("legacy")
+    (storage_path / "legacy.json").write_text(json.dumps(legacy))
+    (storage_path / "light.json").write_text(
+        json.dumps({"device_type": "light", "device_data": {"id": "light"}})
+    )
+
+    loaded = storage.get_device("legacy")
+    assert loaded is not None
+    assert loaded.model_dump(mode="json") == storage._validate_device(
+        legacy
+    ).model_dump(mode="json")
+    assert storage.get_device("light") is None
+
+
+def test_parsed_devices_are_cached_until_the_file_changes(
+    storage_path: Path,
+) -> None:
+    """Repeat reads reuse the parsed model; external edits invalidate it."""
+    storage = DoserStorage(storage_path)
+    storage.upsert_device(_example_device())
+
+    first = storage.get_device("device-1")
+    assert storage.get_device("device-1") is first
+
+    device_file = storage_path / "device-1.json"
+    payload = json.loads(device_file.read_text(encoding="utf-8"))
+    payload["device_data"]["name"] = "Edited elsewhere"
+    device_file.write_text(json.dumps(payload), encoding="utf-8")
+
+    reloaded = storage.get_device("device-1")
+    assert reloaded is not first
+    assert reloaded is not None and reloaded.name == "Edited elsewhere"
+
+    assert storage.delete_device("device-1")
+    assert storage.get_device("device-1") is None
+
+
+def test_failed_save_does_not_leave_unsaved_changes_cached(
+    storage_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """In-place edits that never reach disk are not served by later reads."""
+    storage = DoserStorage(storage_path)
+    storage.upsert_device(_example_device())
+    before = len(storage.get_device("device-1").configurations)
+
+    def _failing_mkdir(self: Path, *args, **kwargs) -> None:
+        raise OSError("disk unavailable")
+
+    heads = _example_device()["configurations"][0]["revisions"][0]["heads"]
+    monkeypatch.setattr(Path, "mkdir", _failing_mkdir)
+    with pytest.raises(OSError):
+        storage.create_configuration("device-1", "Unsaved", heads)
+    monkeypatch.undo()
+
+    device = storage.get_device("device-1")
+    assert device is not None
+    assert len(device.configurations) == before
+
+
+def test_list_device_metadata_parses_each_file_once(
+    storage_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Listing metadata does not re-read device files per entry."""
+    DoserStorage(storage_path).upsert_many(
+        [_example_device("device-1"), _example_device("device-2")]
+    )
+    storage = DoserStorage(storage_path)
+    parsed: list[Path] = []
+    original = DoserStorage._parse_device_file
+
+    def _counting_parse(self: DoserStorage, device_file: Path):
+        parsed.append(device_file)
+        return original(self, device_file)
+
+    monkeypatch.setattr(DoserStorage, "_parse_device_file", _counting_parse)
+
+    metadata = storage.list_device_metadata()
+
+    assert sorted(m.id for m in metadata) == ["device-1", "device-2"]
+    assert len(parsed) == 2
+
+
+@pytest.mark.parametrize(
+    ("numbers", "message"),
+    [
+        ([2], "must start at 1"),
+        ([1, 1], "must be unique"),
+        ([1, 3], "increase sequentially"),
+    ],
+)
+def test_revision_numbers_are_validated(
+    storage_path: Path, numbers: list[int], message: str
+) -> None:
+    """Revision lists must be a gap-free, duplicate-free run from 1."""
+    device = _example_device()
+    template = device["configurations"][0]["revisions"][0]
+    device["configurations"][0]["revisions"] = [
+        {**template, "revision": number} for number in numbers
+    ]
+
+    with pytest.raises(ValidationError, match=message):
+        DoserStorage(storage_path).upsert_device(device)
+
+
+def test_leaf_models_are_immutable(storage_path: Path) -> None:
+    """Schedule and head sub-models are frozen value objects."""
+    device = DoserStorage(storage_path).upsert_device(_example_device())
+    head = device.get_active_configuration().latest_revision().heads[0]
+
+    with pytest.raises(ValidationError):
+        head.schedule.dailyDoseMl = 1.0
+    with pytest.raises(ValidationError):
+        head.recurrence.days = ["Sun"]
+
+
+def test_create_configuration_and_revision_accept_mixed_heads(
+    storage_path: Path,
+) -> None:
+    """Head dicts are validated while DoserHead instances pass through."""
+    storage = DoserStorage(storage_path)
+    device = storage.upsert_device(_example_device())
+    existing = device.get_active_configuration().latest_revision().heads[0]
+    raw_head = deepcopy(_example_device()["configurations"][0]["revisions"][0])
+    raw_head = raw_head["heads"][1]
+
+    configuration = storage.create_configuration(
+        "device-1", "Weekend", [existing, raw_head]
+    )
+    heads = configuration.latest_revision().heads
+    assert heads[0] is existing
+    assert heads[1].schedule.mode == "timer"
+
+    revision = storage.add_revision("device-1", configuration.id, [raw_head])
+    assert revision.revision == 2
+
+
+def test_validate_schedule_dispatches_on_mode() -> None:
+    """The shared schedule adapter picks the model from the mode tag."""
+    schedule = validate_schedule(
+        {"mode": "timer", "doses": [{"time": "07:00", "quantityMl": 1.5}]}
+    )
+    assert isinstance(schedule, TimerSchedule)
+
+    with pytest.raises(ValidationError):
+        validate_schedule({"mode": "hourly", "dailyDoseMl": 1.0})
+
+
+def test_set_active_configuration_writes_compact_json(
+    storage_path: Path,
+) -> None:
+    """Pointer-only updates skip indentation but stay loadable."""
+    storage = DoserStorage(storage_path)
+    device = storage.upsert_device(_example_device())
+    device_file = storage_path / "device-1.json"
+    assert b"\n  " in device_file.read_bytes()
+
+    heads = device.get_active_configuration().latest_revision().heads
+    created = storage.create_configuration("device-1", "Alt", heads)
+    storage.set_active_configuration("device-1", created.id)
+
+    assert b"\n" not in device_file.read_bytes()
+    reloaded = DoserStorage(storage_path).get_device("device-1")
+    assert reloaded is not None
+    assert reloaded.activeConfigurationId == created.id
+
+
+def test_iter_devices_is_lazy_and_skips_unreadable_files(
+    storage_path: Path,
+) -> None:
+    """Devices are yielded one by one and corrupt files are logged, not raised."""
+    storage = DoserStorage(storage_path)
+    storage.upsert_many([_example_device("a"), _example_device("c")])
+    (storage_path / "b.json").write_bytes(b"{oops")
+
+    devices = storage.iter_devices()
+    assert not isinstance(devices, list)
+    assert sorted(device.id for device in devices) == ["a", "c"]
+
+
+def test_upsert_many_stamps_every_file_with_one_timestamp(
+    storage_path: Path,
+) -> None:
+    """Batch writes share a single last_updated value."""
+    storage = DoserStorage(storage_path)
+    storage.upsert_many([_example_device(f"d{i}") for i in range(3)])
+
+    stamps = {
+        json.loads(path.read_text(encoding="utf-8"))["last_updated"]
+        for path in storage_path.glob("d*.json")
+    }
+    assert len(stamps) == 1
+
+
+def test_device_file_listing_is_reused_until_the_directory_changes(
+    storage_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated listings skip the glob until a file is added or removed."""
+    import aquarium_device_manager.doser_storage as doser_storage_module
+
+    storage = DoserStorage(storage_path)
+    storage.upsert_device(_example_device("a"))
+    scans: list[Path] = []
+    real_filter = doser_storage_module.filter_device_json_files
+
+    def _counting_filter(path: Path) -> list[Path]:
+        scans.append(path)
+        return real_filter(path)
+
+    monkeypatch.setattr(
+        doser_storage_module, "filter_device_json_files", _counting_filter
+    )
+
+    assert [d.id for d in storage.list_devices()] == ["a"]
+    assert [d.id for d in storage.list_devices()] == ["a"]
+    assert len(scans) == 1
+
+    storage.upsert_device(_example_device("b"))
+    assert sorted(d.id for d in storage.list_devices()) == ["a", "b"]
+    assert len(scans) == 2
+
+
+def test_get_configuration_tracks_list_changes(storage_path: Path) -> None:
+    """The id lookup stays correct after configurations change."""
+    device = DoserStorage(storage_path).upsert_device(_example_device())
+    original = device.get_configuration("config-default")
+
+    extra = original.model_copy(update={"id": "config-extra"})
+    device.configurations.append(extra)
+    assert device.get_configuration("config-extra") is extra
+
+    device.configurations = [extra]
+    with pytest.raises(KeyError):
+        device.get_configuration("config-default")
+
+
+def test_upsert_many_replaces_the_device_set_with_one_sync(
+    storage_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Stale devices are pruned after the new set is written and synced once."""
+    import aquarium_device_manager.doser_storage as doser_storage_module
+
+    storage = DoserStorage(storage_path)
+    storage.upsert_many([_example_device("a"), _example_device("b")])
+    syncs: list[Path] = []
+    monkeypatch.setattr(doser_storage_module, "_fsync_directory", syncs.append)
+
+    storage.upsert_many([_example_device("b"), _example_device("c")])
+
+    assert sorted(p.name for p in storage_path.glob("*.json")) == [
+        "b.json",
+        "c.json",
+    ]
+    assert storage.get_device("a") is None
+    assert syncs == [storage_path]
+
+
+def test_reads_wrapped_files_written_with_sorted_keys(
+    storage_path: Path,
+) -> None:
+    """Older wrapped files put device_data first and must still load."""
+    storage = DoserStorage(storage_path)
+    wrapped = {
+        "device_type": "doser",
+        "device_id": "sorted",
+        "last_updated": "2024-09-15T11:45:00+00:00",
+        "device_data": _example_device("sorted"),
+    }
+    (storage_path / "sorted.json").write_text(
+        json.dumps(wrapped, indent=2, sort_keys=True)
+    )
+
+    loaded = storage.get_device("sorted")
+    assert loaded is not None and loaded.id == "sorted"
+
+
+def test_saving_an_unchanged_device_skips_the_disk_write(
+    storage_path: Path,
+) -> None:
+    """Re-saving identical content reuses the cached serialisation."""
+    storage = DoserStorage(storage_path)
+    device = storage.upsert_device(_example_device())
+    device_file = storage_path / "device-1.json"
+    before = device_file.read_bytes()
+    tmp_writes: list[Path] = []
+    original_replace = Path.replace
+
+    def _tracking_replace(self: Path, target):
+        tmp_writes.append(self)
+        return original_replace(self, target)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Path, "replace", _tracking_replace)
+        storage.upsert_device(device)
+        assert tmp_writes == []
+
+        device.name = "Renamed"
+        storage.upsert_device(device)
+        assert len(tmp_writes) == 1
+
+    assert device_file.read_bytes() != before
+    assert DoserStorage(storage_path).get_device("device-1").name == "Renamed"
+
+
+def test_idempotent_updates_leave_the_device_file_untouched(
+    storage_path: Path,
+) -> None:
+    """Re-activating the active config or re-sending metadata is a no-op."""
+    storage = DoserStorage(storage_path)
+    storage.upsert_device(_example_device())
+    device_file = storage_path / "device-1.json"
+    before = device_file.read_bytes()
+
+    configuration = storage.set_active_configuration(
+        "device-1", "config-default"
+    )
+    assert configuration.id == "config-default"
+    assert device_file.read_bytes() == before
+
+    metadata = storage.get_device_metadata("device-1")
+    assert metadata is not None
+    storage.upsert_device_metadata(metadata)
+    assert device_file.read_bytes() == before
+
+    metadata.headNames = {1: "Potassium"}
+    storage.upsert_device_metadata(metadata)
+    reloaded = DoserStorage(storage_path).get_device("device-1")
+    assert reloaded.configurations[-1].revisions[-1].heads[0].label == (
+        "Potassium"
+    )
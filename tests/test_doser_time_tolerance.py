@@ -37,3 +37,27 @@ def test_doser_status_parsing_tolerates_one_minute_mismatch():
     # Tail decoded correctly
     assert status.tail_targets == [0x10, 0x20, 0x30, 0x40]
     assert status.tail_flag == 0x55
+
+
+def test_doser_serializer_matches_dataclass_fields():
+    """The explicit serializer emits every status field except raw bytes."""
+    from dataclasses import asdict
+
+    from aquarium_device_manager.serializers import serialize_doser_status
+
+    header = bytes([0x5B, 0x18, 0x30, 0x00, 0x01, 0xFE, 0x04, 0x0C, 0x38])
+    body_time = bytes([0x04, 0x0C, 0x37])
+    head = bytes([0x00, 0x0C, 0x37, 0x11, 0x22, 0x33, 0x44, 0x01, 0x2C])
+    tail = bytes([0x10, 0x20, 0x30, 0x40, 0x55])
+    status = parse_doser_payload(
+        header + b"\x00" * 12 + body_time + head + tail
+    )
+
+    expected = asdict(status)
+    expected.pop("raw_payload")
+    expected["tail_raw"] = status.tail_raw.hex()
+    for head_dict, head_obj in zip(expected["heads"], status.heads):
+        head_dict["extra"] = head_obj.extra.hex()
+        head_dict["mode_label"] = head_obj.mode_label()
+
+    assert serialize_doser_status(status) == expected
@@ -117,3 +117,32 @@ def test_head_dose_command_volume_validation():
     encoder.create_head_dose_command(
         msg_id, head_index, 65535, weekday_mask=weekday_mask
     )
+
+
+def test_template_is_reused_across_message_ids():
+    """Frames for the same arguments share one cached template."""
+    encoder.build_template.cache_clear()
+
+    first = encoder.create_manual_setting_command((0, 1), 2, 100)
+    second = encoder.create_manual_setting_command((0, 2), 2, 100)
+
+    info = encoder.build_template.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    # Only the message id and checksum differ between the two frames
+    assert first[:3] == second[:3]
+    assert first[5:-1] == second[5:-1]
+    assert (first[3], first[4]) == (0, 1)
+    assert (second[3], second[4]) == (0, 2)
+
+
+def test_finalize_matches_manual_framing():
+    """finalize() should produce the same frame as building it by hand."""
+    params = [0x12, 0x5A, 0x34]
+    template = encoder.build_template(0xA5, 0x04, tuple(params))
+    frame = encoder.finalize(template, (3, 7))
+
+    expected = bytearray([0xA5, 0x01, len(params) + 5, 3, 7, 0x04])
+    expected.extend([0x12, 0x59, 0x34])
+    expected.append(encoder._calculate_checksum(expected))
+    assert frame == expected
@@ -0,0 +1,247 @@
+"""Tests for LightDevice command dispatch and notification handling."""
+
+from __future__ import annotations
+
+import asyncio
+import time as time_mod
+from datetime import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bleak.backends.device import BLEDevice
+
+from aquarium_device_manager.commands import ops
+from aquarium_device_manager.device import WRGBII, AutoSetting
+
+
+def _make_light() -> WRGBII:
+    """Return a WRGB II light bound to a fake BLE client."""
+    ble_device = BLEDevice("AA:BB:CC:DD:EE:FF", "DYNWRGB", None, -60)
+    light = WRGBII(ble_device)
+    light._client = AsyncMock()
+    light._read_char = object()  # type: ignore[assignment]
+    light._write_char = object()  # type: ignore[assignment]
+    return light
+
+
+def test_short_frames_are_written_without_response() -> None:
+    """Single-packet frames skip the GATT acknowledgement."""
+
+    async def _run() -> None:
+        light = _make_light()
+        await light._execute_command_locked([bytes(20)])
+        args = light._client.write_gatt_char.await_args.args
+        assert args[2] is False
+
+    asyncio.run(_run())
+
+
+def test_oversized_frames_fall_back_to_response() -> None:
+    """Frames larger than one ATT packet are always acknowledged."""
+
+    async def _run() -> None:
+        light = _make_light()
+        await light._execute_command_locked([bytes(21)])
+        args = light._client.write_gatt_char.await_args.args
+        assert args[2] is True
+
+    asyncio.run(_run())
+
+
+def test_turn_on_writes_one_frame_per_color() -> None:
+    """Every model colour gets a full-brightness manual command."""
+
+    async def _run() -> None:
+        light = _make_light()
+        await light.turn_on()
+        frames = [
+            call.args[1]
+            for call in light._client.write_gatt_char.await_args_list
+        ]
+        assert [frame[6] for frame in frames] == sorted(light._color_ids)
+        assert all(frame[7] == 100 for frame in frames)
+
+    asyncio.run(_run())
+
+
+def test_unknown_color_id_is_ignored() -> None:
+    """Numeric colours outside the model map never reach the device."""
+
+    async def _run() -> None:
+        light = _make_light()
+        await light.set_color_brightness(50, 99)
+        light._client.write_gatt_char.assert_not_awaited()
+
+    asyncio.run(_run())
+
+
+def test_repeated_status_payload_is_not_reparsed() -> None:
+    """An identical status frame keeps the previously parsed object."""
+    payload = bytes.fromhex(
+        "5b18300001fe031502000000000000150000000000030315020d00000d1e41"
+        "141e4115000012274100000000000000000000"
+    )
+
+    async def _run() -> None:
+        light = _make_light()
+        light.handle_notification(payload)
+        first = light.last_status
+        light.handle_notification(bytes(payload))
+        assert light.last_status is first
+
+        changed = payload[:-1] + b"\x01"
+        light.handle_notification(changed)
+        assert light.last_status is not first
+        assert light.last_status.raw_payload == changed
+
+    asyncio.run(_run())
+
+
+def test_add_settings_sends_all_frames_in_one_batch() -> None:
+    """Batched settings share one send call with fresh message ids."""
+
+    async def _run() -> None:
+        light = _make_light()
+        settings = [
+            AutoSetting(time(8, 0), time(12, 0), (50, 60, 70)),
+            AutoSetting(time(13, 0), time(20, 0), (80, 80, 80), 30),
+        ]
+        with patch.object(WRGBII, "_send_command") as send:
+            await light.add_settings(settings)
+
+        send.assert_awaited_once()
+        frames = send.await_args.args[0]
+        assert len(frames) == 2
+        assert frames[0][3:5] != frames[1][3:5]
+        assert list(frames[1][6:10]) == [13, 0, 20, 0]
+
+    asyncio.run(_run())
+
+
+def test_empty_batch_does_not_touch_the_device() -> None:
+    """An empty settings list is a no-op."""
+
+    async def _run() -> None:
+        light = _make_light()
+        with patch.object(WRGBII, "_send_command") as send:
+            await light.remove_settings([])
+        send.assert_not_awaited()
+
+    asyncio.run(_run())
+
+
+def test_reserved_msg_ids_match_sequential_allocation() -> None:
+    """A reserved block equals the ids get_next_msg_id would hand out."""
+
+    async def _run() -> None:
+        bulk = _make_light()
+        single = _make_light()
+        bulk._msg_id = single._msg_id = (0, 88)
+
+        reserved = bulk.reserve_msg_ids(4)
+        expected = [single.get_next_msg_id() for _ in range(4)]
+
+        assert reserved == expected
+        assert bulk.current_msg_id == expected[-1]
+        assert bulk._session_command_count == 4
+
+    asyncio.run(_run())
+
+
+def test_devices_do_not_carry_an_instance_dict() -> None:
+    """Model classes keep all per-device state in slots."""
+
+    async def _run() -> None:
+        light = _make_light()
+        assert not hasattr(light, "__dict__")
+        assert light.last_status is None
+
+    asyncio.run(_run())
+
+
+def test_capture_status_returns_when_the_status_frame_arrives() -> None:
+    """A light status notification ends the capture before its timeout."""
+    payload = bytes.fromhex(
+        "5b18300001fe031502000000000000150000000000030315020d00000d1e41"
+        "141e4115000012274100000000000000000000"
+    )
+
+    async def _run() -> None:
+        light = _make_light()
+
+        async def _reply() -> None:
+            asyncio.get_running_loop().call_soon(
+                light.handle_notification, payload
+            )
+
+        with patch.object(WRGBII, "request_status", side_effect=_reply):
+            received = await asyncio.wait_for(light.capture_status(5), 1)
+            assert received is True
+            assert light.last_status.raw_payload == payload
+
+            # The unchanged frame on the next poll still counts as a reply
+            assert await asyncio.wait_for(light.capture_status(5), 1)
+
+        with patch.object(WRGBII, "request_status"):
+            assert await light.capture_status(0.01) is False
+
+    asyncio.run(_run())
+
+
+def test_msg_id_session_ignores_wall_clock_jumps() -> None:
+    """Setting the system clock forward does not end the id session."""
+
+    async def _run() -> None:
+        light = _make_light()
+        light._msg_id = (0, 10)
+        with patch("time.time", return_value=time_mod.time() + 7 * 86400):
+            light.get_next_msg_id()
+            info = light.get_session_info()
+        assert light.current_msg_id == (0, 11)
+        assert info["session_duration_hours"] < 1
+
+    asyncio.run(_run())
+
+
+def test_remove_settings_sends_one_delete_frame_per_setting() -> None:
+    """Deletes encode every brightness slot as 255 for real settings."""
+
+    async def _run() -> None:
+        light = _make_light()
+        settings = [
+            AutoSetting(time(8, 0), time(12, 0), (50, 60, 70)),
+            AutoSetting(time(13, 0), time(20, 0), (80, 80, 80), 30),
+        ]
+        with patch.object(WRGBII, "_send_command") as send:
+            await light.remove_settings(settings)
+
+        send.assert_awaited_once()
+        frames = send.await_args.args[0]
+        assert len(frames) == 2
+        assert list(frames[0][6:11]) == [8, 0, 12, 0, 0]
+        assert list(frames[1][6:11]) == [13, 0, 20, 0, 30]
+        assert all(list(frame[12:19]) == [255] * 7 for frame in frames)
+
+    asyncio.run(_run())
+
+
+def test_light_actions_run_the_device_method_and_refresh() -> None:
+    """Light ops call the device coroutine and persist the refreshed status."""
+
+    async def _run() -> None:
+        light = _make_light()
+        service = MagicMock()
+        service._ensure_device = AsyncMock(return_value=light)
+        service._refresh_device_status = AsyncMock(return_value="status")
+        with patch.object(WRGBII, "_set_all_colors") as set_all:
+            result = await ops.turn_light_off(service, "AA:BB:CC:DD:EE:FF")
+
+        set_all.assert_awaited_once_with(0)
+        service._ensure_device.assert_awaited_once_with(
+            "AA:BB:CC:DD:EE:FF", "light"
+        )
+        service._refresh_device_status.assert_awaited_once_with(
+            "light", persist=True
+        )
+        assert result == "status"
+
+    asyncio.run(_run())
@@ -0,0 +1,37 @@
+"""Tests for request payload schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from aquarium_device_manager.commands import LightWeekday
+from aquarium_device_manager.schemas import LightAutoSettingRequest
+
+
+def _request(weekdays):
+    """Build a light auto-setting request with the given weekdays."""
+    return LightAutoSettingRequest(
+        sunrise="08:00", sunset="18:00", brightness=50, weekdays=weekdays
+    )
+
+
+def test_weekday_strings_are_normalized() -> None:
+    """Names are matched case-insensitively with surrounding whitespace."""
+    request = _request([" Monday", "FRIDAY", LightWeekday.sunday])
+    assert request.weekdays == [
+        LightWeekday.monday,
+        LightWeekday.friday,
+        LightWeekday.sunday,
+    ]
+
+
+def test_missing_weekdays_default_to_everyday() -> None:
+    """An empty selection falls back to every day."""
+    assert _request([]).weekdays == [LightWeekday.everyday]
+    assert _request(None).weekdays == [LightWeekday.everyday]
+
+
+@pytest.mark.parametrize("weekdays", [["funday"], ["__class__"], [3]])
+def test_unknown_weekdays_are_rejected(weekdays) -> None:
+    """Anything that is not a weekday member name fails validation."""
+    with pytest.raises(ValidationError):
+        _request(weekdays)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 
 from aquarium_device_manager import service as service_mod
+from aquarium_device_manager.ble_service import CachedStatus
 
 
 def test_auto_discover_skips_auto_reconnect(monkeypatch):
@@ -21,7 +22,7 @@ def test_auto_discover_skips_auto_reconnect(monkeypatch):
         return None
 
     async def fake_auto_discover():
-        svc._cache["addr"] = service_mod.CachedStatus(
+        svc._cache["addr"] = CachedStatus(
             address="addr",
             device_type="light",
             raw_payload=None,
@@ -85,3 +86,171 @@ def test_auto_discover_allows_auto_reconnect_when_none_found(monkeypatch):
         reconnect_called is True
         or getattr(svc, "_reconnect_task", None) is not None
     )
+
+
+def test_reconnect_runs_kinds_in_parallel_and_addresses_in_turn(monkeypatch):
+    """Different kinds overlap; devices of one kind never connect at once."""
+    svc = service_mod.BLEService()
+    svc._cache = {
+        "AA:00": CachedStatus("AA:00", "doser", None, None, 0.0),
+        "AA:01": CachedStatus("AA:01", "doser", None, None, 0.0),
+        "BB:00": CachedStatus("BB:00", "light", None, None, 0.0),
+    }
+    active: dict[str, int] = {"doser": 0, "light": 0}
+    overlap: list[bool] = []
+
+    async def fake_scan(addresses):
+        return {address: object() for address in addresses}
+
+    async def fake_connect(address, device_type, ble_device=None):
+        active[device_type] += 1
+        assert active[device_type] == 1
+        await asyncio.sleep(0.01)
+        overlap.append(all(active.values()))
+        active[device_type] -= 1
+        if address == "AA:01":
+            raise RuntimeError("gone")
+        return svc._cache[address]
+
+    monkeypatch.setattr(svc, "connect_device", fake_connect)
+    monkeypatch.setattr(service_mod._ble_impl, "scan_until_found", fake_scan)
+
+    asyncio.run(svc._attempt_reconnect())
+
+    assert len(overlap) == 3
+    assert any(overlap)
+
+
+def test_workers_use_the_eager_task_factory_when_available(monkeypatch):
+    """Background workers start eagerly on Pythons that support it."""
+    from aquarium_device_manager import ble_service
+
+    calls = []
+
+    def fake_factory(loop, coro):
+        calls.append(loop)
+        return loop.create_task(coro)
+
+    async def worker():
+        return None
+
+    async def _run():
+        monkeypatch.delattr(asyncio, "eager_task_factory", raising=False)
+        await ble_service._start_worker(worker())
+        assert calls == []
+
+        monkeypatch.setattr(
+            asyncio, "eager_task_factory", fake_factory, raising=False
+        )
+        await ble_service._start_worker(worker())
+        assert calls == [asyncio.get_running_loop()]
+
+    asyncio.run(_run())
+
+
+def test_reconnect_only_connects_devices_seen_in_one_scan(monkeypatch):
+    """Cached devices that do not advertise are skipped, not looked up."""
+    from bleak.backends.device import BLEDevice
+
+    svc = service_mod.BLEService()
+    svc._cache = {
+        "AA:00": CachedStatus("AA:00", "doser", None, None, 0.0),
+        "BB:00": CachedStatus("BB:00", "light", None, None, 0.0),
+    }
+    seen = BLEDevice("AA:00", "DYDOSED", None, -60)
+    scans = []
+
+    async def fake_scan(addresses):
+        scans.append(sorted(addresses))
+        return {"AA:00": seen}
+
+    connected = {}
+
+    async def fake_connect(address, device_type, ble_device=None):
+        connected[address] = ble_device
+        return svc._cache[address]
+
+    monkeypatch.setattr(service_mod._ble_impl, "scan_until_found", fake_scan)
+    monkeypatch.setattr(svc, "connect_device", fake_connect)
+
+    asyncio.run(svc._attempt_reconnect())
+
+    assert scans == [["AA:00", "BB:00"]]
+    assert connected == {"AA:00": seen}
+
+
+def test_scan_until_found_stops_once_every_address_is_seen(monkeypatch):
+    """The reconnect scan returns early instead of waiting out its timeout."""
+    from bleak.backends.device import BLEDevice
+
+    from aquarium_device_manager import ble_service
+
+    class FakeScanner:
+        def __init__(self, detection_callback):
+            self._callback = detection_callback
+
+        async def __aenter__(self):
+            loop = asyncio.get_running_loop()
+            for address in ("aa:00", "CC:00", "BB:00"):
+                device = BLEDevice(address, "DYDOSED", None, -60)
+                loop.call_soon(self._callback, device, None)
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return None
+
+    monkeypatch.setattr(ble_service, "BleakScanner", FakeScanner)
+
+    async def _run():
+        found = await asyncio.wait_for(
+            ble_service.scan_until_found(["AA:00", "BB:00"], timeout=5), 1
+        )
+        assert sorted(found) == ["AA:00", "BB:00"]
+        missing = await ble_service.scan_until_found(["DD:00"], timeout=0.01)
+        assert missing == {}
+
+    asyncio.run(_run())
+
+
+def test_service_toggles_come_from_import_time_env(monkeypatch):
+    """New services copy the toggles resolved when the module loaded."""
+    from aquarium_device_manager import ble_service
+
+    monkeypatch.setenv("AQUA_BLE_AUTO_DISCOVER", "1")
+    monkeypatch.setattr(ble_service, "AUTO_DISCOVER_ON_START", False)
+
+    svc = service_mod.BLEService()
+
+    assert svc._auto_discover_on_start is False
+    assert svc._auto_reconnect is ble_service.AUTO_RECONNECT
+
+
+async def _noop_save() -> None:
+    """Stand-in for state persistence."""
+    return None
+
+
+def test_reconnect_worker_is_never_started_twice(monkeypatch):
+    """A running reconnect worker is reused and stop() cancels it."""
+    svc = service_mod.BLEService()
+    monkeypatch.setattr(svc, "_save_state", _noop_save)
+    started = 0
+
+    async def fake_reconnect():
+        nonlocal started
+        started += 1
+        await asyncio.sleep(10)
+
+    async def _run() -> None:
+        first = svc._ensure_task("_reconnect_task", fake_reconnect)
+        second = svc._ensure_task("_reconnect_task", fake_reconnect)
+        await asyncio.sleep(0)
+        assert first is second
+        assert started == 1
+
+        await svc.stop()
+        assert first.cancelled()
+        assert svc._reconnect_task is None
+        assert svc._tasks == set()
+
+    asyncio.run(_run())
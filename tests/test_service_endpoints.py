@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from typing import Dict
 from unittest.mock import AsyncMock
 
+import orjson
 import pytest
+from bleak.backends.device import BLEDevice
 from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
-from aquarium_device_manager.ble_service import CachedStatus
+from aquarium_device_manager import serializers
+from aquarium_device_manager.ble_service import BLEService, CachedStatus
 from aquarium_device_manager.service import app, service
 
 
@@ -92,3 +99,841 @@ def test_removed_legacy_routes_return_404(test_client: TestClient) -> None:
     # Ensure nested paths also 404
     assert test_client.get("/ui/anything").status_code == 404
     assert test_client.get("/debug/anything").status_code == 404
+
+
+def test_command_routes_check_devices_without_copying_the_cache(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Device existence is a membership test, not a snapshot copy."""
+    cached = _cached("doser")
+    monkeypatch.setattr(service, "_cache", {cached.address: cached})
+    monkeypatch.setattr(
+        service, "get_status_snapshot", AsyncMock(side_effect=AssertionError)
+    )
+
+    resp = test_client.get(f"/api/devices/{cached.address}/commands")
+    assert resp.status_code == 200
+    assert test_client.get("/api/devices/00:00/commands").status_code == 404
+
+
+def test_request_save_coalesces_bursts_into_one_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Many save requests in one window produce a single state write."""
+    svc = BLEService()
+    save = AsyncMock()
+    monkeypatch.setattr(svc, "_save_state", save)
+    monkeypatch.setattr(
+        "aquarium_device_manager.ble_service.SAVE_COALESCE_SECONDS", 0.01
+    )
+
+    async def _run() -> None:
+        for _ in range(5):
+            svc.request_save()
+        await svc._save_task
+        assert save.await_count == 1
+
+        svc.request_save()
+        await svc.stop()
+        assert save.await_count == 2
+
+    asyncio.run(_run())
+
+
+def test_state_file_round_trips_through_orjson(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Saved state reloads into an equal cache; a missing file is ignored."""
+    from aquarium_device_manager import ble_service
+
+    state_path = tmp_path / "state.json"
+    monkeypatch.setattr(ble_service, "STATE_PATH", state_path)
+
+    async def _run() -> None:
+        empty = BLEService()
+        await empty._load_state()
+        assert empty._cache == {}
+
+        svc = BLEService()
+        cached = _cached("doser")
+        svc._cache = {cached.address: cached}
+        svc._commands = {cached.address: [{"id": "cmd-1"}]}
+        await svc._save_state()
+
+        loaded = BLEService()
+        await loaded._load_state()
+        assert loaded._cache == svc._cache
+        assert loaded._commands == svc._commands
+
+    asyncio.run(_run())
+
+
+def test_persisted_refreshes_share_one_deferred_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A burst of persisted status refreshes writes the state file once."""
+    from aquarium_device_manager import ble_service
+    from aquarium_device_manager.light_status import ParsedLightStatus
+
+    class _Light:
+        status_serializer = "serialize_light_status"
+        colors: dict = {}
+        model_name = "Test light"
+        last_status = ParsedLightStatus(
+            message_id=None,
+            response_mode=None,
+            weekday=None,
+            current_hour=None,
+            current_minute=None,
+            keyframes=[],
+            time_markers=[],
+            tail=b"",
+            raw_payload=b"\x5b",
+        )
+
+        async def capture_status(self, timeout: float) -> bool:
+            return True
+
+    svc = BLEService()
+    save = AsyncMock()
+    monkeypatch.setattr(svc, "_save_state", save)
+    monkeypatch.setattr(ble_service, "STATUS_CAPTURE_WAIT_SECONDS", 0)
+    monkeypatch.setattr(ble_service, "SAVE_COALESCE_SECONDS", 0.01)
+    address = "AA:BB:CC:DD:EE:01"
+    svc._devices = {"light": {address: _Light()}}  # type: ignore[dict-item]
+    svc._addresses = {"light": address}
+
+    async def _run() -> None:
+        for _ in range(3):
+            await svc._refresh_device_status("light")
+        save.assert_not_awaited()
+        await svc._save_task
+        assert save.await_count == 1
+        assert svc._cache[address].raw_payload == "5b"
+
+    asyncio.run(_run())
+
+
+def test_status_serializers_resolve_once_per_device_class() -> None:
+    """Device classes map to their serializer through a memoised lookup."""
+    from aquarium_device_manager import ble_service
+    from aquarium_device_manager.device import Doser
+    from aquarium_device_manager.device.base_device import BaseDevice
+
+    ble_service._class_serializer.cache_clear()
+    assert ble_service._class_serializer(Doser) == (
+        "serialize_doser_status",
+        serializers.serialize_doser_status,
+    )
+    assert ble_service._class_serializer(BaseDevice) == (None, None)
+    ble_service._class_serializer(Doser)
+    assert ble_service._class_serializer.cache_info().hits == 1
+
+
+def test_filter_supported_devices_skips_unknown_names() -> None:
+    """Only advertisements whose model code is known are returned."""
+    from aquarium_device_manager import ble_service
+    from aquarium_device_manager.device import Doser
+
+    pump = BLEDevice("AA:00", "DYDOSEA1B2C3D4E5F6", None, -60)
+    devices = [
+        BLEDevice("BB:00", "Living room TV", None, -60),
+        BLEDevice("CC:00", None, None, -60),
+        pump,
+    ]
+
+    assert ble_service.filter_supported_devices(devices) == [(pump, Doser)]
+
+
+def test_unchanged_state_file_is_not_parsed_again(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reloading skips a state file whose mtime this service already saw."""
+    import os
+
+    from aquarium_device_manager import ble_service
+
+    state_path = tmp_path / "state.json"
+    monkeypatch.setattr(ble_service, "STATE_PATH", state_path)
+    svc = BLEService()
+    cached = _cached("doser")
+    svc._cache = {cached.address: cached}
+
+    async def _run() -> None:
+        await svc._save_state()
+        await svc._load_state()
+        assert svc._cache[cached.address] is cached
+
+        stat = state_path.stat()
+        os.utime(state_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        await svc._load_state()
+        assert svc._cache[cached.address] is not cached
+        assert svc._cache[cached.address] == cached
+
+    asyncio.run(_run())
+
+
+def test_state_saves_reuse_fragments_of_unchanged_devices(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only devices with a new snapshot are re-encoded on the next save."""
+    from aquarium_device_manager import ble_service
+
+    monkeypatch.setattr(ble_service, "STATE_PATH", tmp_path / "state.json")
+    svc = BLEService()
+    doser, light = _cached("doser"), _cached("light")
+    light.address = "11:22:33:44:55:66"
+    svc._cache = {doser.address: doser, light.address: light}
+
+    asyncio.run(svc._save_state())
+    doser_fragment = svc._state_fragments[doser.address][1]
+    light_fragment = svc._state_fragments[light.address][1]
+
+    svc._cache[light.address] = _cached("light")
+    svc._cache[light.address].address = light.address
+    asyncio.run(svc._save_state())
+
+    assert svc._state_fragments[doser.address][1] is doser_fragment
+    assert svc._state_fragments[light.address][1] is not light_fragment
+    saved = orjson.loads((tmp_path / "state.json").read_bytes())
+    assert sorted(saved["devices"]) == sorted(svc._cache)
+    assert saved["display_timezone"] == svc.get_display_timezone()
+
+
+def test_light_channels_are_built_once_per_model_class() -> None:
+    """Channel lists come sorted by index from a per-class cache."""
+    from aquarium_device_manager import ble_service
+    from aquarium_device_manager.device import WRGBII, Doser
+
+    light = WRGBII.__new__(WRGBII)
+    svc = BLEService()
+    channels = svc._build_channels("light", light)
+
+    assert [c["index"] for c in channels] == sorted(WRGBII._colors.values())
+    assert channels[0] is ble_service._class_channels(WRGBII)[0]
+    assert svc._build_channels("light", light) is not channels
+    assert svc._build_channels("doser", Doser.__new__(Doser)) is None
+
+
+def test_discovery_scans_are_shared_within_the_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent and back-to-back discoveries run a single BLE scan."""
+    from aquarium_device_manager import ble_service
+
+    scan = AsyncMock(return_value=[])
+    monkeypatch.setattr(ble_service.BleakScanner, "discover", scan)
+    monkeypatch.setattr(ble_service, "_scan_cache", None)
+    monkeypatch.setattr(ble_service, "_scan_inflight", None)
+
+    async def _run() -> None:
+        await asyncio.gather(
+            ble_service.discover_supported_devices(timeout=1.0),
+            ble_service.discover_supported_devices(timeout=1.0),
+        )
+        await ble_service.discover_supported_devices(timeout=0.5)
+        assert scan.await_count == 1
+
+        await ble_service.discover_supported_devices(timeout=2.0)
+        assert scan.await_count == 2
+
+    asyncio.run(_run())
+
+
+def test_cancelled_discovery_does_not_abort_the_shared_scan(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A caller that gives up leaves the scan running for the others."""
+    from aquarium_device_manager import ble_service
+
+    async def _discover(timeout: float) -> list:
+        await asyncio.sleep(0.01)
+        return []
+
+    scan = AsyncMock(side_effect=_discover)
+    monkeypatch.setattr(ble_service.BleakScanner, "discover", scan)
+    monkeypatch.setattr(ble_service, "_scan_cache", None)
+    monkeypatch.setattr(ble_service, "_scan_inflight", None)
+
+    async def _run() -> None:
+        leaving = asyncio.create_task(
+            ble_service.discover_supported_devices(timeout=1.0)
+        )
+        staying = asyncio.create_task(
+            ble_service.discover_supported_devices(timeout=1.0)
+        )
+        await asyncio.sleep(0)
+        leaving.cancel()
+        assert await staying == []
+        assert scan.await_count == 1
+
+    asyncio.run(_run())
+
+
+def test_reconnect_uses_kind_from_last_scan(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A scanned address reconnects without another BLE lookup."""
+    from aquarium_device_manager import ble_service
+    from aquarium_device_manager.api import routes_devices
+    from aquarium_device_manager.device import Doser
+
+    address = "11:22:33:44:55:66"
+    scanned = (BLEDevice(address, "DYDOSED", None, -60), Doser)
+    monkeypatch.setattr(
+        ble_service, "_scan_cache", (time.monotonic(), 5.0, [scanned])
+    )
+    lookup = AsyncMock(side_effect=AssertionError("unexpected lookup"))
+    monkeypatch.setattr(routes_devices, "get_device_from_address", lookup)
+    status = _cached("doser")
+    connect = AsyncMock(return_value=status)
+    monkeypatch.setattr(service, "connect_device", connect)
+
+    resp = test_client.post(f"/api/devices/{address}/connect")
+
+    assert resp.status_code == 200
+    connect.assert_awaited_once_with(address, "doser")
+    assert service.known_kind("00:00:00:00:00:00") is None
+
+
+def test_device_lookups_run_outside_the_service_lock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Slow BLE lookups overlap and still register one instance per address."""
+    from aquarium_device_manager import ble_service
+
+    class _Doser:
+        device_kind = "doser"
+
+    in_flight = 0
+    peak = 0
+
+    async def _lookup(address: str) -> _Doser:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _Doser()
+
+    monkeypatch.setattr(ble_service, "get_device_from_address", _lookup)
+    svc = BLEService()
+
+    async def _run() -> None:
+        first, second, other = await asyncio.gather(
+            svc._ensure_device("AA:00"),
+            svc._ensure_device("AA:00"),
+            svc._ensure_device("AA:01"),
+        )
+        assert peak == 3
+        assert first is second
+        assert other is not first
+        assert svc._devices["doser"] == {"AA:00": first, "AA:01": other}
+
+    asyncio.run(_run())
+
+
+def test_slow_disconnect_only_blocks_its_own_device_kind(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A light can register while a doser is still disconnecting."""
+    from aquarium_device_manager import ble_service
+
+    class _Light:
+        device_kind = "light"
+
+    released = asyncio.Event()
+
+    class _Doser:
+        device_kind = "doser"
+
+        async def disconnect(self) -> None:
+            await released.wait()
+
+    async def _lookup(address: str) -> _Light:
+        return _Light()
+
+    monkeypatch.setattr(ble_service, "get_device_from_address", _lookup)
+    svc = BLEService()
+    svc._devices = {"doser": {"AA:00": _Doser()}}  # type: ignore[dict-item]
+    svc._addresses = {"doser": "AA:00"}
+
+    async def _run() -> None:
+        disconnecting = asyncio.create_task(svc.disconnect_device("AA:00"))
+        await asyncio.sleep(0)
+        light = await asyncio.wait_for(svc._ensure_device("BB:00"), 1)
+        assert svc.current_device_address("light") == "BB:00"
+        assert not disconnecting.done()
+
+        released.set()
+        await disconnecting
+        assert svc._devices == {"light": {"BB:00": light}}
+        assert svc.current_device_address("doser") is None
+
+    asyncio.run(_run())
+
+
+def test_concurrent_status_requests_share_one_round_trip(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Two refreshes of one address connect to the device only once."""
+    svc = BLEService()
+    cached = _cached("doser")
+    svc._cache[cached.address] = cached
+
+    async def _slow_connect(address: str, device_type: str) -> CachedStatus:
+        await asyncio.sleep(0.01)
+        return cached
+
+    connect = AsyncMock(side_effect=_slow_connect)
+    monkeypatch.setattr(svc, "connect_device", connect)
+
+    async def _run() -> None:
+        first, second = await asyncio.gather(
+            svc.request_status(cached.address),
+            svc.request_status(cached.address),
+        )
+        assert first is second is cached
+        assert svc._status_inflight == {}
+        await svc.request_status(cached.address)
+
+    asyncio.run(_run())
+    assert connect.await_count == 2
+
+
+def test_single_device_lookups_do_not_copy_the_status_cache(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Health and per-address lookups read the live cache directly."""
+    cached = _cached("doser")
+    monkeypatch.setattr(service, "_cache", {cached.address: cached})
+    monkeypatch.setattr(
+        service, "get_status_snapshot", AsyncMock(side_effect=AssertionError)
+    )
+
+    resp = test_client.get("/api/health")
+    assert resp.json()["devices"]["cached"] == 1
+    assert service.get_cached_status(cached.address) is cached
+    assert service.get_cached_status("00:00") is None
+
+
+def test_api_routes_render_with_orjson() -> None:
+    """JSON API routes default to the orjson response class."""
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or route.path == "/api/health":
+            continue
+        if route.path.startswith("/api/"):
+            assert route.response_class is ORJSONResponse, route.path
+
+
+def test_api_routes_parse_bodies_with_orjson(test_client: TestClient) -> None:
+    """Router bodies go through orjson and still reject malformed JSON."""
+    from aquarium_device_manager.api.routing import ORJSONRoute
+
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path != "/api/health":
+            if route.path.startswith("/api/"):
+                assert isinstance(route, ORJSONRoute), route.path
+
+    resp = test_client.post(
+        "/api/devices/AA:BB:CC:DD:EE:FF/commands",
+        content=b"{not json",
+        headers={"content-type": "application/json"},
+    )
+    assert resp.status_code == 422
+
+
+def test_device_routes_skip_response_model_validation() -> None:
+    """Device routes with large bodies skip response model validation."""
+    for route in app.routes:
+        if isinstance(route, APIRoute) and "devices" in route.tags:
+            if route.path.endswith("/disconnect"):
+                assert route.response_model == Dict[str, str]
+            else:
+                assert route.response_model is None, route.path
+
+
+def test_status_payload_is_reused_until_the_cache_changes(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Polling /api/status reuses one serialisation and honours ETags."""
+    cached = _cached("doser")
+    monkeypatch.setattr(service, "_cache", {cached.address: cached})
+
+    first = test_client.get("/api/status")
+    assert first.json()[cached.address]["parsed"] == {"example": True}
+    body, etag = service.get_status_payload()
+    assert service.get_status_payload()[0] is body
+    assert first.headers["etag"] == etag
+
+    resp = test_client.get("/api/status", headers={"if-none-match": etag})
+    assert resp.status_code == 304
+
+    service._cache[cached.address] = _cached("light")
+    resp = test_client.get("/api/status", headers={"if-none-match": etag})
+    assert resp.status_code == 200
+    assert resp.json()[cached.address]["device_type"] == "light"
+
+
+def test_status_payload_reencodes_only_changed_devices(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Unchanged devices reuse their encoded entry when the body rebuilds."""
+    svc = BLEService()
+    doser = _cached("doser")
+    light = _cached("light")
+    light.address = "11:22:33:44:55:66"
+    svc._cache = {doser.address: doser, light.address: light}
+
+    calls: list[str] = []
+    original = serializers.cached_status_to_dict
+
+    def _tracking(service, status):
+        calls.append(status.address)
+        return original(service, status)
+
+    monkeypatch.setattr(serializers, "cached_status_to_dict", _tracking)
+    body, _ = svc.get_status_payload()
+    assert sorted(calls) == sorted(svc._cache)
+
+    calls.clear()
+    svc._cache[light.address] = CachedStatus(
+        address=light.address,
+        device_type="light",
+        raw_payload=None,
+        parsed=None,
+        updated_at=200.0,
+    )
+    rebuilt, _ = svc.get_status_payload()
+    assert calls == [light.address]
+    decoded = orjson.loads(rebuilt)
+    assert decoded[doser.address] == orjson.loads(body)[doser.address]
+    assert decoded[light.address]["updated_at"] == 200.0
+
+
+def test_large_status_bodies_are_gzipped(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Clients accepting gzip get a compressed /api/status body."""
+    statuses = {}
+    for index in range(10):
+        status = _cached("doser")
+        status.address = f"AA:BB:CC:DD:EE:{index:02X}"
+        statuses[status.address] = status
+    monkeypatch.setattr(service, "_cache", statuses)
+
+    resp = test_client.get("/api/status", headers={"accept-encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert len(resp.json()) == 10
+
+    resp = test_client.get("/api/health", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in resp.headers
+
+
+def test_status_socket_sends_snapshot_then_deltas(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The push channel opens with a snapshot of the /api/status body."""
+    cached = _cached("doser")
+    monkeypatch.setattr(service, "_cache", {cached.address: cached})
+
+    with test_client.websocket_connect("/api/ws/status") as socket:
+        snapshot = orjson.loads(socket.receive_bytes())
+    assert snapshot == {
+        "type": "snapshot",
+        "statuses": orjson.loads(service.get_status_payload()[0]),
+    }
+    # The handler unsubscribes on the app's loop once it sees the close
+    for _ in range(100):
+        if not service._status_subscribers:
+            break
+        time.sleep(0.01)
+    assert service._status_subscribers == set()
+
+
+def test_status_socket_closes_when_the_sender_fails(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed push task closes the socket instead of leaving it silent."""
+
+    def _broken_payload() -> tuple[bytes, str]:
+        raise RuntimeError("encode failed")
+
+    monkeypatch.setattr(service, "get_status_payload", _broken_payload)
+
+    with test_client.websocket_connect("/api/ws/status") as socket:
+        message = socket.receive()
+    assert message == {"type": "websocket.close", "code": 1011, "reason": ""}
+
+
+def test_status_subscribers_receive_only_changed_devices() -> None:
+    """Deltas carry changed addresses and None for removed ones."""
+    svc = BLEService()
+    first, second = _cached("doser"), _cached("light")
+    second.address = "11:22:33:44:55:66"
+    svc._cache = {first.address: first}
+
+    async def _run() -> None:
+        queue = svc.subscribe_status()
+        svc._publish_status_changes()
+        assert queue.empty()
+
+        svc._cache[second.address] = second
+        svc._publish_status_changes()
+        event = queue.get_nowait()
+        assert event["type"] == "delta"
+        assert list(event["statuses"]) == [second.address]
+
+        del svc._cache[first.address]
+        svc._publish_status_changes()
+        assert queue.get_nowait() == {
+            "type": "delta",
+            "statuses": {first.address: None},
+        }
+        svc.unsubscribe_status(queue)
+
+    asyncio.run(_run())
+
+
+def test_stalled_status_subscriber_gets_a_replacing_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A full queue is resynced with a snapshot, so removals are not lost."""
+    from aquarium_device_manager import ble_service
+
+    monkeypatch.setattr(ble_service, "STATUS_QUEUE_SIZE", 1)
+    svc = BLEService()
+    first, second = _cached("doser"), _cached("light")
+    second.address = "11:22:33:44:55:66"
+    svc._cache = {first.address: first}
+
+    async def _run() -> None:
+        queue = svc.subscribe_status()
+        svc._cache[second.address] = second
+        svc._publish_status_changes()
+        # The removal delta no longer fits while the client is stalled
+        del svc._cache[first.address]
+        svc._publish_status_changes()
+
+        event = queue.get_nowait()
+        assert queue.empty()
+        assert event["type"] == "snapshot"
+        assert list(event["statuses"]) == [second.address]
+        svc.unsubscribe_status(queue)
+
+    asyncio.run(_run())
+
+
+def test_adapter_lock_waits_for_peer_then_falls_back(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    """A busy adapter lock delays lookups only up to its timeout."""
+    fcntl = pytest.importorskip("fcntl")
+    from aquarium_device_manager import ble_service
+
+    lock_path = tmp_path / "adapter.lock"
+    monkeypatch.setattr(ble_service, "ADAPTER_LOCK_PATH", lock_path)
+    monkeypatch.setattr(ble_service, "ADAPTER_LOCK_TIMEOUT_SECONDS", 0.1)
+    monkeypatch.setattr(ble_service, "ADAPTER_LOCK_POLL_SECONDS", 0.01)
+    svc = BLEService()
+    svc._use_adapter_lock = True
+
+    async def _hold() -> float:
+        start = time.monotonic()
+        async with svc._adapter_lock():
+            pass
+        return time.monotonic() - start
+
+    assert asyncio.run(_hold()) < 0.1
+
+    with open(lock_path, "a") as peer:
+        fcntl.flock(peer.fileno(), fcntl.LOCK_EX)
+        assert asyncio.run(_hold()) >= 0.1
+
+
+def test_live_statuses_capture_both_kinds_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Doser and light refreshes overlap instead of running back to back."""
+    svc = BLEService()
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    async def _refresh(kind: str, persist: bool = False) -> CachedStatus:
+        started.append(kind)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), 1)
+        if kind == "light":
+            raise HTTPException(status_code=400, detail="No light")
+        return _cached(kind)
+
+    monkeypatch.setattr(svc, "_refresh_device_status", _refresh)
+
+    statuses, errors = asyncio.run(svc.get_live_statuses())
+
+    assert sorted(started) == ["doser", "light"]
+    assert [status.device_type for status in statuses] == ["doser"]
+    assert errors == []
+
+
+def test_state_file_is_replaced_atomically(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed write leaves the previous state file intact."""
+    from aquarium_device_manager import ble_service
+
+    state_path = tmp_path / "state.json"
+    monkeypatch.setattr(ble_service, "STATE_PATH", state_path)
+    ble_service._write_state_file(b'{"devices": {}}')
+    assert list(tmp_path.iterdir()) == [state_path]
+
+    def _fail(*_args) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ble_service.os, "replace", _fail)
+    with pytest.raises(OSError):
+        ble_service._write_state_file(b'{"devices": {"partial"')
+    assert state_path.read_bytes() == b'{"devices": {}}'
+    assert list(tmp_path.iterdir()) == [state_path]
+
+
+def test_concurrent_state_writers_use_separate_temp_files(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Writer threads never rename each other's temp files."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from aquarium_device_manager import ble_service
+
+    state_path = tmp_path / "state.json"
+    monkeypatch.setattr(ble_service, "STATE_PATH", state_path)
+    bodies = [orjson.dumps({"writer": i}) for i in range(400)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(ble_service._write_state_file, bodies))
+
+    assert state_path.read_bytes() in bodies
+    assert list(tmp_path.iterdir()) == [state_path]
+
+
+def test_cancelled_save_holds_the_lock_until_its_write_lands(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """stop() waits for a deferred write already running in its thread."""
+    import threading
+
+    from aquarium_device_manager import ble_service
+
+    active = 0
+    peak = 0
+    guard = threading.Lock()
+    writing = threading.Event()
+
+    def _slow_write(body: bytes) -> int:
+        nonlocal active, peak
+        with guard:
+            active += 1
+            peak = max(peak, active)
+        writing.set()
+        time.sleep(0.05)
+        with guard:
+            active -= 1
+        return 1
+
+    monkeypatch.setattr(ble_service, "_write_state_file", _slow_write)
+    monkeypatch.setattr(ble_service, "SAVE_COALESCE_SECONDS", 0)
+    svc = BLEService()
+
+    async def _run() -> None:
+        svc.request_save()
+        await asyncio.to_thread(writing.wait, 1)
+        await svc.stop()
+
+    asyncio.run(_run())
+    assert peak == 1
+
+
+def test_scan_results_use_per_class_product_fields(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Scan rows carry the model's product name and lower-cased kind."""
+    from aquarium_device_manager import ble_service
+    from aquarium_device_manager.device import WRGBII, Doser
+
+    pump = BLEDevice("AA:00", "DYDOSEA1B2C3D4E5F6", None, -60)
+    light = BLEDevice("BB:00", "DYNWRGB", None, -60)
+    monkeypatch.setattr(
+        ble_service,
+        "discover_supported_devices",
+        AsyncMock(return_value=[(pump, Doser), (light, WRGBII)]),
+    )
+
+    rows = asyncio.run(BLEService().scan_devices())
+
+    assert [row["device_type"] for row in rows] == ["doser", "light"]
+    assert rows[1]["product"] == WRGBII.model_name
+    assert rows[0]["address"] == "AA:00"
+
+
+def test_stop_disconnects_all_devices_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Shutdown overlaps device teardowns and survives a failing one."""
+    started: list[str] = []
+    all_started = asyncio.Event()
+
+    class _Device:
+        def __init__(self, address: str, fail: bool = False) -> None:
+            self.address = address
+            self._fail = fail
+
+        async def disconnect(self) -> None:
+            started.append(self.address)
+            if len(started) == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), 1)
+            if self._fail:
+                raise RuntimeError("adapter gone")
+
+    svc = BLEService()
+    monkeypatch.setattr(svc, "_save_state", AsyncMock())
+    svc._devices = {  # type: ignore[dict-item]
+        "doser": {"AA:00": _Device("AA:00"), "AA:01": _Device("AA:01", True)},
+        "light": {"BB:00": _Device("BB:00")},
+    }
+    svc._addresses = {"doser": "AA:00", "light": "BB:00"}
+
+    asyncio.run(svc.stop())
+
+    assert sorted(started) == ["AA:00", "AA:01", "BB:00"]
+    assert svc._devices == {}
+    assert svc._addresses == {}
+
+
+def test_recently_scanned_devices_skip_the_address_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A connect right after a scan reuses the scanned BLE handle."""
+    from aquarium_device_manager import ble_service
+    from aquarium_device_manager.device import Doser
+
+    pump = BLEDevice("AA:00", "DYDOSEA1B2C3D4E5F6", None, -60)
+    lookup = AsyncMock(side_effect=AssertionError("unexpected BLE lookup"))
+    monkeypatch.setattr(ble_service, "get_device_from_address", lookup)
+    monkeypatch.setattr(
+        ble_service, "_scan_cache", (time.monotonic(), 5.0, [(pump, Doser)])
+    )
+
+    device = asyncio.run(BLEService()._ensure_device("AA:00", "doser"))
+    assert isinstance(device, Doser)
+    assert device.address == "AA:00"
+    lookup.assert_not_awaited()
+
+    stale = time.monotonic() - ble_service.SCAN_HANDLE_TTL_SECONDS
+    monkeypatch.setattr(
+        ble_service, "_scan_cache", (stale, 5.0, [(pump, Doser)])
+    )
+    with pytest.raises(HTTPException):
+        asyncio.run(BLEService()._ensure_device("AA:00", "doser"))
+    lookup.assert_awaited_once_with("AA:00")
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from collections import OrderedDict
 from pathlib import Path
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
-from fastapi import HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.testclient import TestClient
 
+from aquarium_device_manager import spa
 from aquarium_device_manager.service import (
     SPA_UNAVAILABLE_MESSAGE,
     serve_spa,
@@ -17,6 +22,11 @@ from aquarium_device_manager.service import (
 )
 
 
+def _bare_request() -> Request:
+    """Return a bare request without conditional headers."""
+    return Request({"type": "http", "headers": []})
+
+
 def test_root_reports_missing_spa(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -29,7 +39,7 @@ def test_root_reports_missing_spa(
         AsyncMock(return_value=None),
     )
 
-    response = asyncio.run(serve_spa())
+    response = asyncio.run(serve_spa(_bare_request()))
     assert response.status_code == 503
     assert SPA_UNAVAILABLE_MESSAGE in response.body.decode()
 
@@ -46,7 +56,7 @@ def test_root_serves_spa_when_dist_present(
     monkeypatch.setattr(
         "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
     )
-    response = asyncio.run(serve_spa())
+    response = asyncio.run(serve_spa(_bare_request()))
     assert response.status_code == 200
     assert "spa" in response.body.decode()
 
@@ -64,9 +74,11 @@ def test_spa_asset_route_serves_static_file(
         "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
     )
 
-    response = asyncio.run(serve_spa_assets("vite.svg"))
+    response = asyncio.run(serve_spa_assets("vite.svg", _bare_request()))
     assert response.status_code == 200
-    assert getattr(response, "path", None) == asset
+    assert response.body == asset.read_bytes()
+    assert response.media_type == "image/svg+xml"
+    assert response.headers["etag"]
 
 
 def test_spa_asset_route_returns_index_for_client_paths(
@@ -82,7 +94,7 @@ def test_spa_asset_route_returns_index_for_client_paths(
         "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
     )
 
-    response = asyncio.run(serve_spa_assets("dashboard"))
+    response = asyncio.run(serve_spa_assets("dashboard", _bare_request()))
     assert response.status_code == 200
     assert "spa" in response.body.decode()
 
@@ -99,7 +111,7 @@ def test_spa_asset_route_404_for_missing_files(
     )
 
     with pytest.raises(HTTPException) as excinfo:
-        asyncio.run(serve_spa_assets("app.js"))
+        asyncio.run(serve_spa_assets("app.js", _bare_request()))
 
     assert excinfo.value.status_code == 404
 
@@ -115,7 +127,7 @@ def test_root_proxies_dev_server(monkeypatch: pytest.MonkeyPatch) -> None:
         "aquarium_device_manager.service._proxy_dev_server", helper
     )
 
-    response = asyncio.run(serve_spa())
+    response = asyncio.run(serve_spa(_bare_request()))
     assert response is proxied
     helper.assert_awaited_once_with("/modern.html")
 
@@ -133,6 +145,227 @@ def test_spa_asset_route_proxies_dev_server(
         "aquarium_device_manager.service._proxy_dev_server", helper
     )
 
-    response = asyncio.run(serve_spa_assets("src/main.ts"))
+    response = asyncio.run(serve_spa_assets("src/main.ts", _bare_request()))
     assert response is proxied
     helper.assert_awaited_once_with("/src/main.ts")
+
+
+def test_entry_html_is_read_once_unless_dev_reload(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Entry HTML is cached; dev reload picks up a rebuilt file."""
+    index_file = tmp_path / "index.html"
+    index_file.write_text("<html>v1</html>", encoding="utf-8")
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.SPA_DIST_AVAILABLE", True
+    )
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
+    )
+    assert b"v1" in asyncio.run(serve_spa(_bare_request())).body
+
+    index_file.write_text("<html>v2</html>", encoding="utf-8")
+    os.utime(index_file, ns=(1, 1))
+    assert (
+        b"v1"
+        in asyncio.run(serve_spa_assets("dashboard", _bare_request())).body
+    )
+
+    monkeypatch.setattr("aquarium_device_manager.spa.DEV_RELOAD", True)
+    assert b"v2" in asyncio.run(serve_spa(_bare_request())).body
+
+
+def test_missing_primary_entry_is_not_restatted(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A missing modern.html is remembered instead of stat'd per request."""
+    (tmp_path / "index.html").write_text("<html>spa</html>", encoding="utf-8")
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.SPA_DIST_AVAILABLE", True
+    )
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
+    )
+    assert b"spa" in asyncio.run(serve_spa(_bare_request())).body
+
+    stats: list[Path] = []
+    original_stat = Path.stat
+
+    def _tracking_stat(self: Path, *args, **kwargs):
+        stats.append(self)
+        return original_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", _tracking_stat)
+    assert b"spa" in asyncio.run(serve_spa(_bare_request())).body
+    assert stats == []
+
+
+def test_large_assets_stream_from_disk_and_small_ones_are_evicted(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Oversized files bypass the cache; the cache stays within budget."""
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.SPA_DIST_AVAILABLE", True
+    )
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
+    )
+    monkeypatch.setattr(spa, "ASSET_CACHE_MAX_FILE_BYTES", 8)
+    monkeypatch.setattr(spa, "ASSET_CACHE_MAX_BYTES", 10)
+    monkeypatch.setattr(spa, "_ASSET_CACHE", OrderedDict())
+    monkeypatch.setattr(spa, "_asset_cache_bytes", 0)
+
+    big = tmp_path / "big.js"
+    big.write_bytes(b"x" * 9)
+    response = asyncio.run(serve_spa_assets("big.js", _bare_request()))
+    assert isinstance(response, FileResponse)
+    assert response.path == big
+
+    (tmp_path / "a.js").write_bytes(b"a" * 6)
+    (tmp_path / "b.js").write_bytes(b"b" * 6)
+    asyncio.run(serve_spa_assets("a.js", _bare_request()))
+    asyncio.run(serve_spa_assets("b.js", _bare_request()))
+    assert list(spa._ASSET_CACHE) == [tmp_path / "b.js"]
+    assert spa._asset_cache_bytes == 6
+
+
+def _request_with_etag(etag: str) -> Request:
+    """Return a bare request carrying an ``If-None-Match`` header."""
+    return Request(
+        {"type": "http", "headers": [(b"if-none-match", etag.encode())]}
+    )
+
+
+def test_matching_etags_short_circuit_to_not_modified(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Entries and assets answer a matching If-None-Match with a 304."""
+    (tmp_path / "index.html").write_text("<html>spa</html>", encoding="utf-8")
+    (tmp_path / "vite.svg").write_text("svg", encoding="utf-8")
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.SPA_DIST_AVAILABLE", True
+    )
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
+    )
+
+    entry_etag = asyncio.run(serve_spa(_bare_request())).headers["etag"]
+    assert entry_etag.startswith('W/"')
+    response = asyncio.run(serve_spa(_request_with_etag(entry_etag)))
+    assert response.status_code == 304
+    assert response.body == b""
+
+    asset_etag = asyncio.run(
+        serve_spa_assets("vite.svg", _bare_request())
+    ).headers["etag"]
+    response = asyncio.run(
+        serve_spa_assets("vite.svg", _request_with_etag(f"W/{asset_etag}"))
+    )
+    assert response.status_code == 304
+
+    response = asyncio.run(
+        serve_spa_assets("vite.svg", _request_with_etag('"stale"'))
+    )
+    assert response.status_code == 200
+
+
+def test_hashed_bundles_are_immutable_and_entries_revalidate(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Mounted assets are cached forever while the entry HTML is not."""
+    (tmp_path / "index-abc123.js").write_text("js", encoding="utf-8")
+    app = FastAPI()
+    app.mount("/assets", spa.ImmutableStaticFiles(directory=str(tmp_path)))
+    client = TestClient(app)
+
+    response = client.get("/assets/index-abc123.js")
+    assert response.headers["cache-control"] == spa.IMMUTABLE_CACHE_CONTROL
+    assert client.get("/assets/missing.js").status_code == 404
+
+    (tmp_path / "index.html").write_text("<html>spa</html>", encoding="utf-8")
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.SPA_DIST_AVAILABLE", True
+    )
+    monkeypatch.setattr(
+        "aquarium_device_manager.service.FRONTEND_DIST", tmp_path
+    )
+    response = asyncio.run(serve_spa(_bare_request()))
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_dev_proxy_reuses_one_pooled_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Proxied requests share a client that shutdown closes."""
+    base_url = httpx.URL("http://dev.invalid:5173")
+    seen: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, stream=httpx.ByteStream(b"dev"))
+
+    monkeypatch.setattr(spa, "DEV_SERVER_CANDIDATES", (base_url,))
+    monkeypatch.setattr(spa, "_dev_clients", {})
+    spa._dev_clients[str(base_url)] = client = httpx.AsyncClient(
+        base_url=str(base_url), transport=httpx.MockTransport(_handler)
+    )
+
+    async def _read(response) -> bytes:
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        await response.background()
+        return body
+
+    async def _run() -> None:
+        first = await spa._proxy_dev_server("/modern.html")
+        second = await spa._proxy_dev_server("src/main.ts")
+        assert await _read(first) == await _read(second) == b"dev"
+        assert spa._get_dev_client(base_url) is client
+        await spa.aclose_dev_clients()
+
+    asyncio.run(_run())
+    assert seen == ["/modern.html", "/src/main.ts"]
+    assert client.is_closed
+    assert spa._dev_clients == {}
+
+
+def test_cold_entry_reads_run_in_a_worker_thread(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Only the first lookup of an entry leaves the event loop."""
+    (tmp_path / "modern.html").write_text("<html>spa</html>", encoding="utf-8")
+    offloaded: list[object] = []
+    original_to_thread = asyncio.to_thread
+
+    async def _tracking_to_thread(func, *args):
+        offloaded.append(args[0])
+        return await original_to_thread(func, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", _tracking_to_thread)
+
+    async def _run() -> None:
+        entry = tmp_path / "modern.html"
+        assert (await spa.load_entry(entry)).body == b"<html>spa</html>"
+        assert (await spa.load_entry(entry)).body == b"<html>spa</html>"
+
+    asyncio.run(_run())
+    assert offloaded == [tmp_path / "modern.html"]
+
+
+@pytest.mark.parametrize(
+    ("spa_path", "reserved"),
+    [
+        ("api/devices", True),
+        ("debug", True),
+        ("ui/anything", True),
+        ("openapi.json", True),
+        ("docs", True),
+        ("docs/guide", False),
+        ("apis", False),
+        ("dashboard", False),
+    ],
+)
+def test_reserved_paths_never_reach_the_spa(
+    spa_path: str, reserved: bool
+) -> None:
+    """API and docs paths are recognised without touching the SPA."""
+    assert spa.is_reserved_path(spa_path) is reserved
@@ -28,8 +28,8 @@ def test_capture_wait_uses_env_override(
 ):
     """Verify the capture wait uses the env override instead of default.
 
-    The test captures the value passed to asyncio.sleep during the
-    doser status capture and asserts it is ≈0.01s as set by the fixture.
+    The test captures the timeout passed to the device's status capture
+    and asserts it is ≈0.01s as set by the fixture.
     """
     service_mod = patched_wait_env
 
@@ -71,15 +71,8 @@ def test_capture_wait_uses_env_override(
         lambda s: {"ok": True},
     )
 
-    # Patch asyncio.sleep to record the requested delay
     import asyncio as _asyncio
 
-    recorded = {}
-
-    async def fake_sleep(delay):  # pragma: no cover - executed inside test
-        recorded["delay"] = delay
-
-    monkeypatch.setattr(_asyncio, "sleep", fake_sleep)
     # Run capture with persist=False so we don't need full serialization
     # path reload complexity
     # type: ignore[attr-defined]
@@ -89,6 +82,7 @@ def test_capture_wait_uses_env_override(
         service._refresh_device_status(target, persist=persist_arg)
     )
     assert result is not None
-    # Confirm we used the env override value, not the default 1.5
-    delay_val = recorded.get("delay", 0)
-    assert 0.009 <= delay_val <= 0.02, recorded
+    # Confirm the capture waits up to the env override, not the default 1.5
+    mock_doser.capture_status.assert_awaited_once()
+    delay_val = mock_doser.capture_status.await_args.args[0]
+    assert 0.009 <= delay_val <= 0.02, delay_val
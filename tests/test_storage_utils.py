@@ -0,0 +1,19 @@
+"""Tests for shared storage helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from aquarium_device_manager.storage_utils import filter_device_json_files
+
+
+def test_device_files_exclude_metadata_and_non_files(tmp_path: Path) -> None:
+    """Only regular device JSON files are returned."""
+    (tmp_path / "a.json").write_text("{}")
+    (tmp_path / "a.metadata.json").write_text("{}")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "dir.json").mkdir()
+
+    assert filter_device_json_files(tmp_path) == [tmp_path / "a.json"]
+    assert filter_device_json_files(tmp_path / "missing") == []
+    assert filter_device_json_files(tmp_path / "a.json") == []
@@ -0,0 +1,49 @@
+"""Tests for system timezone detection helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from aquarium_device_manager.timezone_utils import (
+    _is_valid_iana_timezone,
+    _zone,
+    convert_time_to_display_timezone,
+    get_system_timezone,
+)
+
+
+def test_system_timezone_is_detected_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The detected zone is cached until the cache is cleared."""
+    get_system_timezone.cache_clear()
+    monkeypatch.setenv("TZ", "Australia/Sydney")
+    assert get_system_timezone() == "Australia/Sydney"
+
+    monkeypatch.setenv("TZ", "Europe/London")
+    assert get_system_timezone() == "Australia/Sydney"
+
+    get_system_timezone.cache_clear()
+    assert get_system_timezone() == "Europe/London"
+    get_system_timezone.cache_clear()
+
+
+def test_iana_validation_rejects_malformed_names() -> None:
+    """Validation accepts Area/Location names and rejects junk."""
+    assert _is_valid_iana_timezone("America/New_York")
+    assert _is_valid_iana_timezone("UTC")
+    assert not _is_valid_iana_timezone("")
+    assert not _is_valid_iana_timezone("Not A Zone")
+    assert not _is_valid_iana_timezone("Europe//London")
+    assert not _is_valid_iana_timezone("Europe/Lon don")
+
+
+def test_display_conversion_reuses_resolved_zones() -> None:
+    """Converting between fixed-offset zones shifts the clock time."""
+    _zone.cache_clear()
+    assert convert_time_to_display_timezone(8, 30, "Etc/GMT-10", "Etc/UTC") == (
+        22,
+        30,
+    )
+    convert_time_to_display_timezone(9, 0, "Etc/GMT-10", "Etc/UTC")
+    assert _zone.cache_info().hits == 2